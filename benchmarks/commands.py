@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ commands.py                [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Benchmark of the main commands of gitpy (wall time, import time,          #
+#  peak RSS, syscalls) against a local stub of GitHub.                       #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import argparse
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+## Third party libraries
+from import_time import ROOT_PATH, parse_import_time
+
+# The baselines of the benchmark, by version of GitPy
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "commands_baseline.json")
+
+# The measured commands, the main paths of 'Configuration.load_arguments()'
+COMMANDS = {
+    "--version": ["--version"],
+    "--help": ["--help"],
+    "--info": ["--info"],
+    "--check-repo": ["--check-repo"],
+    "--console": ["--console"],
+}
+# Number of runs of each command, the median is kept
+RUNS = 5
+# Seconds before a run is killed (the console waits for an input, it gets EOF)
+# The console is measured until its main menu, or until its first failed check
+RUN_TIMEOUT = 60
+# With '--check', a measure fails if it's above 'baseline * (1 + TOLERANCE)' (+ the slack of its unit)
+TOLERANCE = 0.25
+SLACK = {"wall_ms": 20, "import_us": 5000, "max_rss_kb": 2048, "syscalls": 500}
+
+# The repository watched by '--check-repo', its commit on the stub is the one in the config file
+STUB_REPO = ("octocat", "hello")
+STUB_SHA = "c" * 40
+# The metadata of GitPy on the stub, an older version so no update is proposed
+STUB_METADATA = {"name": "GitPy", "version": "0.0.0"}
+
+
+# Class section
+class Stub_GitHub(BaseHTTPRequestHandler):
+    """
+    The GitHub's API, the GitPy's metadata and the Internet check, answered locally.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def send(self, code, body, content_type="application/json"):
+        body = body.encode()
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+
+        if path == "/metadata.json":
+            return self.send(200, json.dumps(STUB_METADATA))
+
+        if path == "/":
+            return self.send(200, "ok", content_type="text/plain")
+
+        if re.match(r"^/repos/[^/]+/[^/]+/commits/[^/]+$", path):
+            # Asked with 'Accept: application/vnd.github.sha'
+            return self.send(200, STUB_SHA, content_type="text/plain")
+
+        match = re.match(r"^/repos/([^/]+)/([^/]+)$", path)
+        if match:
+            return self.send(
+                200,
+                json.dumps(
+                    {
+                        "name": match.group(2),
+                        "full_name": "%s/%s" % match.groups(),
+                        "owner": {"login": match.group(1)},
+                        "default_branch": "main",
+                    }
+                ),
+            )
+
+        self.send(404, json.dumps({"message": "Not Found"}))
+
+    def log_message(self, *args):
+        pass
+
+
+# Functions section
+def start_stub():
+    """
+    Start the stub server in a thread.
+
+    Returns:
+        tuple: (The server, its base URL).
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub_GitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, "http://127.0.0.1:%d" % server.server_port
+
+
+def make_install_path():
+    """
+    A temporary install folder, with a notification config file watching the stub repository.
+
+    Returns:
+        str: The folder, with a trailing '/'.
+    """
+    install_path = tempfile.mkdtemp(prefix="gitpy-bench-") + "/"
+    os.makedirs(install_path + "src/config/")
+
+    with open(install_path + "src/config/new_version_notification.conf", "w") as config_file:
+        config_file.write(
+            "[%s/%s]\n"
+            "github_repo_owner = %s\n"
+            "github_repo_name = %s\n"
+            "github_repo_url = https://github.com/%s/%s\n"
+            "current_commit_sha = %s\n" % (STUB_REPO * 3 + (STUB_SHA,))
+        )
+
+    return install_path
+
+
+def make_env(base_url, install_path):
+    env = dict(os.environ)
+    env.update(
+        {
+            "GITPY_GITHUB_API_URL": base_url,
+            "GITPY_GITHUB_URL": base_url,
+            "GITPY_REPO_METADATA_URL": base_url + "/metadata.json",
+            "GITPY_INTERNET_CHECK_URL": base_url + "/",
+            "GITPY_INSTALL_PATH": install_path,
+        }
+    )
+    # The REST API of the stub is used, not the GraphQL one
+    for name in ("GITPY_GITHUB_TOKEN", "GITHUB_TOKEN"):
+        env.pop(name, None)
+
+    return env
+
+
+def run(args, env, prefix=()):
+    """
+    Run 'gitpy.py' once, with 'python -X importtime'.
+
+    Arguments:
+        args (list): The arguments of gitpy.
+        env (dict): The environment variables.
+        prefix (tuple): A command the run is wrapped in (e.g. strace).
+
+    Returns:
+        dict: 'wall_ms', 'import_us' and 'max_rss_kb' of the run.
+    """
+    command = list(prefix) + [sys.executable, "-X", "importtime", os.path.join(ROOT_PATH, "gitpy.py")] + args
+
+    with tempfile.TemporaryFile() as stderr:
+        start_time = time.perf_counter()
+        process = subprocess.Popen(
+            command, cwd=ROOT_PATH, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=stderr
+        )
+
+        # 'wait4' gives the resources used by the process
+        deadline = start_time + RUN_TIMEOUT
+        while True:
+            pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+            if pid:
+                break
+            if time.perf_counter() > deadline:
+                process.kill()
+                pid, status, usage = os.wait4(process.pid, 0)
+                break
+            time.sleep(0.001)
+
+        wall_ms = (time.perf_counter() - start_time) * 1000
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        stderr.seek(0)
+        import_us, _ = parse_import_time(stderr.read().decode(errors="replace"))
+
+    return {"wall_ms": round(wall_ms, 1), "import_us": import_us, "max_rss_kb": usage.ru_maxrss}
+
+
+def count_syscalls(args, env):
+    """
+    Count the syscalls of a run with 'strace -c'.
+
+    Returns:
+        int: The number of syscalls, None if strace is not installed.
+    """
+    if shutil.which("strace") is None:
+        return None
+
+    with tempfile.NamedTemporaryFile(suffix=".strace") as output:
+        run(args, env, prefix=("strace", "-f", "-c", "-o", output.name))
+        summary = output.read().decode(errors="replace")
+
+    return parse_strace_summary(summary)
+
+
+def parse_strace_summary(summary):
+    """
+    Parse the summary of 'strace -c'.
+
+    Returns:
+        int: The total number of syscalls, None if the summary has no total.
+    """
+    calls_end = None
+
+    for line in summary.splitlines():
+        # The columns are aligned on the right of their title
+        if line.startswith("% time") and "calls" in line:
+            calls_end = line.index("calls") + len("calls")
+
+        elif line.rstrip().endswith(" total") and calls_end is not None:
+            calls = line[:calls_end].split()
+            return int(calls[-1]) if calls and calls[-1].isdigit() else None
+
+    return None
+
+
+def measure(args, env, runs=RUNS):
+    """
+    Measure a command.
+
+    Returns:
+        dict: The median 'wall_ms', 'import_us' and 'max_rss_kb' of the runs, and the 'syscalls' of one run.
+    """
+    # The first run is not kept, it warms up the bytecode and the file system cache
+    run(args, env)
+    results = [run(args, env) for _ in range(runs)]
+
+    measures = {key: statistics.median(result[key] for result in results) for key in results[0]}
+    measures["syscalls"] = count_syscalls(args, env)
+    return measures
+
+
+def gitpy_version():
+    sys.path.insert(0, ROOT_PATH)
+    from src.config import Configuration
+
+    return Configuration.VERSION
+
+
+def load_baselines():
+    if not os.path.isfile(BASELINE_PATH):
+        return {}
+
+    with open(BASELINE_PATH) as baseline_file:
+        return json.load(baseline_file)
+
+
+def compare(value, baseline_value, key):
+    """
+    Returns:
+        tuple: (The difference with the baseline as text, True if it's a regression).
+    """
+    if value is None or baseline_value is None:
+        return "", False
+
+    delta = (value - baseline_value) / baseline_value * 100 if baseline_value else 0
+    regression = value > baseline_value * (1 + TOLERANCE) + SLACK[key]
+    return "%+.0f%%%s" % (delta, "!" if regression else ""), regression
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the main commands of gitpy.")
+    parser.add_argument("--runs", type=int, default=RUNS, help="number of runs of each command (default: %s)" % RUNS)
+    parser.add_argument("--command", action="append", choices=list(COMMANDS), help="measure only this command")
+    parser.add_argument("--against", help="the version of GitPy to compare with (default: the last saved one)")
+    parser.add_argument("--save", action="store_true", help="save the measures as the baseline of this version")
+    parser.add_argument("--check", action="store_true", help="exit with 1 if a measure regressed")
+    options = parser.parse_args()
+
+    # The bytecode is compiled once, like after the installation
+    subprocess.run([sys.executable, "-m", "compileall", "-q", ROOT_PATH], stdout=subprocess.DEVNULL)
+
+    version = gitpy_version()
+    baselines = load_baselines()
+    against = options.against or next(reversed([name for name in baselines if name != version] or [version]), None)
+    baseline = baselines.get(against, {})
+
+    server, base_url = start_stub()
+    install_path = make_install_path()
+    env = make_env(base_url, install_path)
+
+    print("GitPy %s, compared with %s" % (version, against if baseline else "nothing"))
+    print("%-14s %12s %12s %12s %12s" % ("command", "wall (ms)", "import (µs)", "RSS (KiB)", "syscalls"))
+
+    results = {}
+    regressed = False
+    try:
+        for name in options.command or COMMANDS:
+            measures = measure(COMMANDS[name], env, runs=options.runs)
+            results[name] = measures
+
+            columns = []
+            for key in ("wall_ms", "import_us", "max_rss_kb", "syscalls"):
+                delta, regression = compare(measures[key], baseline.get(name, {}).get(key), key)
+                regressed = regressed or regression
+                value = "n/a" if measures[key] is None else "%g" % measures[key]
+                columns.append(("%s %s" % (value, delta)).strip())
+
+            print("%-14s %12s %12s %12s %12s" % tuple([name] + columns))
+
+    finally:
+        server.shutdown()
+        shutil.rmtree(install_path, ignore_errors=True)
+
+    if options.save:
+        baselines.setdefault(version, {}).update(results)
+        with open(BASELINE_PATH, "w") as baseline_file:
+            json.dump(baselines, baseline_file, indent=4)
+            baseline_file.write("\n")
+        print("Baseline of GitPy %s saved in %s" % (version, BASELINE_PATH))
+
+    return 1 if options.check and regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
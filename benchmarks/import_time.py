@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ import_time.py             [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Benchmark of the import time of the gitpy command, fails when             #
+#  it's slower than the baseline or imports a deferred module.               #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# The root of GitPy
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The baselines of the benchmark
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_time_baseline.json")
+
+# The measured commands, and the modules they must not import (see 'src.util.lazy_import')
+COMMANDS = {
+    "--version": {
+        "args": ["--version"],
+        "deferred": [
+            "src.tools.requests",
+            "src.tools.urllib3",
+            "src.util.github_repo",
+            "src.util.help_messages",
+            "rich",
+            "crontab",
+        ],
+    },
+    "--help": {
+        "args": ["--help"],
+        "deferred": ["rich", "crontab"],
+    },
+}
+# Number of runs of each command, the median is kept
+RUNS = 7
+# A command fails if its import time is above 'baseline * (1 + TOLERANCE) + SLACK_US'
+TOLERANCE = 0.25
+SLACK_US = 5000
+
+
+# Functions section
+def parse_import_time(stderr):
+    """
+    Parse the output of 'python -X importtime'.
+
+    Arguments:
+        stderr (str): The output.
+
+    Returns:
+        tuple: (The cumulative import time of GitPy in µs, the set of the imported modules).
+    """
+    top_level = []
+    modules = set()
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        if not name.startswith("  "):
+            top_level.append((name.strip(), int(cumulative)))
+
+    # The modules imported by the interpreter at startup end with 'site'
+    names = [name for name, _ in top_level]
+    start = len(names) - names[::-1].index("site") if "site" in names else 0
+
+    return sum(cumulative for _, cumulative in top_level[start:]), modules
+
+
+def measure(args, runs=RUNS):
+    """
+    Run 'gitpy.py' with 'python -X importtime'.
+
+    Arguments:
+        args (list): The arguments of gitpy.
+        runs (int): The number of runs.
+
+    Returns:
+        tuple: (The median import time in µs, the set of the imported modules).
+    """
+    times = []
+    modules = set()
+
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", os.path.join(ROOT_PATH, "gitpy.py")] + args,
+            cwd=ROOT_PATH,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        import_time, modules = parse_import_time(process.stderr)
+        times.append(import_time)
+
+    return statistics.median(times), modules
+
+
+def load_baseline():
+    if not os.path.isfile(BASELINE_PATH):
+        return {}
+
+    with open(BASELINE_PATH) as baseline_file:
+        return json.load(baseline_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark of the import time of the gitpy command.")
+    parser.add_argument("--update-baseline", action="store_true", help="save the measures as the new baseline")
+    parser.add_argument("--runs", type=int, default=RUNS, help="number of runs of each command (default: %s)" % RUNS)
+    options = parser.parse_args()
+
+    # The bytecode is compiled once, like after the installation
+    subprocess.run([sys.executable, "-m", "compileall", "-q", ROOT_PATH], stdout=subprocess.DEVNULL)
+
+    baseline = load_baseline()
+    results = {}
+    failed = False
+
+    for name, command in COMMANDS.items():
+        import_time, modules = measure(command["args"], runs=options.runs)
+        results[name] = {"import_us": import_time}
+        status = "ok"
+
+        imported = [module for module in command["deferred"] if module in modules]
+        if imported:
+            status = "FAIL (imports %s)" % ", ".join(imported)
+            failed = True
+
+        elif name in baseline and not options.update_baseline:
+            limit = baseline[name]["import_us"] * (1 + TOLERANCE) + SLACK_US
+            if import_time > limit:
+                status = "FAIL (baseline: %d µs, limit: %d µs)" % (baseline[name]["import_us"], limit)
+                failed = True
+
+        print("gitpy %-12s %8d µs  %s" % (name, import_time, status))
+
+    if options.update_baseline:
+        with open(BASELINE_PATH, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=4)
+            baseline_file.write("\n")
+        print("Baseline saved in %s" % BASELINE_PATH)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -130,11 +130,78 @@ class Arguments(argparse.ArgumentParser):
         # argcomplete.autocomplete(parser)
         return gitpy.parse_args()
 
+    @staticmethod
+    def positive_int(value):
+        """
+        The type of the arguments that are a number greater than or equal to 1.
+        """
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError("invalid int value: '%s'" % value)
+
+        if number < 1:
+            raise argparse.ArgumentTypeError("%s is not greater than or equal to 1" % value)
+
+        return number
+
     # -------------------- [ Main Arguments ] -------------------- #
     @classmethod
     def _add_main_args(cls, main):
         main.add_argument("--console", action="store_true", dest="console", help="start tthe main console of GitPy")
         main.add_argument("--cli", action="store_true", dest="cli", help="start the CLI environment of GitPy")
+        main.add_argument(
+            "--per-page",
+            type=int,
+            metavar="NUMBER",
+            dest="per_page",
+            help=Color.s(
+                "the number of search results per page in the console, 1-100 (default: {G}%s{W})"
+                % Configuration.SEARCH_PER_PAGE
+            ),
+        )
+        main.add_argument(
+            "--snapshot",
+            action="store_true",
+            dest="snapshot",
+            help="download a snapshot of the branch (only the files, without the history of git) by default",
+        )
+        main.add_argument(
+            "--no-mirror-cache",
+            action="store_true",
+            dest="no_mirror_cache",
+            help="do not keep a local mirror of the downloaded repositories to speed up their next downloads",
+        )
+        main.add_argument(
+            "--depth",
+            type=int,
+            metavar="NUMBER",
+            dest="depth",
+            help="download only the last NUMBER commits of the history of the repository (shallow clone)",
+        )
+        main.add_argument(
+            "--single-branch",
+            action="store_true",
+            dest="single_branch",
+            help="download only the history of the selected branch",
+        )
+        main.add_argument(
+            "--filter",
+            type=str,
+            metavar="SPEC",
+            dest="filter",
+            help=Color.s(
+                "download a partial clone, the files are downloaded when they are needed (e.g. {G}blob:none{W})"
+            ),
+        )
+        main.add_argument(
+            "--sparse",
+            type=str,
+            nargs="+",
+            metavar="PATH",
+            dest="sparse",
+            help="check out only these paths of the repository (sparse checkout)",
+        )
 
     # -------------------- [ Installation Arguments ] -------------------- #
     @classmethod
@@ -185,6 +252,29 @@ class Arguments(argparse.ArgumentParser):
             ),
         )
 
+        repo.add_argument(
+            "-bd",
+            "--bulk-download",
+            type=str,
+            metavar="FILE",
+            dest="bulk_download",
+            help=Color.s(
+                "download all the repositories of a manifest ({C}-{W} for the standard input), one 'owner/repo[@branch] [-> path]' per line"
+            ),
+        )
+
+        repo.add_argument(
+            "-w",
+            "--workers",
+            type=cls.positive_int,
+            metavar="NUMBER",
+            dest="workers",
+            help=Color.s(
+                "the maximum number of repositories checked or downloaded at the same time by the --check-repo and --bulk-download options (default: {G}%s{W} and {G}%s{W})"
+                % (Configuration.CHECK_REPO_WORKERS, Configuration.BULK_DOWNLOAD_WORKERS)
+            ),
+        )
+
         repo.add_argument(
             "-us",
             "--unsub",
@@ -267,6 +357,13 @@ class Arguments(argparse.ArgumentParser):
             dest="remove_cache",
             help="delete any '__pycache__' folder in the GitPy' directory",
         )
+        misc.add_argument(
+            "--log-file",
+            action="store",
+            dest="log_file",
+            metavar="FILE",
+            help="also write the messages in FILE (or a named pipe), one JSON record by line without colors",
+        )
 
     # -------------------- [ Tests Arguments ] -------------------- #
     # @classmethod
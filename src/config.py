@@ -39,14 +39,16 @@ import re
 import subprocess
 import sys
 from copy import deepcopy
-from time import sleep
 
 from src.util.colors import Color
 from src.util.exit_tool import exit_tool
 
 ## Third party libraries
-from src.util.github_repo import GitHub_Repo
-from src.util.help_messages import Help_Messages as HM
+from src.util.lazy_import import Lazy_Import
+
+# Imported by the options that use them only ('github_repo' imports the vendored 'requests')
+GitHub_Repo = Lazy_Import("src.util.github_repo", "GitHub_Repo")
+HM = Lazy_Import("src.util.help_messages", "Help_Messages")
 
 
 # Main
@@ -90,6 +92,8 @@ class Configuration:
 
     # The logs file
     # LOG_FILE_PATH = DEFAULT_INSTALL_PATH + r'logs'
+    ## The structured log of the messages, set by the '--log-file' option
+    LOG_FILE = None
 
     # The bin directory of GitPy
     BIN_PATH = r"/usr/bin/"
@@ -110,13 +114,119 @@ class Configuration:
     REPO_CLONE_URL = "https://github.com/dedroot/GitPy.git"
     REPO_BRANCH = "master"
     REPO_MASTER_BRANCH = "master"
-    REPO_METADATA_URL = "https://raw.githubusercontent.com/dedroot/GitPy/master/metadata.json"
+    REPO_METADATA_URL = os.environ.get(
+        "GITPY_REPO_METADATA_URL", "https://raw.githubusercontent.com/dedroot/GitPy/master/metadata.json"
+    )
     REPO_CHANGELOG_URL = "https://github.com/dedroot/GitPy/blob/master/src/docs/CHANGELOG.md"
     REPO_ISSUES_URL = "https://github.com/dedroot/GitPy/issues"
     ## The GitPy's version from the Github's repo. Will be attributed by the 'compare_version'
     ## function from the 'github_repo.py' file
     REPO_VERSION = None
 
+    # The maximum number of repositories checked at the same time by the '--check-repo' option
+    CHECK_REPO_WORKERS = 8
+
+    # The '--bulk-download' option: repositories downloaded at the same time and new attempts after a failure
+    BULK_DOWNLOAD_WORKERS = 4
+    BULK_DOWNLOAD_RETRIES = 2
+
+    # The GitHub's API (can be redirected to another server, e.g. a local stub server for the tests)
+    GITHUB_API_URL = os.environ.get("GITPY_GITHUB_API_URL", "https://api.github.com").rstrip("/")
+    GITHUB_URL = os.environ.get("GITPY_GITHUB_URL", "https://github.com").rstrip("/")
+    GITHUB_GRAPHQL_URL = os.environ.get("GITPY_GITHUB_GRAPHQL_URL", GITHUB_API_URL + "/graphql")
+    ## The URL opened to check the Internet connexion
+    INTERNET_CHECK_URL = os.environ.get("GITPY_INTERNET_CHECK_URL", "https://google.com")
+    ## The environment variables that can contain a GitHub token, the GraphQL API can only be used with a token
+    github_token_env_var_names = ["GITPY_GITHUB_TOKEN", "GITHUB_TOKEN"]
+    ## The number of repositories checked in one GraphQL query by the '--check-repo' option
+    GRAPHQL_BATCH_SIZE = 100
+
+    # The search of the main console: results per page (1-100) and pages kept in memory
+    SEARCH_PER_PAGE = 30
+    SEARCH_CACHED_PAGES = 10
+    ## The local cache of the searches: pages fresh for 1 hour, dropped after 7 days or beyond 500 pages
+    SEARCH_CACHE_TTL = 3600
+    SEARCH_CACHE_MAX_AGE = 7 * 86400
+    SEARCH_CACHE_MAX_ENTRIES = 500
+
+    # The branches of a repository: branches per page (1-100), pages fetched at the same time and
+    # number of branches listed in the menu of the main console before asking for a filter
+    BRANCHES_PER_PAGE = 100
+    BRANCHES_WORKERS = 4
+    BRANCHES_MENU_SIZE = 30
+
+    # The default clone options of the main console ('--depth', '--single-branch', '--filter' and '--sparse')
+    CLONE_DEPTH = None
+    CLONE_SINGLE_BRANCH = False
+    CLONE_FILTER = None
+    CLONE_SPARSE_PATHS = []
+
+    # The snapshot downloads ('--snapshot' to choose them by default): bytes read at a time and seconds between two updates of the progress
+    DOWNLOAD_SNAPSHOT = False
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    PROGRESS_INTERVAL = 0.1
+
+    # The mirrors of the downloaded repositories ('--no-mirror-cache' to disable them): folder in the
+    # cache folder, maximum size in bytes and seconds a mirror is kept without being used
+    MIRROR_CACHE = True
+    MIRROR_CACHE_DIR_NAME = "mirrors/"
+    MIRROR_CACHE_MAX_SIZE = 5 * 1024**3
+    MIRROR_CACHE_MAX_AGE = 30 * 86400
+
+    # The steps of the installer and the updater (see 'Pipeline'): seconds a readiness check is retried
+    # before failing, and seconds between two checks
+    STEP_READY_TIMEOUT = 10
+    STEP_READY_INTERVAL = 0.05
+
+    # The staged installation: the new version is cloned in '<install path><staging suffix>', then
+    # takes the place of the install folder, the current one is kept in '<install path><previous suffix>'
+    # until the end of the installation
+    STAGED_INSTALL_STAGING_SUFFIX = ".staging"
+    STAGED_INSTALL_PREVIOUS_SUFFIX = ".previous"
+    # The files of the current install folder moved into the new version (the caches and the
+    # notification settings of the user), relative to the install folder
+    STAGED_INSTALL_KEPT_PATHS = ["cache", "src/config/new_version_notification.conf"]
+    # The rights of the installed files of GitPy and of the 'gitpy' command
+    INSTALL_FILES_MODE = 0o777
+
+    # The number of processes compiling the python files of GitPy at the installation (0: one per CPU)
+    PRECOMPILE_WORKERS = 0
+
+    # The lines of output kept for each output of a command read while it runs, and the width of the progress bars
+    PROCESS_TAIL_LINES = 200
+    PROGRESS_BAR_WIDTH = 30
+
+    # The buffered output of the verbose modes: minimum seconds between two flushes of a burst of
+    # lines, and number of characters that makes the buffer flush at once
+    OUTPUT_FLUSH_INTERVAL = 0.05
+    OUTPUT_BUFFER_SIZE = 8192
+
+    # The cache folder of GitPy (in the install path)
+    CACHE_DIR_NAME = "cache/"
+
+    @classmethod
+    def get_github_token(cls):
+        """
+        Returns the GitHub token from the environment variables, or None if no token is set.
+        """
+        for env_var_name in cls.github_token_env_var_names:
+            token = os.environ.get(env_var_name)
+            if token:
+                return token
+
+        return None
+
+    @classmethod
+    def get_cache_path(cls):
+        """
+        Returns the path of the GitPy's cache folder, in the install path of GitPy.
+        """
+        install_path = os.environ.get(cls.gitpy_install_path_env_var_name, cls.DEFAULT_INSTALL_PATH)
+        if not install_path.endswith("/"):
+            install_path += "/"
+
+        return install_path + cls.CACHE_DIR_NAME
+
     @classmethod
     def load_arguments(cls, pwd):
         from src.__main__ import GitPy
@@ -154,6 +264,24 @@ class Configuration:
         if args.verbose == 3:
             cls.verbose = 3
 
+        # The hundreds of lines of the verbose modes are written in batches
+        if cls.verbose >= 1:
+            from src.util.output import Output_Buffer
+
+            Output_Buffer.install()
+
+        # The messages are also written in a structured log file
+        if args.log_file:
+            from src.util.output import Output_Log
+
+            try:
+                Color.log = Output_Log(args.log_file)
+            except OSError as e:
+                Color.pl("  {!} Cannot open the log file {C}%s{W}: %s" % (args.log_file, e))
+                exit_tool(1, pwd=cls.pwd)
+
+            cls.LOG_FILE = args.log_file
+
         # Parse the arguments
         cls.parse_informations_args(args)
         cls.first_args_to_parse(args)
@@ -189,9 +317,28 @@ class Configuration:
             args (object): The arguments object
             pwd (str): The current working directory
         """
+        if args.per_page is not None:
+            if args.per_page < 1 or args.per_page > 100:
+                Color.pl("  {!} The number of results per page must be between 1 and 100.")
+                exit_tool(1, pwd=cls.pwd)
+
+            cls.SEARCH_PER_PAGE = args.per_page
+
+        if args.depth is not None:
+            if args.depth < 1:
+                Color.pl("  {!} The depth of the history must be at least 1 commit.")
+                exit_tool(1, pwd=cls.pwd)
+
+            cls.CLONE_DEPTH = args.depth
+
+        cls.DOWNLOAD_SNAPSHOT = args.snapshot
+        cls.MIRROR_CACHE = not args.no_mirror_cache
+        cls.CLONE_SINGLE_BRANCH = args.single_branch
+        cls.CLONE_FILTER = args.filter
+        cls.CLONE_SPARSE_PATHS = args.sparse or []
+
         if args.console:
             Color.pl("  {-} Starting the GitPy's console...")
-            sleep(1)
             # Call the main console of GitPy
             from src.core.console import Main_Console
 
@@ -237,7 +384,21 @@ class Configuration:
         if args.check_repo:
             from src.core.send_email import send_email
 
-            send_email()
+            send_email(workers=args.workers)
+
+        if args.bulk_download:
+            from src.core.bulk_download import bulk_download, read_manifest
+
+            try:
+                jobs = read_manifest(args.bulk_download)
+            except (OSError, ValueError) as e:
+                Color.pl("  {!} Cannot read the manifest {C}%s{W}: %s" % (args.bulk_download, e))
+                exit_tool(1, pwd=cls.pwd)
+
+            jobs = bulk_download(jobs, workers=args.workers)
+
+            if any(job.error is not None for job in jobs):
+                exit_tool(1, pwd=cls.pwd)
 
         if args.unsub:
             config = configparser.ConfigParser()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ bulk_download.py           [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Download a list of repositories (a manifest) at the same time,            #
+#  without the questions of the main console.                                #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+## Third party libraries
+from src.config import Configuration
+from src.core.downloader import Clone_Options, Downloader
+from src.util.colors import Color
+from src.util.http_client import HTTP_Client
+from src.util.mirror_cache import Mirror_Cache
+
+# 'owner/repo[.git][@branch] [-> path]', the lines starting with '#' are comments
+MANIFEST_LINE = re.compile(r"^(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+?)(?:\.git)?(?:@(?P<branch>\S+))?(?:\s*->\s*(?P<path>.+))?$")
+
+
+class Bulk_Job:
+    """
+    A repository of the manifest and the result of its download.
+    """
+
+    def __init__(self, number, owner, repo, branch, path):
+        self.number = number
+        self.owner = owner
+        self.repo = repo
+        self.branch = branch
+        self.path = path
+        self.url = "%s/%s/%s.git" % (Configuration.GITHUB_URL, owner, repo)
+
+        self.attempts = 0
+        self.action = None
+        self.error = None
+        self.duration = 0.0
+
+    @property
+    def skipped(self):
+        """
+        True if the existing checkout has not been updated because of its local changes.
+        """
+        return self.action == "skipped (local changes)"
+
+    def __str__(self):
+        return "%s/%s%s" % (self.owner, self.repo, "@" + self.branch if self.branch else "")
+
+
+# Functions section
+def parse_manifest(lines):
+    """
+    Read the repositories of a manifest.
+
+    Arguments:
+        lines (iterable): The lines of the manifest, one 'owner/repo[@branch] [-> path]' per line.
+                          Without a path, the repository is downloaded in './repo'.
+
+    Returns:
+        list: The Bulk_Job of each repository.
+
+    Raises:
+        ValueError: If a line is not valid.
+    """
+    jobs = []
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        match = MANIFEST_LINE.match(line)
+        if match is None:
+            raise ValueError("line %s: '%s' is not 'owner/repo[@branch] [-> path]'" % (line_number, line))
+
+        path = os.path.abspath(os.path.expanduser((match.group("path") or match.group("repo")).strip()))
+        jobs.append(Bulk_Job(len(jobs) + 1, match.group("owner"), match.group("repo"), match.group("branch"), path))
+
+    return jobs
+
+
+def download_job(job, total, options, mirror_cache):
+    """
+    Download a repository of the manifest, with new attempts if it fails.
+
+    An existing checkout of the repository is updated (or skipped if it has local changes),
+    a new folder is cloned, and any other existing folder is left as it is.
+    """
+    start_time = time.monotonic()
+    prefix = "  {D}[{W}{SB2}%s{W}/{SB2}%s{W}{D}]{W} {G}%s{W}" % (job.number, total, job)
+
+    while job.attempts <= Configuration.BULK_DOWNLOAD_RETRIES:
+        job.attempts += 1
+        job.error = None
+
+        try:
+            if job.branch is None:
+                # The default branch of the repository
+                response = HTTP_Client.get("%s/repos/%s/%s" % (Configuration.GITHUB_API_URL, job.owner, job.repo))
+                if response.status_code != 200:
+                    raise Exception("request failed with status code %s" % response.status_code)
+
+                job.branch = json.loads(response.text)["default_branch"]
+
+            if Downloader.is_checkout_of(job.path, job.url) and Downloader.local_changes(job.path):
+                # Not a failure, the update would remove the local changes
+                job.action = "skipped (local changes)"
+
+            elif Downloader.is_checkout_of(job.path, job.url):
+                job.action = "updated"
+                Color.pl("%s: updating {C}%s{W}..." % (prefix, job.path))
+
+                if not Downloader.update(job.url, job.branch, job.path, options=options):
+                    raise Exception("git cannot update the checkout")
+
+            elif os.path.exists(job.path) and (not os.path.isdir(job.path) or os.listdir(job.path)):
+                # Not a new attempt, the folder is not ours
+                job.error = "the folder %s already exists and is not a checkout of the repository" % job.path
+                break
+
+            else:
+                job.action = "cloned"
+                Color.pl("%s: cloning in {C}%s{W}..." % (prefix, job.path))
+
+                stdout, stderr = Downloader.clone(
+                    job.url, job.branch, job.path, options=options, mirror_cache=mirror_cache
+                )
+                if not Downloader.is_checkout_of(job.path, job.url):
+                    # A failed clone can leave an incomplete folder
+                    shutil.rmtree(job.path, ignore_errors=True)
+                    errors = [line for line in stderr.splitlines() if line.startswith("fatal:")]
+                    raise Exception(errors[0][len("fatal:") :].strip() if errors else "git clone failed")
+
+            break
+
+        except Exception as e:
+            job.error = str(e)
+
+            if job.attempts <= Configuration.BULK_DOWNLOAD_RETRIES:
+                Color.pl("%s: {R}failed{W} (%s), new attempt..." % (prefix, job.error))
+                time.sleep(job.attempts)
+
+    job.duration = time.monotonic() - start_time
+
+    if job.skipped:
+        Color.pl("%s: {O}skipped{W}, {C}%s{W} has local changes." % (prefix, job.path))
+    elif job.error is None:
+        Color.pl("%s: {G}%s{W} in %.1fs." % (prefix, job.action, job.duration))
+    else:
+        Color.pl("%s: {R}failed{W} (%s)." % (prefix, job.error))
+
+    return job
+
+
+def read_manifest(manifest):
+    """
+    Read the repositories of a manifest file.
+
+    Arguments:
+        manifest (str): The path of the manifest file, '-' to read it from the standard input.
+
+    Returns:
+        list: The Bulk_Job of each repository.
+
+    Raises:
+        ValueError: If a line of the manifest is not valid.
+        OSError: If the manifest cannot be read.
+    """
+    if manifest == "-":
+        return parse_manifest(sys.stdin)
+
+    with open(manifest, "r") as manifest_file:
+        return parse_manifest(manifest_file)
+
+
+def bulk_download(jobs, workers=None):
+    """
+    Download all the repositories of a manifest, several at the same time.
+
+    Arguments:
+        jobs (list): The Bulk_Job of each repository, as returned by 'read_manifest()'.
+        workers (int): The maximum number of repositories downloaded at the same time
+                       (default: Configuration.BULK_DOWNLOAD_WORKERS)
+
+    Returns:
+        list: The Bulk_Job of each repository, with its result.
+    """
+    total = len(jobs)
+    workers = workers or Configuration.BULK_DOWNLOAD_WORKERS
+    options = Clone_Options.from_configuration()
+    mirror_cache = Mirror_Cache() if Configuration.MIRROR_CACHE else None
+
+    Color.pl("  {*} Downloading {G}%s{W} repositories, {G}%s{W} at the same time (%s)." % (total, workers, options))
+    start_time = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        jobs = list(executor.map(lambda job: download_job(job, total, options, mirror_cache), jobs))
+
+    # Summary
+    failed = [job for job in jobs if job.error is not None]
+    skipped = [job for job in jobs if job.skipped]
+
+    Color.pl("")
+    Color.pl("  {*} Summary:")
+    for job in jobs:
+        if job.skipped:
+            Color.pl("  {$} {G}%s{W} %s in {C}%s{W}" % (job, job.action, job.path))
+        elif job.error is None:
+            Color.pl("  {+} {G}%s{W} %s in {C}%s{W} (%.1fs)" % (job, job.action, job.path, job.duration))
+        else:
+            Color.pl("  {!} {G}%s{W} failed after %s attempt(s): %s" % (job, job.attempts, job.error))
+
+    Color.pl(
+        "  {*} %s downloaded, %s skipped, %s failed in %.1fs."
+        % (total - len(failed) - len(skipped), len(skipped), len(failed), time.monotonic() - start_time)
+    )
+
+    return jobs
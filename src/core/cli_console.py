@@ -44,10 +44,6 @@ from time import sleep, strftime
 from tracemalloc import start
 
 import gnureadline as global_readline  # pip install gnureadline
-import rich
-from rich import box
-from rich.console import Console
-from rich.table import Table
 
 import src.config as config
 from src.__main__ import GitPy
@@ -55,9 +51,15 @@ from src.config import Main_prompt
 from src.util.clear import clear
 from src.util.colors import Color
 from src.util.help_messages import Help_Messages as HM
+from src.util.lazy_import import Lazy_Import
 from src.util.tab_completer import Completer
 
 ## Third party libraries
+# 'rich' is imported when a table is shown only
+rich = Lazy_Import("rich")
+box = Lazy_Import("rich.box")
+Console = Lazy_Import("rich.console", "Console")
+Table = Lazy_Import("rich.table", "Table")
 
 
 class Help_message:
@@ -36,23 +36,30 @@ import json
 # Import section
 import os
 import platform
-from time import sleep
-
-import src.tools.requests as requests
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 ## Third party libraries
 from src.__main__ import GitPy
 from src.config import Configuration
+from src.core.downloader import Clone_Options, Downloader
 from src.tools.colored.colored import attr, fg
 from src.util.add_cron_job import add_cron_job
 from src.util.based_distro import Based_Distro
+from src.util.branch_index import Branch_Index
 from src.util.check_path import check_folder_path
 from src.util.clear import clear
 from src.util.colors import Color
 from src.util.email_utils import Email_Utils as EU
 from src.util.exit_tool import exit_tool
+from src.util.github_api import GitHub_API
+from src.util.http_cache import HTTP_Cache
+from src.util.http_client import HTTP_Client
 from src.util.internet_check import internet_check
+from src.util.mirror_cache import Mirror_Cache
 from src.util.process import Process
+from src.util.search_cache import Search_Cache
+from src.util.search_cursor import Search_Cursor
 
 # from src.tools.box import box
 # from src.tools.box.table import Table
@@ -75,6 +82,7 @@ class Main_Console:
 
     # Parameters
     remove_existing_folder = False
+    update_existing_folder = False
     promptname = "GitPy"
     show_main_menu = True
     SPACE = "#>SPACE$<#"
@@ -90,69 +98,263 @@ class Main_Console:
         "help",
     ]
 
-    def get_github_repo_info(self, repo_name, username=None):
-        # Recherche des dépôts ayant un nom similaire
-        search_url = "https://api.github.com/search/repositories?q=%s" % repo_name
-        if username:
-            search_url += f"+user:{username}"
+    def choose_download_mode(self):
+        """
+        Ask the user to download the repository with git or as a snapshot.
 
-        if Configuration.verbose >= 3:
-            Color.pl("  {§}  Searching for similar repositories with the GitHub API...")
-            Color.pl("   {SY1}╰──╼{W} URL: {C}%s{W}" % search_url)
+        Returns:
+            bool: True for a snapshot, False for a clone.
+        """
+        default = "2" if Configuration.DOWNLOAD_SNAPSHOT else "1"
 
-        response = requests.get(search_url)
+        Color.pl("  {*} Select how you want to download the repository (default: {G}%s{W})." % default)
+        Color.pl("  {D}[{W}{SB2}1{W}{D}]{W} Clone with git (with the history)")
+        Color.pl("  {D}[{W}{SB2}2{W}{D}]{W} Snapshot (only the files of the branch, faster)")
 
-        search_results = json.loads(response.text)
+        while True:
+            choice = input(self.prompt(menu="choose_download_mode")).strip() or default
+            if choice in ("1", "2"):
+                return choice == "2"
 
-        # if Configuration.verbose >= 3:
-        #     Color.pl('  {§}  Response: {C}%s{W}' % search_results)
-
-        # Affichage des dépôts similaires trouvés
-        items = search_results["items"]
-        if len(items) == 0:
-            if Configuration.verbose >= 3:
-                Color.pl('  {§} No items found in the "items" key of the search results.')
-            Color.pl("  {!} No repositories found with the name '%s'." % repo_name)
-            return
+            Color.pl("  {!} Invalid choice. Please enter 1 or 2.")
 
-        # while True:
-        # clear()
-        # Affichage des dépôts trouvés
-        Color.pl("  {*} Here are the similar repositories found for '%s':" % repo_name)
-        for index, repo in enumerate(search_results["items"]):
-            Color.pl("  {D}[{W}{SB2}%s{W}{D}]{W} %s" % (index + 1, repo["full_name"]))
+    def choose_clone_options(self, clone_options):
+        """
+        Ask the user if the clone options have to be changed.
 
-        # Demande de l'utilisateur pour choisir un dépôt
-        Color.pl("  {*} Select the repository that you want to clone.")
-        Color.pl("  {*} Enter {G}back{W} to come back to the main menu.")
+        Arguments:
+            clone_options (Clone_Options): The current clone options.
 
+        Returns:
+            Clone_Options: The clone options chosen by the user.
+        """
+        Color.pl("  {*} Clone options: {C}%s{W}." % clone_options)
+        change_choice = input(Color.s("  {?} Do you want to change the clone options? [y/N]: "))
+
+        if change_choice.lower() != "y":
+            return clone_options
+
+        Color.pl("  {*} Enter the number of commits of the history to download (empty for the full history).")
         while True:
-            try:
-                selected_index = input(self.prompt(menu="choose_repo"))
-                if selected_index == "back":
-                    self.show_main_menu = True
-                    break
+            depth = input(self.prompt(menu="choose_clone_depth")).strip()
+            if not depth or (depth.isdigit() and int(depth) >= 1):
+                break
+            Color.pl("  {!} Invalid choice. Please enter a number greater than 0.")
+
+        single_branch = input(Color.s("  {?} Do you want to download only the selected branch? [y/N]: "))
+
+        Color.pl("  {*} Enter the filter of a partial clone (e.g. {G}blob:none{W}, empty for no filter).")
+        clone_filter = input(self.prompt(menu="choose_clone_filter")).strip()
+
+        Color.pl("  {*} Enter the paths to check out, separated by spaces (empty for all the files).")
+        sparse_paths = input(self.prompt(menu="choose_sparse_paths")).split()
+
+        return Clone_Options(
+            depth=depth or None,
+            single_branch=single_branch.lower() == "y",
+            filter=clone_filter or None,
+            sparse_paths=sparse_paths,
+        )
+
+    def choose_branch(self, repo_name, branch_index):
+        """
+        Ask the user to choose a branch.
+        Only the first branches are listed, the others are found by typing the beginning of their name.
+
+        Arguments:
+            repo_name (str): The name of the repository.
+            branch_index (Branch_Index): The branches of the repository.
 
-                if not selected_index:
+        Returns:
+            str: The name of the selected branch.
+        """
+        shown = branch_index.search("")
+        prefix = ""
+
+        while True:
+            listed = shown[: Configuration.BRANCHES_MENU_SIZE]
+
+            if prefix:
+                Color.pl("\n  {*} Branches of '%s' starting with {C}%s{W}:" % (repo_name, prefix))
+            else:
+                Color.pl("\n  {*} All branches available for '%s':" % repo_name)
+
+            for index, branch in enumerate(listed):
+                Color.pl("  {D}[{W}{SB2}%s{W}{D}]{W} %s" % (index + 1, branch))
+
+            if len(shown) > len(listed):
+                Color.pl(
+                    "  {*} ... and %s other branches, type the beginning of a name to filter them."
+                    % (len(shown) - len(listed))
+                )
+
+            Color.pl("  {*} Select the branch that you want to download.")
+
+            while True:
+                choice = input(self.prompt(menu="choose_branch")).strip()
+                if not choice:
+                    continue
+
+                if choice.isdigit():
+                    if 1 <= int(choice) <= len(listed):
+                        return listed[int(choice) - 1]
+
+                    Color.pl("  {!} Invalid choice. Please enter a number between 1 and %s." % len(listed))
                     continue
 
-                if int(selected_index) > len(items) or int(selected_index) < 1:
-                    Color.pl("  {!} Invalid choice. Please enter a number between 1 and %s." % len(items))
+                # The exact name of a branch is selected, anything else filters the branches
+                if choice in branch_index:
+                    return choice
+
+                matches = branch_index.search(choice)
+                if not matches:
+                    Color.pl("  {!} No branch starts with {C}%s{W}." % choice)
                     continue
 
+                shown, prefix = matches, choice
                 break
 
-            except ValueError:
-                Color.pl("  {!} Invalid choice. Please enter a number between 1 and %s." % len(items))
-                continue
+    def get_repo_details(self, repo_url, full_name):
+        """
+        Get the information, the latest commit of the default branch and the branches of a repository.
+        The three requests are independent, so they are sent at the same time over the shared session.
+
+        Arguments:
+            repo_url (str): The API's URL of the repository.
+            full_name (str): The full name of the repository ('owner/name').
+
+        Returns:
+            tuple: (repo_info, current_commit_sha, branches_info), 'branches_info' is the list of the branches' names.
+        """
+        owner, name = full_name.split("/", 1)
+
+        if Configuration.verbose >= 3:
+            Color.pl("  {§}  Getting the details of the repository at the same time...")
+            Color.pl("   {SY1}├──╼{W} Request: {SY1}GET %s{W}" % repo_url)
+            Color.pl("   {SY1}├──╼{W} Request: {SY1}GET %s/commits/HEAD{W}" % repo_url)
+            Color.pl("   {SY1}╰──╼{W} Request: {SY1}GET %s/branches{W}" % repo_url)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # 'HEAD' is the latest commit of the default branch, which is not known before the information
+            info_future = executor.submit(HTTP_Client.get, repo_url)
+            commit_future = executor.submit(GitHub_API.latest_commit_sha, owner, name, cache=self.http_cache)
+            # All the pages of branches are fetched, not only the first 30 branches
+            branches_future = executor.submit(GitHub_API.list_branches, repo_url)
+
+            repo_info = json.loads(info_future.result().text)
+            branches_info = branches_future.result()
+            current_commit_sha = commit_future.result()
+
+        self.http_cache.save()
 
-        selected_index = int(selected_index) - 1
+        return repo_info, current_commit_sha, branches_info
+
+    def get_github_repo_info(self, repo_name, username=None):
+        # Recherche des dépôts ayant un nom similaire
+        search_url = "%s/search/repositories?q=%s" % (Configuration.GITHUB_API_URL, repo_name)
+        if username:
+            search_url += f"+user:{username}"
+
+        if Configuration.verbose >= 3:
+            Color.pl("  {§}  Searching for similar repositories with the GitHub API...")
+            Color.pl("   {SY1}╰──╼{W} URL: {C}%s{W}" % search_url)
+
+        # The pages of results are fetched only when they are shown (the next one is prefetched)
+        # Only the fields used after the selection are kept for each repository
+        # A search already done is read from the local cache (and revalidated in the background if stale)
+        cursor = Search_Cursor(
+            search_url,
+            fields=["full_name", "url"],
+            cache=self.search_cache,
+            cache_key=Search_Cache.make_key(repo_name, username),
+        )
+        page_number = 1
+        selected_index = None
+
+        try:
+            while selected_index is None:
+                first_index = (page_number - 1) * cursor.per_page
+                shown = []
+
+                # Affichage des dépôts trouvés, au fur et à mesure de leur réception
+                def show_repo(repo):
+                    if not shown:
+                        Color.pl(
+                            "  {*} Here are the similar repositories found for '%s' (page %s):" % (repo_name, page_number)
+                        )
+                    shown.append(repo)
+                    Color.pl("  {D}[{W}{SB2}%s{W}{D}]{W} %s" % (first_index + len(shown), repo["full_name"]))
+
+                # A network error or an invalid response brings back to the main menu
+                try:
+                    items = cursor.page(page_number, on_item=show_repo)
+                except Exception as e:
+                    Color.pl("  {!} Unable to search the repositories on GitHub: %s" % e)
+                    return
+
+                if len(items) == 0:
+                    if Configuration.verbose >= 3:
+                        Color.pl('  {§} No items found in the "items" key of the search results.')
+                    Color.pl("  {!} No repositories found with the name '%s'." % repo_name)
+                    return
+
+                # Fetch the next page while the user reads this one
+                cursor.prefetch(page_number + 1)
+
+                # Demande de l'utilisateur pour choisir un dépôt
+                Color.pl("  {*} Select the repository that you want to clone.")
+                if cursor.has_page(page_number + 1):
+                    Color.pl("  {*} Enter {G}next{W} to show the next page of results.")
+                if page_number > 1:
+                    Color.pl("  {*} Enter {G}prev{W} to show the previous page of results.")
+                Color.pl("  {*} Enter {G}back{W} to come back to the main menu.")
+
+                while True:
+                    choice = input(self.prompt(menu="choose_repo")).strip()
+
+                    if choice == "back":
+                        self.show_main_menu = True
+                        return
+
+                    if not choice:
+                        continue
+
+                    if choice == "next":
+                        if not cursor.has_page(page_number + 1):
+                            Color.pl("  {!} This is the last page of results.")
+                            continue
+                        page_number += 1
+                        break
+
+                    if choice == "prev":
+                        if page_number == 1:
+                            Color.pl("  {!} This is the first page of results.")
+                            continue
+                        page_number -= 1
+                        break
+
+                    try:
+                        if int(choice) < first_index + 1 or int(choice) > first_index + len(items):
+                            raise ValueError
+
+                    except ValueError:
+                        Color.pl(
+                            "  {!} Invalid choice. Please enter a number between %s and %s."
+                            % (first_index + 1, first_index + len(items))
+                        )
+                        continue
+
+                    selected_index = int(choice) - first_index - 1
+                    break
+
+        finally:
+            cursor.close()
 
         # Récupération des informations sur le dépôt
         if Configuration.verbose >= 3:
             Color.pl("  {§}  Getting information about the selected repository...")
-            Color.pl("   {SY1}╰──╼{W} Python: {SY1}selected_repo = search_results['items'][selected_index]{W}")
-        selected_repo = search_results["items"][selected_index]
+            Color.pl("   {SY1}╰──╼{W} Python: {SY1}selected_repo = items[selected_index]{W}")
+        selected_repo = items[selected_index]
 
         # Récupération des informations sur le dépôt
         if Configuration.verbose >= 3:
@@ -161,15 +363,17 @@ class Main_Console:
 
         repo_url = selected_repo["url"]
 
+        # The information, the latest commit of the default branch and the branches are fetched at the same time
         if Configuration.verbose >= 3:
-            Color.pl("   {SY1}├──╼{W} Python: {SY1}response = requests.get(repo_url){W}")
-
-        response = requests.get(repo_url)
-
-        if Configuration.verbose >= 3:
-            Color.pl("   {SY1}╰──╼{W} Python: {SY1}repo_info = json.loads(response.text){W}")
+            Color.pl(
+                "   {SY1}╰──╼{W} Python: {SY1}repo_info, current_commit_sha, branches_info = self.get_repo_details(...){W}"
+            )
 
-        repo_info = json.loads(response.text)
+        try:
+            repo_info, current_commit_sha, branches_info = self.get_repo_details(repo_url, selected_repo["full_name"])
+        except Exception as e:
+            Color.pl("  {!} Unable to get the information about %s: %s" % (selected_repo["full_name"], e))
+            return
 
         # if Configuration.verbose >= 3:
         #     Color.pl('   {SY1}├──╼{W} value: {C}%s{W}' % repo_info['name'])
@@ -197,20 +401,6 @@ class Main_Console:
         username = repo_info["owner"]["login"]
         repo_name = repo_info["name"]
 
-        # Build the URL for the API call
-        url = "https://api.github.com/repos/%s/%s/commits" % (username, repo_name)
-
-        # Send a GET request to the API with the appropriate headers
-        headers = {"Accept": "application/vnd.github.v3+json"}
-        response = requests.get(url, headers=headers)
-
-        # Check the response status code
-        if response.status_code != 200:
-            raise Exception(f" Request failed with status code {response.status_code}")
-
-        # Parse the JSON response and get the SHA hash of the latest commit
-        current_commit_sha = response.json()[0]["sha"]
-
         data = [
             ("", ""),
             ("  Information about '%s':" % repo_info["name"], ""),
@@ -252,37 +442,18 @@ class Main_Console:
         # Color.pl('License            ::  %s' % repo_info['license']['name'] if repo_info['license'] else 'None')
 
         # Demande de l'utilisateur pour choisir la branche
-        if Configuration.verbose >= 3:
-            Color.pl("  {§}  Getting information about the branches of the selected repository...")
-            Color.pl("   {SY1}╰──╼{W} Request: {SY1}GET %s/branches{W}" % repo_info["url"])
+        selected_branch = self.choose_branch(repo_info["name"], Branch_Index(branches_info))
 
-        branches_url = f"{repo_info['url']}/branches"
-        response = requests.get(branches_url)
-        branches_info = json.loads(response.text)
-
-        Color.pl("\n  {*} All branches available for '%s':" % repo_info["name"])
-
-        for index, branch in enumerate(branches_info):
-            Color.pl("  {D}[{W}{SB2}%s{W}{D}]{W} %s" % (index + 1, branch["name"]))
-
-        Color.pl("  {*} Select the branch that you want to download.")
-        while True:
+        # The latest commit of the selected branch, saved with the notification settings
+        if selected_branch != repo_info["default_branch"]:
             try:
-                selected_branch_index = int(input(self.prompt(menu="choose_branch")))
-                if not selected_branch_index:
-                    continue
-
-                if selected_branch_index > len(branches_info) or selected_branch_index < 1:
-                    Color.pl("  {!} Invalid choice. Please enter a number between 1 and %s." % len(branches_info))
-                    continue
-
-                break
-
-            except ValueError:
-                Color.pl("  {!} Invalid choice. Please enter a number between 1 and %s." % len(branches_info))
-                continue
-
-        selected_branch = branches_info[selected_branch_index - 1]["name"]
+                current_commit_sha = GitHub_API.latest_commit_sha(
+                    username, repo_name, branch=selected_branch, cache=self.http_cache
+                )
+            except Exception as e:
+                Color.pl("  {!} Unable to get the latest commit of the branch '%s': %s" % (selected_branch, e))
+                return
+            self.http_cache.save()
 
         # Demande de l'utilisateur pour télécharger le dépôt
         download_url = repo_info["clone_url"]
@@ -292,12 +463,37 @@ class Main_Console:
         repo_install_path = "".join(download_dir).strip()
         repo_install_path = check_folder_path(repo_install_path, repo_info["name"])
 
+        self.remove_existing_folder = False
+        self.update_existing_folder = False
+
         if os.path.isdir(repo_install_path):
             Color.pl("  {!} The folder {C}%s{W} already exists." % repo_install_path)
-            replace_choice = input(Color.s("  {?} Do you want to replace it? [Y/n]: "))
 
-            if replace_choice == "y" or not replace_choice:
+            # A checkout of the same repository is updated, only the new commits are downloaded
+            existing_checkout = Downloader.is_checkout_of(repo_install_path, download_url)
+            local_changes = Downloader.local_changes(repo_install_path) if existing_checkout else []
+            if existing_checkout:
+                Color.pl("  {*} It is a checkout of this repository, only the new commits will be downloaded.")
+
+            # The update resets the checkout, the local changes are lost: the default answer is then 'no'
+            if local_changes:
+                Color.pl("  {!} The checkout has %s local change(s), they will be lost:" % len(local_changes))
+                for index, change in enumerate(local_changes[:5]):
+                    tree = "╰──╼" if index == len(local_changes[:5]) - 1 and len(local_changes) <= 5 else "├──╼"
+                    Color.pl("   {SY1}%s{W} {C}%s{W}" % (tree, change))
+                if len(local_changes) > 5:
+                    Color.pl("   {SY1}╰──╼{W} ... and %s more" % (len(local_changes) - 5))
+
+                replace_choice = input(Color.s("  {?} Do you want to update it and lose the local changes? [y/N]: "))
+            else:
+                replace_choice = input(
+                    Color.s("  {?} Do you want to %s it? [Y/n]: " % ("update" if existing_checkout else "replace"))
+                )
+                replace_choice = replace_choice or "y"
+
+            if replace_choice.lower() == "y":
                 self.remove_existing_folder = True
+                self.update_existing_folder = existing_checkout
 
             else:
                 Color.pl("  {!} You need to choose a new path where you want to download the repository.")
@@ -324,17 +520,69 @@ class Main_Console:
             % (repo_info["name"], repo_install_path)
         )
 
+        # A snapshot has only the files of the branch, a clone has the history of git too
+        snapshot = self.choose_download_mode()
+
+        # The clone options, by default the ones of the command line, else the ones saved for this repository
+        clone_options = None
+        if not snapshot:
+            clone_options = Clone_Options.from_configuration()
+            saved_options = Clone_Options.saved(download_url)
+            if not clone_options.git_args() and saved_options is not None:
+                Color.pl("  {*} The clone options saved for this repository are used.")
+                clone_options = saved_options
+
+            clone_options = self.choose_clone_options(clone_options)
+
         download_choice = input(Color.s("  {?} Do you want to download this repository? [Y/n]: "))
 
         if download_choice == "y" or not download_choice:
             # download_command = f"git clone -b {selected_branch} {download_url} {repo_install_path}"
 
-            if self.remove_existing_folder == True:
-                Color.pl("  {-} Removing the existing folder...")
-                Process.call('rm -fr "%s" ' % repo_install_path, shell=True)
+            updated = False
+            if self.update_existing_folder and not snapshot:
+                Color.pl("  {-} Updating the existing folder...")
+                updated = Downloader.update(
+                    download_url, selected_branch, repo_install_path, options=clone_options, progress=True, force=True
+                )
+
+                if not updated:
+                    Color.pl("  {!} The existing folder cannot be updated, it will be replaced.")
+
+            if not updated:
+                if self.remove_existing_folder == True:
+                    Color.pl("  {-} Removing the existing folder...")
+                    Process.call('rm -fr "%s" ' % repo_install_path, shell=True)
+
+                if snapshot:
+                    Color.pl("  {-} Downloading a snapshot of the repository...")
+                    try:
+                        Downloader.snapshot(username, repo_name, selected_branch, repo_install_path)
+                    except Exception as e:
+                        # The files already extracted are not a usable snapshot
+                        Color.pl("  {!} Unable to download the snapshot of the repository: %s" % e)
+                        shutil.rmtree(repo_install_path, ignore_errors=True)
+                        return
+                else:
+                    Color.pl("  {-} Downloading the repository (%s)..." % clone_options)
+                    stdout, stderr = Downloader.clone(
+                        download_url,
+                        selected_branch,
+                        repo_install_path,
+                        options=clone_options,
+                        mirror_cache=Mirror_Cache() if Configuration.MIRROR_CACHE else None,
+                        progress=True,
+                    )
 
-            Color.pl("  {-} Downloading the repository...")
-            Process.call('git clone -b "%s" "%s" "%s"' % (selected_branch, download_url, repo_install_path), shell=True)
+                    if not Downloader.is_checkout_of(repo_install_path, download_url):
+                        # A failed clone can leave an incomplete folder
+                        shutil.rmtree(repo_install_path, ignore_errors=True)
+                        errors = [line for line in stderr.splitlines() if line.startswith("fatal:")]
+                        Color.pl(
+                            "  {!} Unable to download the repository: %s"
+                            % (errors[0][len("fatal:") :].strip() if errors else "git clone failed")
+                        )
+                        return
 
             Color.pl("  {-} Applying files permissions...")
             Process.call('chmod -R 777 "%s" ' % repo_install_path, shell=True)
@@ -383,6 +631,7 @@ class Main_Console:
                     github_repo_url=repo_info["html_url"],
                     github_repo_api_url=repo_info["url"],
                     current_commit_sha=current_commit_sha,
+                    clone_options=clone_options,
                     receiver_email_address=receiver_email_address,
                     smtp_server=smtp_server,
                     smtp_port=smtp_port,
@@ -455,6 +704,19 @@ class Main_Console:
         if menu == "choose_download_dir":
             return Color.s("{underscore}%s{W}:{underscore}choose-download-dir{W}> " % ptnm)
 
+        # Clone options
+        if menu == "choose_download_mode":
+            return Color.s("{underscore}%s{W}:{underscore}choose-download-mode{W}> " % ptnm)
+
+        if menu == "choose_clone_depth":
+            return Color.s("{underscore}%s{W}:{underscore}choose-clone-depth{W}> " % ptnm)
+
+        if menu == "choose_clone_filter":
+            return Color.s("{underscore}%s{W}:{underscore}choose-clone-filter{W}> " % ptnm)
+
+        if menu == "choose_sparse_paths":
+            return Color.s("{underscore}%s{W}:{underscore}choose-sparse-paths{W}> " % ptnm)
+
         # SMTP settings
         if menu == "choose_email_address":
             return Color.s("{underscore}%s{W}:{underscore}choose-email-adress{W}> " % ptnm)
@@ -532,34 +794,36 @@ class Main_Console:
 
         except KeyboardInterrupt:
             Color.pl("  {!} Interrupted, shutting down...")
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1, pwd=self.pwd)
 
     def __init__(self, pwd):
         # Set the current working directory
         self.pwd = pwd
 
+        # The ETag/Last-Modified cache of the GitHub API requests
+        self.http_cache = HTTP_Cache()
+        # The local cache of the searches of repositories
+        self.search_cache = Search_Cache()
+
         # Check if the user's platform is a Linux machine or not
         if Configuration.verbose == 3:
             Color.pl("  {§} Checking if the user's platform is a Linux machine or not...")
             Color.pl("   {SY1}├──╼{W} Python: {SY1}platform.system() != Linux{W}")
-            sleep(0.2)
         if platform.system() != "Linux":
             if Configuration.verbose == 3:
                 Color.pl("   {SY1}├──╼{W} The user's platform is {R}%s{W}" % platform.system())
                 Color.pl("   {SY1}╰──╼{W} The user's platform is not a Linux machine.")
-                sleep(0.2)
 
             Color.pl("  {!} You tried to run GitPy on a non-linux machine!")
             Color.pl("  {*} GitPy can be run only on a Linux kernel.")
 
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1, pwd=self.pwd)
 
         else:
             if Configuration.verbose == 3:
                 Color.pl("   {SY1}╰──╼{W} The user's platform is {C}%s{W}" % platform.system())
-                sleep(0.2)
 
             # Check if the GITPY_INSTALL_PATH environment variable is set or not
             try:
@@ -600,26 +864,22 @@ class Main_Console:
                     Color.pl("   {SY1}╰──╼{W} The user is {C}not root{W}")
                 Color.pl("  {!} The GitPy Console must be run as root.")
                 Color.pl("  {*} Re-run with sudo or switch to root user.")
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=self.pwd)
             else:
                 if Configuration.verbose == 3:
                     Color.pl("   {SY1}╰──╼{W} The user is {C}%s{W}" % ("root" if os.getuid() == 0 else "not root"))
-                    sleep(0.2)
                     Color.pl("  {§} Checking if the user's Linux distro is Debian or Arch based...")
                     Color.pl("   {SY1}├──╼{W} Python: {SY1}Based_Distro(){W}")
-                    sleep(0.2)
                 # Distro check
                 if Based_Distro() == "Arch":
                     if Configuration.verbose == 3:
                         Color.pl("   {SY1}╰──╼{W} The user's Linux distro is {C}Arch{W}")
-                        sleep(0.2)
                     based_distro = "Arch"
                     pass
                 elif Based_Distro() == "Debian":
                     if Configuration.verbose == 3:
                         Color.pl("   {SY1}╰──╼{W} The user's Linux distro is {C}Arch{W}")
-                        sleep(0.2)
                     based_distro = "Debian"
                     pass
                 else:
@@ -627,7 +887,7 @@ class Main_Console:
                         Color.pl("   {SY1}╰──╼{W} The user's Linux distro is {C}not Arch or Debian{W}")
                     Color.pl("  {!} You're not running Debian or Arch variant.")
                     Color.pl("  {*} GitPy can only be run on Debian or Arch based Linux distros.")
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1, pwd=self.pwd)
 
                 # Check if the use are connected to the Internet network with the internet_check() function
@@ -651,5 +911,4 @@ class Main_Console:
                 if Configuration.verbose == 3:
                     Color.pl("  {§} Loading the main menu...")
                     Color.pl("   {SY1}╰──╼{W} Python: {SY1}self.main_menu(){W}")
-                    sleep(0.2)
                 self.main_menu()
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ downloader.py              [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  The download of a GitHub's repository, with the clone options             #
+#  (shallow, single branch, partial and sparse clones).                      #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import configparser
+import os
+import re
+import shlex
+import tarfile
+import time
+from urllib.parse import quote
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.http_client import HTTP_Client
+from src.util.process import Process
+
+
+class Clone_Options:
+    """
+    The options of 'git clone' that limit the downloaded data.
+
+    - depth: only the last N commits of the history ('--depth N').
+    - single_branch: only the history of the cloned branch ('--single-branch').
+    - filter: a partial clone, the missing objects are downloaded when needed ('--filter=blob:none').
+    - sparse_paths: only these paths are checked out ('git sparse-checkout set').
+
+    The options are saved with the notification settings of a repository, so the
+    next downloads of this repository use the same ones.
+    """
+
+    # The names of the options in the notification config file
+    CONFIG_KEYS = ("clone_depth", "clone_single_branch", "clone_filter", "clone_sparse_paths")
+
+    def __init__(self, depth=None, single_branch=False, filter=None, sparse_paths=None):
+        """
+        Arguments:
+            depth (int): The number of commits of the history (default: the full history).
+            single_branch (bool): Clone only the selected branch.
+            filter (str): The filter of a partial clone, like 'blob:none' (default: no filter).
+            sparse_paths (list): The paths checked out (default: all the files).
+        """
+        self.depth = int(depth) if depth else None
+        self.single_branch = bool(single_branch)
+        self.filter = filter or None
+        self.sparse_paths = list(sparse_paths or [])
+
+    @classmethod
+    def from_configuration(cls):
+        """
+        The options given on the command line ('--depth', '--single-branch', '--filter' and '--sparse').
+        """
+        return cls(
+            depth=Configuration.CLONE_DEPTH,
+            single_branch=Configuration.CLONE_SINGLE_BRANCH,
+            filter=Configuration.CLONE_FILTER,
+            sparse_paths=Configuration.CLONE_SPARSE_PATHS,
+        )
+
+    @classmethod
+    def from_section(cls, section):
+        """
+        The options saved in a section of the notification config file.
+
+        Arguments:
+            section (configparser.SectionProxy): The section of the repository.
+        """
+        return cls(
+            depth=section.get("clone_depth"),
+            single_branch=section.get("clone_single_branch", "no").lower() in ("yes", "true", "1"),
+            filter=section.get("clone_filter"),
+            sparse_paths=section.get("clone_sparse_paths", "").split(),
+        )
+
+    @classmethod
+    def saved(cls, url):
+        """
+        The options saved with the notification settings of a repository.
+
+        Arguments:
+            url (str): The URL of the repository, the section with the same 'github_repo_url' is read.
+
+        Returns:
+            Clone_Options: The saved options, None if GitPy is not installed or nothing is saved for this repository.
+        """
+        if Configuration.gitpy_install_path_env_var_name not in os.environ:
+            return None
+
+        config = configparser.ConfigParser()
+        config.read(
+            os.environ[Configuration.gitpy_install_path_env_var_name] + "src/config/new_version_notification.conf"
+        )
+
+        for section in config.sections():
+            repo_url = config[section].get("github_repo_url", "")
+            if repo_url and Downloader.normalize_url(repo_url) == Downloader.normalize_url(url):
+                if any(key in config[section] for key in cls.CONFIG_KEYS):
+                    return cls.from_section(config[section])
+
+        return None
+
+    def to_section(self):
+        """
+        Returns the options as the values of a section of the notification config file.
+        """
+        return {
+            "clone_depth": str(self.depth or ""),
+            "clone_single_branch": "yes" if self.single_branch else "no",
+            "clone_filter": self.filter or "",
+            "clone_sparse_paths": " ".join(self.sparse_paths),
+        }
+
+    def git_args(self):
+        """
+        Returns the arguments added to 'git clone'.
+        """
+        args = []
+
+        if self.depth:
+            args += ["--depth", str(self.depth)]
+
+        if self.single_branch:
+            args.append("--single-branch")
+
+        if self.filter:
+            args.append("--filter=%s" % self.filter)
+
+        if self.sparse_paths:
+            # Only the files at the root are checked out until 'git sparse-checkout set'
+            args.append("--sparse")
+
+        return args
+
+    def __str__(self):
+        parts = []
+
+        if self.depth:
+            parts.append("depth %s" % self.depth)
+        if self.single_branch:
+            parts.append("single branch")
+        if self.filter:
+            parts.append("filter %s" % self.filter)
+        if self.sparse_paths:
+            parts.append("sparse: %s" % ", ".join(self.sparse_paths))
+
+        return ", ".join(parts) or "full clone"
+
+
+class Stream_Reader:
+    """
+    A read-only file object over the chunks of a streamed response.
+
+    'tarfile' reads the archive through this object, so the archive is extracted
+    while it is downloaded, without being held in memory or written to a file.
+    """
+
+    def __init__(self, chunks, on_read=None):
+        """
+        Arguments:
+            chunks (iterator): The chunks of bytes of the body, like 'HTTPResponse.stream()'.
+            on_read (function): Called with the number of bytes read after each chunk (default: nothing).
+        """
+        self.chunks = chunks
+        self.on_read = on_read
+        self.buffer = b""
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        while size < 0 or len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+
+            self.buffer += chunk
+            self.bytes_read += len(chunk)
+            if self.on_read is not None:
+                self.on_read(self.bytes_read)
+
+        if size < 0:
+            data, self.buffer = self.buffer, b""
+        else:
+            data, self.buffer = self.buffer[:size], self.buffer[size:]
+
+        return data
+
+
+class Git_Progress:
+    """
+    Show the progress written by git ('Receiving objects:  45% (450/1000), 1.20 MiB | 3.00 MiB/s')
+    as a progress bar. Used as the 'on_line' function of 'Process.call()'.
+    """
+
+    PROGRESS_LINE = re.compile(r"^(?:remote: )?(?P<phase>[A-Z][\w ]+):\s+(?P<percent>\d+)%(?P<details>.*)$")
+
+    def __init__(self, width=None):
+        """
+        Arguments:
+            width (int): The number of characters of the bar (default: Configuration.PROGRESS_BAR_WIDTH).
+        """
+        self.width = width or Configuration.PROGRESS_BAR_WIDTH
+        self.phase = None
+
+    def __call__(self, name, line):
+        match = self.PROGRESS_LINE.match(line.strip()) if name == "stderr" else None
+        if match is None:
+            return
+
+        # Each phase of git ('Counting objects', 'Receiving objects', ...) has its own line
+        if self.phase is not None and match.group("phase") != self.phase:
+            Color.pl("")
+        self.phase = match.group("phase")
+
+        percent = int(match.group("percent"))
+        filled = self.width * percent // 100
+        speed = re.search(r"\|\s*([\d.]+ \w+/s)", match.group("details"))
+
+        Color.p(
+            "\r  {-} %-20s {D}[{W}{G}%s{W}%s{D}]{W} %3s%%  %s   "
+            % (self.phase, "#" * filled, " " * (self.width - filled), percent, speed.group(1) if speed else "")
+        )
+
+    def done(self):
+        """
+        Go to the next line after the last progress bar.
+        """
+        if self.phase is not None:
+            Color.pl("")
+            self.phase = None
+
+
+# Main
+class Downloader:
+    """
+    Download a GitHub's repository with git.
+    """
+
+    @staticmethod
+    def clone(url, branch, path, options=None, mirror_cache=None, progress=False):
+        """
+        Clone a branch of a repository.
+
+        With a Mirror_Cache, the mirror of the repository is updated first. A full clone
+        is then made from the mirror (its objects are hardlinked) and its 'origin' is set
+        back to GitHub. A limited clone uses the objects of an existing mirror with
+        '--reference --dissociate', but a mirror is not created for it, since a full
+        mirror is more to download than a limited clone.
+
+        Arguments:
+            url (str): The cloning URL of the repository.
+            branch (str): The branch to clone.
+            path (str): The folder where the repository is cloned.
+            options (Clone_Options): The options of the clone (default: a full clone).
+            mirror_cache (Mirror_Cache): The cache of mirrors (default: no cache).
+            progress (bool): Show the progress of git as progress bars.
+
+        Returns:
+            tuple: (stdout, stderr) of 'git clone', only their last lines with 'progress'.
+        """
+        options = options or Clone_Options()
+        git_args = options.git_args()
+        mirror_path = None
+        mirror_lock = None
+
+        if mirror_cache is not None and (not git_args or mirror_cache.has(url)):
+            # The mirror is locked until the end of the clone, so it is not removed while it is read
+            mirror_lock = mirror_cache.lock(mirror_cache.mirror_path(url))
+            mirror_path = mirror_cache.update(url, locked=True)
+
+        if mirror_path is not None and not git_args:
+            # A local clone hardlinks the objects of the mirror
+            command = ["git", "clone", "--local", "-b", branch, "--", mirror_path, path]
+        elif mirror_path is not None:
+            command = ["git", "clone", "--reference", mirror_path, "--dissociate", "-b", branch] + git_args
+            command += ["--", url, path]
+        else:
+            command = ["git", "clone", "-b", branch] + git_args + ["--", url, path]
+
+        if Configuration.verbose >= 3:
+            Color.pl("  {§}  Cloning the repository (%s)..." % options)
+            Color.pl("   {SY1}╰──╼{W} Command: {SY1}%s{W}" % " ".join(command))
+
+        try:
+            if progress:
+                # git writes its progress only on a terminal, unless '--progress' is given
+                command.insert(2, "--progress")
+                git_progress = Git_Progress()
+                result = Process.call(" ".join(shlex.quote(arg) for arg in command), shell=True, on_line=git_progress)
+                git_progress.done()
+            else:
+                result = Process.call(" ".join(shlex.quote(arg) for arg in command), shell=True)
+        finally:
+            if mirror_lock is not None:
+                mirror_lock.close()
+
+        if mirror_path is not None and not git_args:
+            Process.call("git -C %s remote set-url origin %s" % (shlex.quote(path), shlex.quote(url)), shell=True)
+
+        if mirror_cache is not None:
+            # The mirror of this repository has just been used, it is kept
+            mirror_cache.evict(keep=mirror_path)
+
+        if options.sparse_paths:
+            sparse_command = ["git", "-C", path, "sparse-checkout", "set", "--"] + options.sparse_paths
+            Process.call(" ".join(shlex.quote(arg) for arg in sparse_command), shell=True)
+
+        return result
+
+    @staticmethod
+    def normalize_url(url):
+        """
+        Returns a cloning URL without its differences of form ('git@github.com:', '.git', case).
+        """
+        url = url.strip().rstrip("/")
+        url = re.sub(r"^(?:ssh://)?git@([^:/]+)[:/]", r"https://\1/", url)
+        url = re.sub(r"\.git$", "", url)
+
+        return url.lower()
+
+    @staticmethod
+    def is_checkout_of(path, url):
+        """
+        Returns True if a folder is a checkout of a repository (its 'origin' is the repository).
+        """
+        if not os.path.isdir(os.path.join(path, ".git")):
+            return False
+
+        stdout, stderr = Process.call("git -C %s remote get-url origin" % shlex.quote(path), shell=True)
+
+        return bool(stdout.strip()) and Downloader.normalize_url(stdout) == Downloader.normalize_url(url)
+
+    @staticmethod
+    def local_changes(path):
+        """
+        Returns the local changes of a checkout, as the lines of 'git status --porcelain'
+        (the modified, staged and untracked files, the ignored files are not listed).
+        """
+        stdout, stderr = Process.call("git -C %s status --porcelain" % shlex.quote(path), shell=True)
+
+        return [line for line in stdout.splitlines() if line.strip()]
+
+    @staticmethod
+    def update(url, branch, path, options=None, progress=False, force=False):
+        """
+        Update a checkout of a repository to the latest commit of a branch.
+
+        Only the new objects are fetched, then the checkout is reset to the branch, so
+        the folder ends up like a new clone without downloading the whole repository.
+        A checkout with local changes is not updated, unless 'force' is given: the local
+        changes and the untracked files are then removed (the ignored files are kept).
+
+        Arguments:
+            url (str): The cloning URL of the repository.
+            branch (str): The branch to check out.
+            path (str): The folder of the checkout.
+            options (Clone_Options): The options of the clone, '--depth' and the sparse paths are kept
+                                     (default: the options saved for the repository, see 'Clone_Options.saved()').
+            progress (bool): Show the progress of git as progress bars.
+            force (bool): Update the checkout even if it has local changes, they are lost.
+
+        Returns:
+            bool: True if the checkout has been updated, False if it is not a checkout of the repository,
+                  it has local changes (without 'force') or git failed.
+        """
+        options = options or Clone_Options.saved(url) or Clone_Options()
+
+        if not Downloader.is_checkout_of(path, url):
+            return False
+
+        if not force and Downloader.local_changes(path):
+            return False
+
+        git = "git -C %s " % shlex.quote(path)
+        fetch_args = "--depth %s " % options.depth if options.depth else ""
+        refspec = shlex.quote("+refs/heads/%s:refs/remotes/origin/%s" % (branch, branch))
+
+        if Configuration.verbose >= 3:
+            Color.pl("  {§}  Updating the existing checkout of the repository...")
+            Color.pl("   {SY1}├──╼{W} Command: {SY1}%sfetch --prune %sorigin %s{W}" % (git, fetch_args, refspec))
+            Color.pl("   {SY1}╰──╼{W} Command: {SY1}%scheckout -f -B %s origin/%s{W}" % (git, branch, branch))
+
+        if progress:
+            git_progress = Git_Progress()
+            Process.call(
+                git + "fetch --prune --progress %sorigin %s" % (fetch_args, refspec), shell=True, on_line=git_progress
+            )
+            git_progress.done()
+        else:
+            Process.call(git + "fetch --prune --quiet %sorigin %s" % (fetch_args, refspec), shell=True)
+
+        remote_branch = shlex.quote("origin/" + branch)
+        Process.call(git + "checkout --quiet -f -B %s %s" % (shlex.quote(branch), remote_branch), shell=True)
+
+        # The checkout is at the latest commit of the branch only if the fetch and the checkout succeeded
+        head, stderr = Process.call(git + "rev-parse --verify --quiet HEAD", shell=True)
+        latest, stderr = Process.call(git + "rev-parse --verify --quiet %s" % remote_branch, shell=True)
+        if not latest.strip() or head.strip() != latest.strip():
+            return False
+
+        Process.call(git + "clean -q -ffd", shell=True)
+
+        if options.sparse_paths:
+            Process.call(git + "sparse-checkout set -- %s" % " ".join(map(shlex.quote, options.sparse_paths)), shell=True)
+
+        return True
+
+    @staticmethod
+    def snapshot(owner, repo, ref, path, progress=True):
+        """
+        Download a snapshot of a branch (the files without the history of git).
+
+        The archive of the '/tarball/{ref}' endpoint is streamed into 'tarfile', each file
+        is written as soon as it is received, so the download needs neither the memory nor
+        the disk space of the whole archive.
+
+        Arguments:
+            owner (str): The username or organization that owns the repository.
+            repo (str): The name of the repository.
+            ref (str): The branch, tag or commit to download.
+            path (str): The folder where the files are extracted.
+            progress (bool): Show the number of bytes downloaded.
+
+        Returns:
+            str: The SHA hash of the downloaded commit (written by GitHub in the archive), or None.
+
+        Raises:
+            Exception: If the request failed.
+        """
+        url = "%s/repos/%s/%s/tarball/%s" % (Configuration.GITHUB_API_URL, owner, repo, quote(ref, safe="/"))
+
+        if Configuration.verbose >= 3:
+            Color.pl("  {§}  Downloading a snapshot of the repository...")
+            Color.pl("   {SY1}╰──╼{W} Request: {SY1}GET %s{W}" % url)
+
+        # GitHub redirects to the archive, the body is read only while it is extracted
+        response = HTTP_Client.get(url, stream=True)
+
+        try:
+            # Check the response status code
+            if response.status_code != 200:
+                raise Exception(f"Request failed with status code {response.status_code}")
+
+            total = int(response.headers.get("Content-Length", 0))
+            last_update = [0.0]
+
+            def show_progress(bytes_read):
+                now = time.monotonic()
+                if now - last_update[0] < Configuration.PROGRESS_INTERVAL:
+                    return
+
+                last_update[0] = now
+                downloaded = Downloader.format_size(bytes_read)
+                if total:
+                    downloaded += " / %s" % Downloader.format_size(total)
+
+                Color.p("\r  {-} Downloaded {C}%s{W}   " % downloaded)
+
+            reader = Stream_Reader(
+                response.raw.stream(Configuration.DOWNLOAD_CHUNK_SIZE, decode_content=True),
+                on_read=show_progress if progress else None,
+            )
+
+            os.makedirs(path, exist_ok=True)
+
+            # The 'data' filter refuses the files outside of the folder, links to outside and special files
+            extract_options = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+            # 'r|gz' reads the archive forward only, it never seeks back
+            with tarfile.open(fileobj=reader, mode="r|gz") as archive:
+                for member in archive:
+                    # The files of the archive are in a '{owner}-{repo}-{sha}/' folder
+                    name = member.name.split("/", 1)[1] if "/" in member.name else ""
+                    if not name:
+                        continue
+
+                    if os.path.isabs(name) or ".." in name.split("/"):
+                        raise Exception("Unsafe path in the archive: %s" % member.name)
+
+                    member.name = name
+                    if member.islnk():
+                        member.linkname = member.linkname.split("/", 1)[-1]
+
+                    archive.extract(member, path, **extract_options)
+
+                commit_sha = archive.pax_headers.get("comment")
+
+            if progress:
+                Color.clear_line()
+                Color.pl("  {-} Downloaded {C}%s{W}." % Downloader.format_size(reader.bytes_read))
+
+            return commit_sha
+
+        finally:
+            response.close()
+
+    @staticmethod
+    def format_size(size):
+        """
+        Returns a number of bytes in a readable unit.
+        """
+        for unit in ("B", "KiB", "MiB"):
+            if size < 1024:
+                return "%.0f %s" % (size, unit) if unit == "B" else "%.1f %s" % (size, unit)
+            size /= 1024
+
+        return "%.1f GiB" % size
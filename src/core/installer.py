@@ -34,8 +34,6 @@
 # Imports section
 import os
 import platform
-import shutil
-from time import sleep
 
 import pkg_resources
 
@@ -50,10 +48,12 @@ from src.util.exit_tool import exit_tool
 
 ## Third party libraries
 from src.util.github_repo import GitHub_Repo
-from src.util.if_package_exist import package_exists
+from src.util.if_package_exist import Package_Inventory, missing_packages
 from src.util.internet_check import internet_check
+from src.util.pipeline import Pipeline
+from src.util.precompile import precompile
 from src.util.process import Process
-from src.util.remove_python_cache import remove_python_cache
+from src.util.staged_install import Staged_Install
 
 
 # Main
@@ -65,7 +65,6 @@ class Installer:
     # Variables
     DEFAULT_INSTALL_PATH = Configuration.DEFAULT_INSTALL_PATH
     BIN_PATH = Configuration.BIN_PATH
-    TEMP_PATH = Configuration.TEMP_PATH
     INSTALL_PATH = DEFAULT_INSTALL_PATH
     # NOTIFICATION_CONFIG_FILE = Configuration.DEFAULT_NOTIFICATION_CONFIG_FILE_PATH
     PROGRAM_NAME = Configuration.PROGRAM_NAME
@@ -105,6 +104,135 @@ class Installer:
     REPO_BRANCH = Configuration.REPO_BRANCH
     REPO_MASTER_BRANCH = Configuration.REPO_MASTER_BRANCH
 
+    @classmethod
+    def install_packages(cls, based_distro, quiet=False):
+        """
+        Install the missing packages of the distro and the missing PIP's packages.
+        The installed packages are read once (see 'Package_Inventory'), then the missing
+        ones are installed by one command for each package manager.
+        Also used by the updater, for the packages needed by a new version.
+
+        Arguments:
+            based_distro (str): 'Arch' or 'Debian'.
+            quiet (bool): Don't show the state of each package.
+        """
+        if based_distro == "Arch":
+            package_list = cls.arch_package_list
+            install_command = "pacman --needed --noconfirm %s -S %%s" % ("-q" if quiet else "-v")
+        else:
+            package_list = cls.debian_package_list
+            install_command = "apt install %s-y %%s" % ("-qqq " if quiet else "")
+
+        # Tools
+        missing = missing_packages(package_list)
+
+        if not quiet:
+            for package_name in package_list:
+                if package_name in missing:
+                    Color.pl("  {-} Installing '%s' package..." % package_name)
+                else:
+                    Color.pl("  {*} The package '%s' are already installed." % package_name)
+
+        if missing:
+            Process.call(install_command % " ".join(missing), shell=True)
+            Package_Inventory.reload()
+
+        # PIP's packages
+        missing_pip = []
+        for pip_package_name in cls.pip_package_name_list:
+            try:
+                pkg_resources.get_distribution(pip_package_name)
+                if not quiet:
+                    Color.pl("  {*} PIP's package '%s' already intsalled." % pip_package_name)
+
+            except pkg_resources.DistributionNotFound:
+                missing_pip.append(pip_package_name)
+                if not quiet:
+                    Color.pl("  {-} Installing '%s' PIP's package..." % pip_package_name)
+
+        if missing_pip:
+            Process.call("pip install %s" % " ".join(missing_pip), shell=True)
+
+    def install_steps(self, args, based_distro, gitpy_command_bin, quiet=False):
+        """
+        The steps of the installation of GitPy.
+
+        Arguments:
+            args (object): The arguments object
+            based_distro (str): 'Arch' or 'Debian'.
+            gitpy_command_bin (str): The content of the 'gitpy' command.
+            quiet (bool): Don't show the messages of the steps.
+
+        Returns:
+            Pipeline: The steps, ready to run.
+        """
+
+        def update_system():
+            Process.call("pacman -Syy" if based_distro == "Arch" else "apt update")
+
+        # The new instance is cloned next to the install folder, then takes its place
+        staged = Staged_Install(self.INSTALL_PATH)
+
+        def create_command():
+            ## If a file called 'gitpy' already exist, it is replaced
+            if os.path.isfile(self.BIN_PATH + "gitpy"):
+                os.remove(self.BIN_PATH + "gitpy")
+
+            with open(self.BIN_PATH + "gitpy", "x") as gitpy_file:
+                gitpy_file.write(gitpy_command_bin)
+
+            os.chmod(self.BIN_PATH + "gitpy", Configuration.INSTALL_FILES_MODE)
+
+        def set_install_path_env_var():
+            ## The environment variable is used to know where GitPy is installed
+            set_env_var(var_name=self.gitpy_install_path_env_var_name, var_value=self.gitpy_install_path_env_var_value)
+
+        steps = Pipeline("Installation", quiet=quiet)
+        steps.add("update_system", update_system, message="Updating your system...", skip=args.skip_update)
+        steps.add(
+            "install_packages",
+            lambda: self.install_packages(based_distro, quiet=quiet),
+            requires=("update_system",),
+        )
+        steps.add(
+            "download",
+            ## The latest version of GitPy is cloned from GitHub in the staging folder
+            lambda: staged.clone(self.REPO_CLONE_URL, self.REPO_BRANCH, verbose=True),
+            # The clone is usable once its files are there
+            ready=lambda: os.path.isfile(staged.staging_path + "/gitpy.py"),
+            message="Installing GitPy files...",
+        )
+        steps.add(
+            "precompile",
+            # The bytecode is kept between the runs of GitPy, it's compiled once here
+            lambda: precompile(staged.staging_path),
+            requires=("download",),
+            message="Compiling the python files of GitPy...",
+        )
+        steps.add(
+            "apply_rights",
+            lambda: staged.apply_rights(staged.staging_path),
+            requires=("download", "precompile"),
+            message="Apply rights to the new files...",
+        )
+        steps.add(
+            "install_files",
+            staged.swap,
+            requires=("apply_rights",),
+            # The previous instance is put back if a next step fails
+            undo=staged.rollback,
+        )
+        steps.add(
+            "create_command",
+            create_command,
+            requires=("install_files",),
+            message=Color.s("Create the {G}gitpy{W} command into {C}%s{W}..." % self.BIN_PATH),
+        )
+        steps.add("set_env_var", set_install_path_env_var, requires=("install_files",))
+        steps.add("remove_previous_instance", staged.commit, requires=("create_command", "set_env_var"))
+
+        return steps
+
     # Main
     def __init__(self, args, pwd):
         self.pwd = pwd
@@ -160,99 +288,12 @@ class Installer:
         if args.quiet:
             # -------------------- [ Quiet installation ] -------------------- #
             try:
-                ## System update
-                if args.skip_update:
-                    pass
-
-                else:
-                    sleep(0.5)
-                    if based_distro == "Arch":
-                        Process.call("pacman -Syy")
-
-                    elif based_distro == "Debian":
-                        Process.call("apt update")
-                    sleep(1)
-
-                ## Tools installation
-                if based_distro == "Arch":
-                    for arch_package_name in self.arch_package_list:
-                        if package_exists(package=arch_package_name):
-                            pass
-
-                        else:
-                            Process.call("pacman --needed --noconfirm -q -S %s" % arch_package_name, shell=True)
-                elif based_distro == "Debian":
-                    for debian_package_name in self.debian_package_list:
-                        if package_exists(package=debian_package_name):
-                            pass
-
-                        else:
-                            Process.call("apt install -qqq-y %s" % debian_package_name, shell=True)
-
-                ## PIP package
-                for pip_package_name in self.pip_package_name_list:
-                    try:
-                        pkg_resources.get_distribution(pip_package_name)
-
-                    except pkg_resources.DistributionNotFound:
-                        Process.call("pip install %s" % pip_package_name, shell=True)
-
-                ## GitPy installation
-                if os.path.isdir(self.INSTALL_PATH):
-                    shutil.rmtree(self.INSTALL_PATH)
-
-                    if os.path.isdir(self.TEMP_PATH):
-                        shutil.rmtree(self.TEMP_PATH)
-
-                ## GitPy files
-                ### Create the main folder in /usr/share/
-                os.makedirs(self.INSTALL_PATH, mode=0o777)  # Create the main directory of GitPy
-
-                ### Create the temp folder that be use to download the latest GitPy version from GitHub
-                ### in it and install GitPy from this folder
-                os.makedirs(self.TEMP_PATH, mode=0o777)
-
-                ### Clone the latest version of GitPy into the temp. folder
-                Process.call(
-                    "git clone %s --verbose --branch %s %s" % (self.REPO_CLONE_URL, self.REPO_BRANCH, self.TEMP_PATH),
-                    shell=True,
-                )
-
-                ### Install GitPy by moving all the files from the temp. folder to the main folder
-                shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
-
-                ### Create the command 'gitpy' in /usr/bin
-                # If a file called 'gitpy' already exist, inform the user and delete it
-                if os.path.isfile(self.BIN_PATH + "gitpy"):
-                    os.remove(self.BIN_PATH + "gitpy")
-                else:
-                    pass
-
-                # Create and write the 'gitpy' file into /usr/bin/
-                with open(self.BIN_PATH + "gitpy", "x") as gitpy_file:
-                    gitpy_file.write(gitpy_command_bin)
-
-                ### Apply rights on files
-                sleep(1)
-                Process.call("chmod 777 %sgitpy" % self.BIN_PATH, shell=True)
-                Process.call("chmod 777 -R %s" % self.INSTALL_PATH, shell=True)
-                # Deleting the temporary directory
-                shutil.rmtree(self.TEMP_PATH)
-                sleep(1)
-                # Create the environment variable
-
-                ## The environment variable is used to know where GitPy is installed
-                set_env_var(
-                    var_name=self.gitpy_install_path_env_var_name, var_value=self.gitpy_install_path_env_var_value
-                )
-
-                ## The environment variable is used to know where the News Version Notification config file is
-                # set_env_var(var_name=self.gitpy_path_notification_config_file_env_var_name, var_value=self.gitpy_path_notification_config_file_env_var_value)
+                self.install_steps(args, based_distro, gitpy_command_bin, quiet=True).run()
 
             except KeyboardInterrupt:
                 Color.pl("\n  {!} Installation process interrupted.")
                 Color.pl("  {!} You must re-run the installation process to install GitPy correctly.")
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=self.pwd)
 
         else:
@@ -304,19 +345,15 @@ class Installer:
                 """  {*} {underscore}This tool will{W}:
                     \r     {D}[{W}{LL}1{W}{D}]{W} Update your system. %s
                     \r     {D}[{W}{LL}2{W}{D}]{W} Install python-pip.
-                    \r     {D}[{W}{LL}3{W}{D}]{W} Create the GitPy's folder in {C}%s{W}.
-                    \r     {D}[{W}{LL}4{W}{D}]{W} Create the GitPy's temporary folder in {C}%s{W} and clone the GitPy files, from GitHub, into it.
-                    \r     {D}[{W}{LL}5{W}{D}]{W} Move the GitPy's files from {C}%s{W} into {C}%s{W}.
+                    \r     {D}[{W}{LL}3{W}{D}]{W} Clone the GitPy files, from GitHub, into the staging folder {C}%s{W}.
+                    \r     {D}[{W}{LL}4{W}{D}]{W} Apply all rights on the new files in {C}%s{W}.
+                    \r     {D}[{W}{LL}5{W}{D}]{W} Put the staging folder in place of {C}%s{W}.
                     \r     {D}[{W}{LL}6{W}{D}]{W} Create and install the command {G}gitpy{W} into {C}%s{W}.
-                    \r     {D}[{W}{LL}7{W}{D}]{W} Apply all rights on the new files in {C}%s{W} and {C}%sgitpy{W}.
             """
                 % (
                     UPDATE_SYSTEM_SKIPED,
-                    self.INSTALL_PATH,
-                    self.TEMP_PATH,
-                    self.TEMP_PATH,
-                    self.INSTALL_PATH,
-                    self.BIN_PATH,
+                    Staged_Install(self.INSTALL_PATH).staging_path,
+                    Staged_Install(self.INSTALL_PATH).staging_path,
                     self.INSTALL_PATH,
                     self.BIN_PATH,
                 )
@@ -331,57 +368,6 @@ class Installer:
 
             if choice_1.lower() == "y" or not choice_1:
                 try:
-                    # System update
-                    if args.skip_update:
-                        Color.pl("  {*} System update skiped.")
-                        pass
-
-                    else:
-                        Color.pl("  {-} Updating your system...")
-                        if Configuration.verbose == 3:
-                            Color.pl("  {§} Python: {SY1}sleep(0.5){W}")
-
-                        sleep(0.5)
-                        if based_distro == "Arch":
-                            Process.call("pacman -Syy")
-
-                        elif based_distro == "Debian":
-                            Process.call("apt update")
-
-                        if Configuration.verbose == 3:
-                            Color.pl("  {§} Python: {SY1}sleep(1){W}")
-
-                        sleep(1)
-
-                    # Tools installation
-                    if based_distro == "Arch":
-                        for arch_package_name in self.arch_package_list:
-                            if package_exists(package=arch_package_name):
-                                Color.pl("  {*} The package '%s' are already installed." % arch_package_name)
-
-                            else:
-                                Color.pl("  {-} Installing '%s' package..." % arch_package_name)
-                                Process.call("pacman --needed --noconfirm -v -S %s" % arch_package_name, shell=True)
-
-                    elif based_distro == "Debian":
-                        for debian_package_name in self.debian_package_list:
-                            if package_exists(package=debian_package_name):
-                                Color.pl("  {*} The package '%s' are already installed." % debian_package_name)
-
-                            else:
-                                Color.pl("  {-} Installing '%s' package..." % debian_package_name)
-                                Process.call("apt install -y %s" % debian_package_name, shell=True)
-
-                    ## PIP package
-                    for pip_package_name in self.pip_package_name_list:
-                        try:
-                            pkg_resources.get_distribution(pip_package_name)
-                            Color.pl("  {*} PIP's package '%s' already intsalled." % pip_package_name)
-
-                        except pkg_resources.DistributionNotFound:
-                            Color.pl("  {-} Installing '%s' PIP's package..." % pip_package_name)
-                            Process.call("pip install %s" % pip_package_name, shell=True)
-
                     # GitPy installation
                     if os.path.isdir(self.INSTALL_PATH):
                         Color.pl("  {$} A GitPy instance already exist in {C}%s{W}." % self.INSTALL_PATH)
@@ -393,130 +379,17 @@ class Installer:
                         else:
                             choice_2 = input(Color.s("  {?} Do you want to replace it? [Y/n]: "))
 
-                        if choice_2.lower() == "y" or not choice_2:
-                            Color.pl("  {-} Deleting current GitPy files...")
-
-                            if Configuration.verbose == 3:
-                                Color.pl("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(%s){W}" % self.INSTALL_PATH)
-
-                            shutil.rmtree(self.INSTALL_PATH)
-
-                            if os.path.isdir(self.TEMP_PATH):
-                                if Configuration.verbose == 3:
-                                    Color.pl("  {§} GitPy's temporary folder detected.")
-                                    Color.pl("  {§} Remove it...")
-                                    Color.pl("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.TEMP_PATH){W}")
-
-                                shutil.rmtree(self.TEMP_PATH)
-
-                        else:
+                        if choice_2.lower() != "y" and choice_2:
                             Color.pl(
                                 "  {!} You must remove the current GitPy files by yourself for continue the install process!"
                             )
-                            # Exit and removing the python cache
+                            # Exit
                             exit_tool(1, pwd=self.pwd)
 
-                    ## GitPy files
-                    Color.pl("  {-} Installing GitPy files...")
-
-                    ### Create the main directory of GitPy
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Creating main folder ({C}%s{W})..." % self.INSTALL_PATH)
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.makedirs(INSTALL_PATH, mode=0o777){W}")
-
-                    os.makedirs(self.INSTALL_PATH, mode=0o777)
-
-                    ### Create the temp folder that be use to download the latest GitPy version from GitHub
-                    ### in it and install GitPy from this folder
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Creating temporary folder ({C}%s{W})..." % self.TEMP_PATH)
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.TEMP_PATH, mode=0o777){W}")
-
-                    os.makedirs(self.TEMP_PATH, mode=0o777)
-
-                    ### Clone the latest version of GitPy into the temp. folder
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Cloning files from GitHub to the temporary directory...")
-                    Process.call(
-                        "git clone %s --verbose --branch %s %s"
-                        % (self.REPO_CLONE_URL, self.REPO_BRANCH, self.TEMP_PATH),
-                        shell=True,
-                    )
-
-                    ### Install GitPy by moving all the files from the temp. folder to the main folder
-                    if Configuration.verbose == 3:
-                        Color.pl(
-                            "  {§} Copying all files from the GitPy's temporary folder to the main directory ({C}%s{W})..."
-                            % self.INSTALL_PATH
-                        )
-                        Color.pl(
-                            "   {SY1}╰──╼{W} Python: {SY1}shutil.copytree(src=self.TEMP_PATH, dst=INSTALL_PATH, dirs_exist_ok=True){W}"
-                        )
-                    shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
-
-                    ### Create the command 'gitpy' in /usr/bin
-                    ### If a file called 'gitpy' already exist, inform the user and delete it
-                    if os.path.isfile(self.BIN_PATH + "gitpy"):
-                        if Configuration.verbose == 3:
-                            Color.pl("  {§} The gitpy command already exist in {C}%s{W}" % self.BIN_PATH)
-                            Color.pl("  {§} Remove it...")
-                            Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + 'gitpy'){W})")
-                        os.remove(self.BIN_PATH + "gitpy")
-
-                    else:
-                        pass
-
-                    # Create the command 'gitpy' in /usr/bin/
-                    Color.pl("  {-} Create the {G}gitpy{W} command into {C}%s{W}..." % self.BIN_PATH)
-
-                    # Create and write the 'gitpy' file into /usr/bin/
-                    with open(self.BIN_PATH + "gitpy", "x") as gitpy_file:
-                        gitpy_file.write(gitpy_command_bin)
-
-                    ### Apply rights on files
-                    Color.pl("  {-} Apply rights to the new files...")
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Python: {SY1}sleep(1){W}")
-
-                    sleep(1)
-
-                    Process.call("chmod 777 %sgitpy" % self.BIN_PATH, shell=True)
-                    Process.call("chmod 777 -R %s" % self.INSTALL_PATH, shell=True)
-
-                    # Deleting the temporary directory
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Remove the temporary directory ({C}%s{W})..." % self.TEMP_PATH)
-
-                    shutil.rmtree(self.TEMP_PATH)
-
-                    if Configuration.verbose == 3:
-                        Color.pl("  {#} Python: {SY1}sleep(1){W}")
-
-                    sleep(1)
-
-                    # Create the environment variable
-                    if Configuration.verbose == 3:
-                        Color.pl(
-                            "  {§} Create the {C}{bold}%s{W} environment variable..."
-                            % self.gitpy_install_path_env_var_name
-                        )
-                        Color.pl("  {§} Call the {P}set_env_var(){W} function.")
-                        Color.pl(
-                            "   {SY1}╰──╼{W} Python: {SY1}set_env_var(name=self.gitpy_install_path_env_var_name, value=self.gitpy_install_path_env_var_value){W}"
-                        )
-
-                    ## The environment variable is used to know where GitPy is installed
-                    set_env_var(
-                        var_name=self.gitpy_install_path_env_var_name, var_value=self.gitpy_install_path_env_var_value
-                    )
-
-                    # if Configuration.verbose == 3:
-                    #     Color.pl('  {§} Create the {C}{bold}%s{W} environment variable...' % self.gitpy_path_notification_config_file_env_var_name)
-                    #     Color.pl('  {§} Call the {P}set_env_var(){W} function.')
-                    #     Color.pl('   {SY1}╰──╼{W} Python: {SY1}set_env_var(name=self.gitpy_path_notification_config_file_env_var_name, value=self.gitpy_path_notification_config_file_env_var_value){W}')
+                    if args.skip_update:
+                        Color.pl("  {*} System update skiped.")
 
-                    # ## The environment variable is used to know where the News Version Notification config file is
-                    # set_env_var(var_name=self.gitpy_path_notification_config_file_env_var_name, var_value=self.gitpy_path_notification_config_file_env_var_value)
+                    self.install_steps(args, based_distro, gitpy_command_bin).run()
 
                     # -------------------- [ FINISH ] -------------------- #
                     Color.pl("  {+} GitPy are successfully installed on your system.")
@@ -524,25 +397,23 @@ class Installer:
                     reboot = input(Color.s("  {?} Do you want to reboot your machine now? [y/N]: "))
 
                     if reboot.lower() == "y":
-                        # Removing the python cache
-                        remove_python_cache(pwd=pwd)
                         Color.pl("  {-} Rebooting the machine...")
                         Process.call("reboot", shell=True)
 
                     else:
                         Color.pl("  {*} Now you can run the command {G}gitpy{W} anywhere in the terminal.")
-                        # Exit and removing the python cache
+                        # Exit
                         exit_tool(0, pwd=self.pwd)
 
                 except KeyboardInterrupt:
                     Color.pl("\n  {!} Installation process interrupted.")
                     Color.pl("  {*} You must re-run the installation process to install GitPy correctly.")
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1, pwd=self.pwd)
 
             else:
                 Color.pl("  {*} Aborted")
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=self.pwd)
 
 
@@ -552,10 +423,10 @@ def entry_point(args, pwd):
 
     except EOFError:
         Color.pl("\n  {*} Aborted")
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1, pwd=pwd)
 
     except KeyboardInterrupt:
         Color.pl("\n  {*} Aborted")
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1, pwd=pwd)
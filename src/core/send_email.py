@@ -38,50 +38,19 @@ import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
-import requests
-
 ## Third party libraries
 from src.util.colors import Color
+from src.util.commit_checker import Commit_Checker
 
 
 # Functions section
-def check_for_new_commit(repo_owner, repo_name, current_sha):
-    """
-    Check whether a GitHub repository has a new commit using the GitHub API.
-
-    Parameters:
-        repo_owner (str): The username or organization that owns the repository.
-        repo_name (str): The name of the repository.
-        current_sha (str): The SHA hash of the current commit to compare against.
-
-    Returns:
-        bool: True if there is a new commit, False otherwise.
-    """
-
-    # Build the URL for the API call
-    url = "https://api.github.com/repos/%s/%s/commits" % (repo_owner, repo_name)
-
-    # Send a GET request to the API with the appropriate headers
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    response = requests.get(url, headers=headers)
-
-    # Check the response status code
-    if response.status_code != 200:
-        raise Exception(f"Request failed with status code {response.status_code}")
-
-    # Parse the JSON response and get the SHA hash of the latest commit
-    latest_sha = response.json()[0]["sha"]
-
-    # Compare the latest SHA hash to the current one
-    if latest_sha != current_sha:
-        return True
-    else:
-        return False
-
-
-def send_email():
+def send_email(workers=None):
     """
     Send a email via SMTP server
+
+    Arguments:
+        workers (int): The maximum number of repositories checked at the same time
+                       (default: Configuration.CHECK_REPO_WORKERS)
     """
 
     # Variables
@@ -96,24 +65,32 @@ def send_email():
     # Get the sections
     sections = config.sections()
 
+    # Check if the subsripted repos (in the sections name) have a new version (if the repo got a new commit)
+    # using the GitHub API. All the repos are checked at once, the results keep the order of the sections.
+    repos = [(section, config[section]) for section in sections]
+    results = Commit_Checker(workers=workers).check_all(repos)
+
     # Get all sections
-    for section in sections:
-        # Initialise a SMTP connection
-        smtp_server = config.get(section, "smtp_server")
-        smtp_port = config.get(section, "smtp_port")
-        smtp_username = config.get(section, "smtp_username")
-        # smtp_password_env_var_name = os.environ[config.get(section, 'smtp_password')]
-        # print(smtp_password_env_var_name)
-        smtp_password = os.environ[config.get(section, "smtp_password")]
-        # print(smtp_password) # for debugging
-        receiver_email = config.get(section, "receiver_email_address")
+    for result in results:
+        section = result.section
         github_repo_name = config.get(section, "github_repo_name")
-        github_repo_owner = config.get(section, "github_repo_owner")
         github_repo_url = config.get(section, "github_repo_url")
-        current_commit_sha = config.get(section, "current_commit_sha")
 
-        # Check if the subsripted repo (in the section name) have a new version (if the repo got a new commit) using the GitHub API
-        if check_for_new_commit(github_repo_owner, github_repo_name, current_commit_sha) is True:
+        if result.error is not None:
+            Color.pl("  {!} Cannot check if a new version of {G}%s{W} is available: %s" % (github_repo_name, result.error))
+            continue
+
+        if result.new_commit is True:
+            # Initialise a SMTP connection
+            smtp_server = config.get(section, "smtp_server")
+            smtp_port = config.get(section, "smtp_port")
+            smtp_username = config.get(section, "smtp_username")
+            # smtp_password_env_var_name = os.environ[config.get(section, 'smtp_password')]
+            # print(smtp_password_env_var_name)
+            smtp_password = os.environ[config.get(section, "smtp_password")]
+            # print(smtp_password) # for debugging
+            receiver_email = config.get(section, "receiver_email_address")
+
             # Create the email message
             message = MIMEMultipart()
             message["From"] = "GitPy Notification <%s>" % smtp_username
@@ -36,7 +36,6 @@ import platform
 import shutil
 import subprocess
 import sys
-from time import sleep
 
 ## Third party libraries
 from src.__main__ import GitPy
@@ -45,8 +44,8 @@ from src.util.based_distro import Based_Distro
 from src.util.colors import Color
 from src.util.env_var import remove_env_var
 from src.util.exit_tool import exit_tool
+from src.util.pipeline import Pipeline
 from src.util.process import Process
-from src.util.remove_python_cache import remove_python_cache
 
 
 # Main
@@ -68,6 +67,48 @@ class Uninstaller:
     ## The News Version Notification's config file
     gitpy_notification_config_file_env_var_name = Configuration.gitpy_notification_config_file_env_var_name
 
+    def uninstall_steps(self, quiet=False):
+        """
+        The steps of the uninstallation of GitPy.
+
+        Arguments:
+            quiet (bool): Don't show the messages of the steps.
+
+        Returns:
+            Pipeline: The steps, ready to run.
+        """
+
+        def remove_files():
+            ## ------ [ Remove the main folder ] ------ ##
+            if Configuration.verbose == 3:
+                Color.pl("  {§} Removing the {C}%s{W} folder..." % self.INSTALL_PATH)
+                Color.pl("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.INSTALL_PATH){W}")
+            shutil.rmtree(self.INSTALL_PATH)
+
+        def remove_command():
+            ## ------ [ Remove the 'gitpy' command ] ------ ##
+            if Configuration.verbose == 3:
+                Color.pl("  {§} Removing the {C}%sgitpy{W} file..." % self.BIN_PATH)
+                Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + 'gitpy'){W}")
+            os.remove(self.BIN_PATH + "gitpy")
+
+        def remove_install_path_env_var():
+            ## ------ [ Remove the 'GITPY_INSTALL_PATH' environment variable ] ------ ##
+            if Configuration.verbose == 3:
+                Color.pl("  {§} Removing the {C}{bold}GITPY_INSTALL_PAT{W} environment variable...")
+                Color.pl("   {SY1}╰──╼{W} Python: {SY1}remove_env_var(self.gitpy_install_path_env_var_name){W}")
+            remove_env_var(var_name=self.gitpy_install_path_env_var_name)
+
+            # Remove the GITPY_NOTIFICATION_CONFIG_FILE_PATH environment variable
+            # remove_env_var(var_name=self.gitpy_notification_config_file_env_var_name)
+
+        steps = Pipeline("Uninstallation", quiet=quiet)
+        steps.add("remove_files", remove_files, message="Uninstalling GitPy from your system...")
+        steps.add("remove_command", remove_command, requires=("remove_files",))
+        steps.add("remove_env_var", remove_install_path_env_var, requires=("remove_command",))
+
+        return steps
+
     # Main
     def __init__(self, args, pwd):
         if not args.quiet:
@@ -78,30 +119,27 @@ class Uninstaller:
         if Configuration.verbose == 3:
             Color.pl("  {§} Checking if the user's platform is a Linux machine or not...")
             Color.pl("   {SY1}├──╼{W} Python: {SY1}platform.system() != Linux{W}")
-            sleep(0.2)
 
         if platform.system() != "Linux":
             if Configuration.verbose == 3:
                 Color.pl("   {SY1}├──╼{W} The user's platform is {R}%s{W}" % platform.system())
                 Color.pl("   {SY1}╰──╼{W} The user's platform is not a Linux machine.")
-                sleep(0.2)
 
             Color.pl("  {!} You tried to run GitPy on a non-linux machine!")
             Color.pl("  {*} GitPy can be run only on a Linux kernel.")
 
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1, pwd=pwd)
 
         else:
             if Configuration.verbose == 3:
                 Color.pl("   {SY1}╰──╼{W} The user's platform is {C}%s{W}" % platform.system())
-                sleep(0.2)
 
             if os.getuid() != 0:
                 Color.pl("  {!} The GitPy Uninstaller must be run as root.")
                 Color.pl("  {*} Re-run with sudo or switch to root user.")
 
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
 
             else:
@@ -118,7 +156,7 @@ class Uninstaller:
                     Color.pl("  {!} You're not running Arch or Debian variant.")
                     Color.pl("  {*} GitPy can only run on Arch or Debian based distros.")
 
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1, pwd=pwd)
 
         if args.quiet:  # -------------------- [ Quiet uninstallation ] -------------------- #
@@ -132,22 +170,12 @@ class Uninstaller:
                 Color.pl(
                     "Because the {C}{bold}%s{W} environment variable is not set." % self.gitpy_install_path_env_var_name
                 )
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
 
-            # Remove the main folder
-            shutil.rmtree(self.INSTALL_PATH)
-
-            # Remove the 'gitpy' command
-            os.remove(self.BIN_PATH + "gitpy")
-
-            # Remove the GITPY_INSTALL_PAT environment variable
-            remove_env_var(var_name=self.gitpy_install_path_env_var_name)
-
-            # Remove the GITPY_NOTIFICATION_CONFIG_FILE_PATH environment variable
-            # remove_env_var(var_name=self.gitpy_notification_config_file_env_var_name)
+            self.uninstall_steps(quiet=True).run()
 
-            # Exit and removing the python cache
+            # Exit
             exit_tool(0, pwd=pwd)
 
         else:  # -------------------- [ No quiet uninstallation ] -------------------- #
@@ -182,7 +210,7 @@ class Uninstaller:
                     "  {*} Because the {C}{bold}%s{W} environment variable is not set."
                     % self.gitpy_install_path_env_var_name
                 )
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
 
             # Inform the user what the uninstaller will do
@@ -209,26 +237,7 @@ class Uninstaller:
             # ---------- [ GitPy uninstallation ] ---------- #
             if choice_1.lower() == "y" or not choice_1:
                 try:
-                    Color.pl("  {-} Uninstalling GitPy from your system...")
-
-                    ## ------ [ Remove the main folder ] ------ ##
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Removing the {C}%s{W} folder..." % self.INSTALL_PATH)
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.self.INSTALL_PATH){W}")
-                    shutil.rmtree(self.INSTALL_PATH)
-
-                    ## ------ [ Remove the 'gitpy' command ] ------ ##
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Removing the {C}%sgitpy{W} file..." % self.BIN_PATH)
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + 'gitpy'){W}")
-                    os.remove(self.BIN_PATH + "gitpy")
-
-                    ## ------ [ Remove the 'GITPY_INSTALL_PATH' environment variable ] ------ ##
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Removing the {C}{bold}GITPY_INSTALL_PAT{W} environment variable...")
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}remove_env_var(self.gitpy_install_path_env_var_name){W}")
-
-                    remove_env_var(var_name=self.gitpy_install_path_env_var_name)
+                    self.uninstall_steps().run()
 
                     Color.pl("  {*} GitPy are successfully uninstalled from your system.")
                     Color.pl(
@@ -237,23 +246,21 @@ class Uninstaller:
                     )
                     choice_2 = input(Color.s("  {?} Do you want to reboot your machine now? [y/n]: "))
                     if choice_2.lower() == "y":
-                        # Removing the python cache
-                        remove_python_cache(pwd=pwd)
                         Color.pl("  {-} Rebooting the machine...")
                         Process.call("reboot", shell=True)
                     else:
-                        # Exit and removing the python cache
+                        # Exit
                         exit_tool(0, pwd=pwd)
 
                 except KeyboardInterrupt:
                     Color.pl("\n  {!} Uninstallation process interrupted.")
                     Color.pl("  {*} You must re-run the uninstalation process to uninstall GitPy correctly.")
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1, pwd=pwd)
 
             else:
                 Color.pl("  {*} Aborted")
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
 
 
@@ -263,10 +270,10 @@ def entry_point(args, pwd):
 
     except EOFError:
         Color.pl("\n  {*} Aborted")
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1, pwd=pwd)
 
     except KeyboardInterrupt:
         Color.pl("\n  {*} Aborted")
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1, pwd=pwd)
@@ -34,26 +34,28 @@
 # Imports section
 import os
 import platform
-import shutil
 import subprocess
 import sys
 from json import loads
-from time import sleep
 
 from src.__main__ import GitPy
 
 ## Third party libraries
 from src.config import Configuration
+from src.core.installer import Installer
 from src.tools.packaging import version
-from src.tools.requests import get
 from src.util.based_distro import Based_Distro
 from src.util.clear import clear
 from src.util.colors import Color
 from src.util.create_bin_file import Create_bin_file
 from src.util.exit_tool import exit_tool
 from src.util.github_repo import GitHub_Repo
+from src.util.http_client import HTTP_Client
 from src.util.internet_check import internet_check
+from src.util.pipeline import Pipeline
+from src.util.precompile import precompile
 from src.util.process import Process
+from src.util.staged_install import Staged_Install
 
 
 # Main
@@ -65,7 +67,6 @@ class Updater:
     # Variables
     DEFAULT_INSTALL_PATH = Configuration.DEFAULT_INSTALL_PATH
     BIN_PATH = Configuration.BIN_PATH
-    TEMP_PATH = Configuration.TEMP_PATH
     INSTALL_PATH = DEFAULT_INSTALL_PATH
     VERSION = Configuration.VERSION
 
@@ -83,6 +84,81 @@ class Updater:
 
     # cp_online_ver = None
 
+    def update_steps(self, based_distro, gitpy_command_bin, quiet=False):
+        """
+        The steps of the update of GitPy.
+        The new version is cloned next to the current one, which is kept until the end
+        of the update and put back if a step fails (see 'Staged_Install').
+
+        Arguments:
+            based_distro (str): 'Arch' or 'Debian'.
+            gitpy_command_bin (str): The content of the 'gitpy' command.
+            quiet (bool): Don't show the messages of the steps.
+
+        Returns:
+            Pipeline: The steps, ready to run.
+        """
+
+        # The new version is cloned next to the install folder, then takes its place
+        staged = Staged_Install(self.INSTALL_PATH)
+
+        def update_command():
+            # The 'gitpy' command in /usr/bin/ is replaced
+            if os.path.isfile(self.BIN_PATH + "gitpy"):
+                os.remove(self.BIN_PATH + "gitpy")
+
+            with open(self.BIN_PATH + "gitpy", "x") as gitpy_file:
+                gitpy_file.write(gitpy_command_bin)
+
+            os.chmod(self.BIN_PATH + "gitpy", Configuration.INSTALL_FILES_MODE)
+
+        steps = Pipeline("Update", quiet=quiet)
+        steps.add(
+            "download",
+            # The latest version of GitPy is cloned in the staging folder
+            lambda: staged.clone(self.REPO_CLONE_URL, self.REPO_BRANCH),
+            # The clone is usable once its files are there
+            ready=lambda: os.path.isfile(staged.staging_path + "/gitpy.py"),
+            message=Color.s("Downloading the latest GitPy's version into {C}%s{W}..." % staged.staging_path),
+        )
+        steps.add(
+            "precompile",
+            # The bytecode is kept between the runs of GitPy, it's compiled once here
+            lambda: precompile(staged.staging_path),
+            requires=("download",),
+            message="Compiling the python files of GitPy...",
+        )
+        steps.add(
+            "apply_rights",
+            lambda: staged.apply_rights(staged.staging_path),
+            requires=("download", "precompile"),
+            message="Apply rights to the new files...",
+        )
+        steps.add(
+            "install_files",
+            staged.swap,
+            requires=("apply_rights",),
+            message=Color.s("Updating GitPy into {C}%s{W}..." % self.INSTALL_PATH),
+            # The previous version is put back if a next step fails
+            undo=staged.rollback,
+        )
+        steps.add(
+            "install_packages",
+            # The packages needed by the new version and not installed yet
+            lambda: Installer.install_packages(based_distro, quiet=quiet),
+            requires=("install_files",),
+            message="Checking the dependencies of GitPy...",
+        )
+        steps.add(
+            "update_command",
+            update_command,
+            requires=("install_files",),
+            message=Color.s("Updating the {G}gitpy{W} command into {C}%s{W}..." % self.BIN_PATH),
+        )
+        steps.add("remove_previous_version", staged.commit, requires=("install_packages", "update_command"))
+
+        return steps
+
     # Main
     def __init__(self, args, pwd):
         # Check if the user's platform is a Linux machine or not
@@ -92,7 +168,7 @@ class Updater:
             Color.pl("  {!} You tried to run GitPy on a non-linux machine!")
             Color.pl("  {*} GitPy can be run only on a Linux kernel.")
 
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1, pwd=pwd)
 
         else:
@@ -103,7 +179,7 @@ class Updater:
                 Color.pl("  {!} The GitPy Updater must be run as root.")
                 Color.pl("  {*} Re-run with sudo or switch to root user.")
 
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
 
             else:
@@ -121,7 +197,7 @@ class Updater:
                     print()
                     Color.pl("  {!} You're not running Arch or Debian variant.")
                     Color.pl("  {*} GitPy can only run on Arch or Debian based distros.")
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1, pwd=pwd)
 
             # gitpy main file in /usr/bin/
@@ -164,14 +240,14 @@ class Updater:
                     Color.pl(
                         "No Internet connexion found, please check if you are connected to the Internet and retry."
                     )
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1, pwd=pwd)
 
                 ## Check if the GitPy repositorie on GitHub are reachable or not
                 GitHub_Repo.is_reachable(args)
 
                 ## Check if the GitPy version is up to date or not
-                rqst = get("%s" % self.REPO_METADATA_URL, timeout=5)
+                rqst = HTTP_Client.get("%s" % self.REPO_METADATA_URL, timeout=5)
                 fetch_sc = rqst.status_code
 
                 if fetch_sc == 200:
@@ -184,56 +260,12 @@ class Updater:
 
                     else:
                         Color.pl("  {!} You already have the latest version of GitPy!")
-                        # Exit and removing the python cache
+                        # Exit
                         exit_tool(1, pwd=pwd)
 
-                sleep(0.5)
-
-                # Prepare the update
-
-                # If a file called 'gitpy' already exist in /usr/bin/, inform the user and delete it
-                if os.path.isfile(self.BIN_PATH + "gitpy"):
-                    os.remove(self.BIN_PATH + "gitpy")
-
-                # Remove the temporary directory if it already exists
-                if os.path.isdir(self.TEMP_PATH):
-                    shutil.rmtree(self.TEMP_PATH)
-
-                # Create the temp folder that be use to download the latest GitPy version from GitHub
-                # in it and install GitPy from this folder
-                os.makedirs(self.TEMP_PATH, mode=0o777)
-
-                # Remove the current GitPy instance
-                shutil.rmtree(self.INSTALL_PATH)
-
-                # Create the main folder where GitPy will be installed
-                os.makedirs(self.INSTALL_PATH, mode=0o777)
-
-                # Clone the latest version of GitPy into the temp. folder
-                Process.call(
-                    "git clone %s --branch %s %s" % (self.REPO_CLONE_URL, self.REPO_BRANCH, self.TEMP_PATH), shell=True
-                )
-                sleep(1)
-
-                # GitPy Update
-                # Install GitPy by moving all the files from the temp. folder to the main folder
-                shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
-
-                # Update the command 'gitpy' in /usr/bin/
-                with open(self.BIN_PATH + "gitpy", "x") as gitpy_file:
-                    gitpy_file.write(gitpy_command_bin)
-
-                # Apply rights on files
-                sleep(1)
+                self.update_steps(based_distro, gitpy_command_bin, quiet=True).run()
 
-                Process.call("chmod 777 %sgitpy" % self.BIN_PATH, shell=True)
-                Process.call("chmod 777 -R %s" % self.INSTALL_PATH, shell=True)
-
-                # Deleting the temporary directory
-                shutil.rmtree(self.TEMP_PATH)
-                sleep(1)
-
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(0, pwd=pwd)
 
             except Exception as E:
@@ -242,7 +274,7 @@ class Updater:
             except KeyboardInterrupt:
                 Color.pl("\nUpdate process interrupted.")
                 Color.pl("You must re-run the update process to update GitPy correctly.")
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
         else:
             # -------------------- [ No quiet installation ] -------------------- #
@@ -305,7 +337,7 @@ class Updater:
                 Color.pl(
                     "  {!} No Internet connexion found, please check if you are connected to the Internet and retry."
                 )
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
 
             ## ---------- [ Check if the GitPy repositorie on GitHub are reachable or not ] ---------- ##
@@ -318,10 +350,10 @@ class Updater:
             Color.pl(
                 """  {*} {underscore}This tool will{W}:
                     \r     {D}[{W}{LL}1{W}{D}]{W} Download the latest version of GitPy into {C}%s{W}.
-                    \r     {D}[{W}{LL}2{W}{D}]{W} Update the current GitPy instance with the new one.
-                    \r     {D}[{W}{LL}3{W}{D}]{W} Apply all rights on the new files.
+                    \r     {D}[{W}{LL}2{W}{D}]{W} Apply all rights on the new files.
+                    \r     {D}[{W}{LL}3{W}{D}]{W} Replace the current GitPy instance with the new one, the current one is put back if the update fails.
             """
-                % self.TEMP_PATH
+                % Staged_Install(self.INSTALL_PATH).staging_path
             )
             if args.no_confirm:
                 Color.pl("  {?} Do you want to continue? [Y/n]: y")
@@ -331,7 +363,7 @@ class Updater:
             if choice_1 == "y" or choice_1 == "Y" or not choice_1:
                 try:
                     Color.pl("  {-} Fetching metadata...")
-                    rqst = get("%s" % self.REPO_METADATA_URL, timeout=5)
+                    rqst = HTTP_Client.get("%s" % self.REPO_METADATA_URL, timeout=5)
                     fetch_sc = rqst.status_code
                     if fetch_sc == 200:
                         metadata = rqst.text
@@ -345,87 +377,12 @@ class Updater:
                                 )
                             else:
                                 Color.pl("  {!} You already have the latest version of GitPy!")
-                                # Exit and removing the python cache
+                                # Exit
                                 exit_tool(1, pwd=pwd)
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Python: {SY1}sleep(0.5){W}")
-                    sleep(0.5)
-
-                    # ---------- [ Prepare the update ] ---------- #
-                    # If a file called 'gitpy' already exist in /usr/bin/, inform the user and delete it
-                    if os.path.isfile(self.BIN_PATH + "gitpy"):
-                        if Configuration.verbose == 3:
-                            Color.pl("  {§} The gitpy command already exist in {C}%s{W}" % self.BIN_PATH)
-                            Color.pl("  {§} Remove it...")
-                            Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + 'gitpy'){W})")
-                        os.remove(self.BIN_PATH + "gitpy")
-                    # Remove the temporary directory if it already exists
-                    if os.path.isdir(self.TEMP_PATH):
-                        if args.verbose == 3:
-                            Color.pl("  {§} GitPy's temporary folder detected.")
-                            Color.pl("  {§} Remove it...")
-                            Color.pl("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.TEMP_PATH){W}")
-                        shutil.rmtree(self.TEMP_PATH)
-                    # Create the temp folder that be use to download the latest GitPy version from GitHub
-                    # in it and install GitPy from this folder
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Creating temporary folder ({C}%s{W})..." % self.TEMP_PATH)
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.TEMP_PATH, mode=0o777){W}")
-                    os.makedirs(self.TEMP_PATH, mode=0o777)
-                    # Remove the current GitPy instance
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Deleting current GitPy instance...")
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(%s){W}" % self.INSTALL_PATH)
-                    shutil.rmtree(self.INSTALL_PATH)
-                    # Create the main folder where GitPy will be installed
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Creating main folder ({C}%s{W})..." % self.INSTALL_PATH)
-                        Color.pl("   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.INSTALL_PATH, mode=0o777){W}")
-                    os.makedirs(self.INSTALL_PATH, mode=0o777)
-                    # Clone the latest version of GitPy into the temp. folder
-                    Color.pl("  {-} Downloading the latest GitPy's version into {C}%s{W}..." % self.TEMP_PATH)
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Cloning files from GitHub to the temporary directory...")
-                    Process.call(
-                        "git clone %s --branch %s %s" % (self.REPO_CLONE_URL, self.REPO_BRANCH, self.TEMP_PATH),
-                        shell=True,
-                    )
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Python: {SY1}sleep(1){W}")
-                    sleep(1)
-
-                    #  ---------- [ GitPy Update ] ---------- #
-                    Color.pl("  {-} Updating GitPy into {C}%s{W}..." % self.INSTALL_PATH)
-                    # Install GitPy by moving all the files from the temp. folder to the main folder
-                    if Configuration.verbose == 3:
-                        Color.pl(
-                            "  {§} Copying all files from the GitPy's temporary folder to the main directory ({C}%s{W})..."
-                            % self.INSTALL_PATH
-                        )
-                        Color.pl(
-                            "   {SY1}╰──╼{W} Python: {SY1}shutil.copytree(src=self.TEMP_PATH, dst=INSTALL_PATH, dirs_exist_ok=True){W}"
-                        )
-                    shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
-                    # Update the command 'gitpy' in /usr/bin/
-                    Color.pl("  {-} Updating the {G}gitpy{W} command into {C}%s{W}..." % self.BIN_PATH)
-                    with open(self.BIN_PATH + "gitpy", "x") as gitpy_file:
-                        gitpy_file.write(gitpy_command_bin)
-                    # Apply rights on files
-                    Color.pl("  {-} Apply rights to the new files...")
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Python: {SY1}sleep(1){W}")
-                    sleep(1)
-                    Process.call("chmod 777 %sgitpy" % self.BIN_PATH, shell=True)
-                    Process.call("chmod 777 -R %s" % self.INSTALL_PATH, shell=True)
-                    # Deleting the temporary directory
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Remove the temporary directory ({C}%s{W})..." % self.TEMP_PATH)
-                    shutil.rmtree(self.TEMP_PATH)
-                    if Configuration.verbose == 3:
-                        Color.pl("  {§} Python: {SY1}sleep(1){W}")
-                    sleep(1)
+                    self.update_steps(based_distro, gitpy_command_bin).run()
+
                     Color.pl("  {*} GitPy successfully updated with the version: %s" % cp_online_ver)
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(0, pwd=pwd)
                 except Exception as E:
                     Color.pexception(E)
@@ -433,11 +390,11 @@ class Updater:
                 except KeyboardInterrupt:
                     Color.pl("\n  {!} Update process interrupted.")
                     Color.pl("  {!} You must re-run the update process to update GitPy correctly.")
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1, pwd=pwd)
             else:
                 Color.pl("  {*} Aborted")
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1, pwd=pwd)
 
 
@@ -446,9 +403,9 @@ def entry_point(args, pwd):
         Updater(args=args, pwd=pwd)
     except EOFError:
         Color.pl("\n  {*} Aborted")
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1, pwd=pwd)
     except KeyboardInterrupt:
         Color.pl("\n  {*} Aborted")
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1, pwd=pwd)
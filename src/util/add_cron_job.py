@@ -35,7 +35,11 @@
 # Imports section
 import sys
 
-from crontab import CronTab
+## Third party libraries
+from src.util.lazy_import import Lazy_Import
+
+# Imported when a job is added only
+CronTab = Lazy_Import("crontab", "CronTab")
 
 
 # Functions section
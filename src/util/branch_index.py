@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ branch_index.py            [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  A sorted index of the branches of a repository, with a prefix             #
+#  search used by the branch menu of the main console.                       #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+from bisect import bisect_left
+
+
+# Main
+class Branch_Index:
+    """
+    The names of the branches of a repository, sorted so a prefix search is two
+    binary searches instead of a scan of all the branches.
+    """
+
+    def __init__(self, names):
+        """
+        Arguments:
+            names (list): The names of the branches.
+        """
+        # Sorted by their lower case, so the search is case-insensitive
+        self.names = sorted(set(names), key=lambda name: (name.lower(), name))
+        self.keys = [name.lower() for name in self.names]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.search(name)
+
+    def search(self, prefix):
+        """
+        Get the branches whose name starts with a prefix.
+
+        Arguments:
+            prefix (str): The beginning of the name (case-insensitive), an empty prefix gives all the branches.
+
+        Returns:
+            list: The names of the matching branches, sorted.
+        """
+        prefix = prefix.lower()
+        start = bisect_left(self.keys, prefix)
+        # '\uffff' is after any character that can follow the prefix
+        end = bisect_left(self.keys, prefix + "\uffff", lo=start)
+
+        return self.names[start:end]
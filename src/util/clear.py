@@ -33,6 +33,7 @@
 # Imports section
 import os
 import subprocess
+import sys
 
 
 # Main
@@ -45,5 +46,8 @@ def clear():
     else:
         command = "clear"
 
+    # The buffered messages are shown before the screen is cleared
+    sys.stdout.flush()
+
     # Execute the command via the subprocess module
     subprocess.call(command, shell=True)
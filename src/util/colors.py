@@ -32,10 +32,9 @@
 
 # Import section
 import os
+import re
 import sys
-
-# Third party libraries
-from src.tools.colored.colored import attr, fg
+from functools import lru_cache
 
 
 # Main
@@ -46,6 +45,21 @@ class Color:
 
     last_sameline_length = 0
 
+    # A tag of a text: '{C}', '{bold}', '{+}', ...
+    TAG = re.compile(r"\{([A-Za-z0-9]+|[-+>*&#§!$?])\}")
+    # Number of texts kept with their output by 'Color.s()'
+    TEMPLATE_CACHE_SIZE = 1024
+    # The output of each tag, built by 'load_tags()'
+    tags = None
+    # False when the output is not a terminal, the tags are removed instead of colored
+    enabled = None
+    # The output of each tag without colors, used by 'strip()'
+    plain_tags = None
+    # An escape code already in a text
+    ANSI = re.compile(r"\033\[[0-9;]*m")
+    # The structured log of the messages ('Output_Log'), set by the '--log-file' option
+    log = None
+
     # Basic colors
     colors = {
         "W": "\033[0m",  # white (like 'reset')
@@ -78,20 +92,24 @@ class Color:
         "dark": "\033[2m",
         "italic": "\033[3m",
         "underscore": "\033[4m",
-        # Colored's PIP package color
-        # The 'S' is for 'Special'
-        "SG1": fg("#00FF80"),  # Green n°1
-        "SG2": fg("#00FF37"),  # Green n°2
-        "SY1": fg("#FFEB3B"),  # Yellow n°1
-        "SB1": fg("#2190B5"),  # Blue n°1
-        "SB2": fg("#1898CC"),  # Blue n°2
-        "SB3": fg("#00658E"),  # Darker Blue n°3
-        "SB4": fg("#1d9bf0"),  # Twitter's Blue n°4
-        "SGR1": fg("#777777"),  # Grey n°1
-        "SW1": fg("#FFFFFF"),  # White n°1 (real white)
-        "SW0": attr("reset"),  # Reset
     }
 
+    # Colored's PIP package color, added to 'colors' by 'load_special_colors()' when a text uses one
+    # of them in a terminal, so 'colored' is not imported by the outputs without these colors
+    # The 'S' is for 'Special'
+    special_colors = {
+        "SG1": "#00FF80",  # Green n°1
+        "SG2": "#00FF37",  # Green n°2
+        "SY1": "#FFEB3B",  # Yellow n°1
+        "SB1": "#2190B5",  # Blue n°1
+        "SB2": "#1898CC",  # Blue n°2
+        "SB3": "#00658E",  # Darker Blue n°3
+        "SB4": "#1d9bf0",  # Twitter's Blue n°4
+        "SGR1": "#777777",  # Grey n°1
+        "SW1": "#FFFFFF",  # White n°1 (real white)
+    }
+    special_colors_loaded = False
+
     # Helper string replacements
     replacements = {
         "{+}": "{W}{D}[{W}{G}+{W}{D}]{W}",  # Finished process
@@ -106,13 +124,114 @@ class Color:
         "{?}": "{W}{D}[{W}{C}?{W}{D}]{W}",  # Question
     }
 
+    @classmethod
+    def load_special_colors(cls):
+        """
+        Add the escape codes of the special colors to 'colors', once.
+        """
+        from src.tools.colored.colored import attr, fg
+
+        for key, hex_color in cls.special_colors.items():
+            cls.colors[key] = fg(hex_color)
+        cls.colors["SW0"] = attr("reset")  # Reset
+        cls.special_colors_loaded = True
+        cls.tags = None
+
+    @classmethod
+    def is_enabled(cls):
+        """
+        Returns:
+            bool: True if the tags are colored: the output is a terminal and 'NO_COLOR' is not set.
+        """
+        if cls.enabled is None:
+            cls.enabled = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+
+        return cls.enabled
+
+    @classmethod
+    def set_enabled(cls, enabled):
+        """
+        Color the tags or remove them, whatever the output is.
+        """
+        cls.enabled = enabled
+        cls.tags = None
+        cls.compile.cache_clear()
+
+    @classmethod
+    def build_tags(cls, enabled):
+        """
+        Build the output of each tag, the helper tags ('{+}', '{!}', ...) with their colors.
+
+        Arguments:
+            enabled (bool): False to remove the colors.
+
+        Returns:
+            dict: The output of each tag name.
+        """
+        names = list(cls.colors) + list(cls.special_colors) + ["SW0"]
+        colors = {name: cls.colors.get(name, "") if enabled else "" for name in names}
+
+        tags = dict(colors)
+        for key, value in cls.replacements.items():
+            tags[key[1:-1]] = cls.TAG.sub(lambda match: colors.get(match.group(1), match.group(0)), value)
+
+        return tags
+
+    @classmethod
+    def load_tags(cls):
+        """
+        Returns:
+            dict: The output of each tag name, for the current output.
+        """
+        cls.tags = cls.build_tags(cls.is_enabled())
+        return cls.tags
+
+    @classmethod
+    def strip(cls, text):
+        """
+        Returns a text without its tags and its escape codes, for a log file.
+        """
+        if cls.plain_tags is None:
+            cls.plain_tags = cls.build_tags(False)
+
+        text = cls.ANSI.sub("", text)
+        return cls.TAG.sub(lambda match: cls.plain_tags.get(match.group(1), match.group(0)), text)
+
+    @staticmethod
+    def tag_output(match):
+        """
+        Returns the output of a tag, an unknown tag is kept as it is.
+        """
+        name = match.group(1)
+
+        if not Color.special_colors_loaded and Color.is_enabled():
+            # '{§}' is colored with '{SY1}'
+            if name in Color.special_colors or name in ("SW0", "§"):
+                Color.load_special_colors()
+
+        tags = Color.tags or Color.load_tags()
+        return tags.get(name, match.group(0))
+
+    @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def compile(text):
+        """
+        Replace all the tags of a text in one pass, the outputs of the last texts are kept.
+        """
+        return Color.TAG.sub(Color.tag_output, text)
+
     @staticmethod
     def p(text):
         """
         Prints text using colored format on same line.
         """
+        if Color.log is not None:
+            Color.log.write(text)
+
         sys.stdout.write(Color.s(text))
-        sys.stdout.flush()
+        # A buffered output flushes on its own (see 'Output_Buffer')
+        if not getattr(sys.stdout, "coalescing", False):
+            sys.stdout.flush()
         if "\r" in text:
             text = text[text.rfind("\r") + 1 :]
             Color.last_sameline_length = len(text)
@@ -132,6 +251,9 @@ class Color:
         """
         Prints text using colored format with leading and trailing new line to STDERR.
         """
+        if Color.log is not None:
+            Color.log.write("%s\n" % text)
+
         sys.stderr.write(Color.s("%s\n" % text))
         Color.last_sameline_length = 0
 
@@ -140,12 +262,11 @@ class Color:
         """
         Returns colored string
         """
-        output = text
-        for key, value in Color.replacements.items():
-            output = output.replace(key, value)
-        for key, value in Color.colors.items():
-            output = output.replace("{%s}" % key, value)
-        return output
+        # Nothing to replace
+        if "{" not in text:
+            return text
+
+        return Color.compile(text)
 
     @staticmethod
     def clear_line():
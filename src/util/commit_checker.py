@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ commit_checker.py          [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Check the repositories of the notification config file for new            #
+#  commits, concurrently and over one shared connection pool.                #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.github_api import GitHub_API
+from src.util.http_cache import HTTP_Cache
+from src.util.http_client import HTTP_Client
+
+
+# Functions section
+def check_for_new_commit(repo_owner, repo_name, current_sha, branch=None, session=None, cache=None):
+    """
+    Check whether a GitHub repository has a new commit using the GitHub API.
+
+    Parameters:
+        repo_owner (str): The username or organization that owns the repository.
+        repo_name (str): The name of the repository.
+        current_sha (str): The SHA hash of the current commit to compare against.
+        branch (str): The branch to check (default: the default branch of the repository).
+        session (requests.Session): The session to send the request with (default: the shared session).
+        cache (HTTP_Cache): The cache used to send a conditional request (default: no cache).
+
+    Returns:
+        bool: True if there is a new commit, False otherwise.
+    """
+
+    # Get only the SHA hash of the latest commit of the branch
+    latest_sha = GitHub_API.latest_commit_sha(repo_owner, repo_name, branch=branch, session=session, cache=cache)
+
+    # Compare the latest SHA hash to the current one
+    if latest_sha != current_sha:
+        return True
+    else:
+        return False
+
+
+def fetch_latest_commits(repos, token, session=None):
+    """
+    Get the SHA hash of the latest commit of many repositories in one GraphQL query.
+
+    Parameters:
+        repos (list): The repositories, dicts with the 'github_repo_owner', 'github_repo_name'
+                      and (optional) 'github_repo_branch' keys.
+        token (str): The GitHub token, the GraphQL API cannot be used without it.
+        session (requests.Session): The session to send the request with (default: the shared session).
+
+    Returns:
+        list: The SHA hash of the latest commit of each repository, in the same order as 'repos'.
+              The SHA hash is None for the repositories that cannot be resolved (not found, unknown branch...).
+
+    Raises:
+        Exception: If the whole query failed.
+    """
+
+    if session is None:
+        session = HTTP_Client.session()
+
+    # One aliased field per repository: 'r0', 'r1', ...
+    fields = []
+    for index, repo in enumerate(repos):
+        branch = repo.get("github_repo_branch")
+        if branch:
+            target = "object(expression: %s) { oid }" % json.dumps(branch)
+        else:
+            target = "defaultBranchRef { target { oid } }"
+
+        fields.append(
+            "r%s: repository(owner: %s, name: %s) { %s }"
+            % (index, json.dumps(repo["github_repo_owner"]), json.dumps(repo["github_repo_name"]), target)
+        )
+
+    query = "query { %s }" % " ".join(fields)
+    headers = {"Authorization": "bearer %s" % token}
+
+    response = session.post(Configuration.GITHUB_GRAPHQL_URL, json={"query": query}, headers=headers)
+
+    # Check the response status code
+    if response.status_code != 200:
+        raise Exception(f"GraphQL request failed with status code {response.status_code}")
+
+    data = response.json().get("data")
+    if not data:
+        raise Exception("GraphQL request failed: %s" % response.json().get("errors"))
+
+    latest_shas = []
+    for index in range(len(repos)):
+        repository = data.get("r%s" % index) or {}
+
+        if "object" in repository:
+            target = repository["object"]
+        else:
+            target = (repository.get("defaultBranchRef") or {}).get("target")
+
+        latest_shas.append(target["oid"] if target else None)
+
+    return latest_shas
+
+
+# Class section
+class Check_Result:
+    """
+    The result of the check of one watched repository.
+
+    Attributes:
+        section (str): The section of the notification config file.
+        new_commit (bool): True if the repository has a new commit, None if the check failed.
+        error (Exception): The error raised during the check, if any.
+    """
+
+    def __init__(self, section, new_commit=None, error=None):
+        self.section = section
+        self.new_commit = new_commit
+        self.error = error
+
+
+class Commit_Checker:
+    """
+    Check many watched repositories for new commits at once.
+
+    The checks are sent by a bounded pool of workers that all share the same
+    connection pool, so the wall time of a run is close to the slowest request
+    instead of the sum of all of them. The results are always returned in the
+    order of the given repositories.
+
+    When a GitHub token is set, the repositories are checked by batches of
+    'Configuration.GRAPHQL_BATCH_SIZE' with one GraphQL query per batch. A batch
+    (or a repository of a batch) that cannot be checked with GraphQL falls back
+    to the REST API.
+    """
+
+    def __init__(self, workers=None):
+        """
+        Arguments:
+            workers (int): The maximum number of concurrent checks
+                           (default: Configuration.CHECK_REPO_WORKERS).
+        """
+        if not workers or workers < 1:
+            workers = Configuration.CHECK_REPO_WORKERS
+
+        self.workers = workers
+
+        # The shared connection pool, large enough to keep a connection per worker alive
+        self.session = HTTP_Client.session(pool_maxsize=self.workers)
+
+        # The ETag/Last-Modified of the previous run, so unchanged repositories cost a '304 Not Modified'
+        self.cache = HTTP_Cache()
+
+        # Without token, only the REST API can be used
+        self.token = Configuration.get_github_token()
+
+    def check(self, section, repo):
+        """
+        Check one repository.
+
+        Arguments:
+            section (str): The section of the notification config file.
+            repo (dict): The 'github_repo_owner', 'github_repo_name' and 'current_commit_sha' of the repository.
+
+        Returns:
+            Check_Result: The result of the check.
+        """
+        try:
+            new_commit = check_for_new_commit(
+                repo["github_repo_owner"],
+                repo["github_repo_name"],
+                repo["current_commit_sha"],
+                branch=repo.get("github_repo_branch"),
+                session=self.session,
+                cache=self.cache,
+            )
+            return Check_Result(section, new_commit=new_commit)
+
+        except Exception as e:
+            return Check_Result(section, error=e)
+
+    def check_batch(self, batch):
+        """
+        Check a batch of repositories with one GraphQL query.
+
+        Arguments:
+            batch (list): A list of (section, repo) tuples, see the 'check()' method.
+
+        Returns:
+            list: The Check_Result of each repository, in the same order as 'batch'.
+                  None for the repositories that must be checked with the REST API.
+        """
+        try:
+            latest_shas = fetch_latest_commits([repo for section, repo in batch], self.token, session=self.session)
+
+        except Exception as e:
+            if Configuration.verbose == 3:
+                Color.pl("  {§} The GraphQL query failed, the batch will be checked with the REST API...")
+                Color.pl("   {SY1}╰──╼{W} Error: {SY1}%s{W}" % e)
+            return [None] * len(batch)
+
+        results = []
+        for (section, repo), latest_sha in zip(batch, latest_shas):
+            if latest_sha is None:
+                # Not resolved by GraphQL, the REST API gives the reason
+                results.append(None)
+            else:
+                results.append(Check_Result(section, new_commit=latest_sha != repo["current_commit_sha"]))
+
+        return results
+
+    def check_all(self, repos):
+        """
+        Check all the repositories concurrently.
+
+        Arguments:
+            repos (list): A list of (section, repo) tuples, see the 'check()' method.
+
+        Returns:
+            list: The Check_Result of each repository, in the same order as 'repos'.
+        """
+        if Configuration.verbose == 3:
+            Color.pl("  {§} Checking %s repositories with %s workers..." % (len(repos), self.workers))
+            Color.pl("   {SY1}╰──╼{W} Python: {SY1}ThreadPoolExecutor(max_workers=%s).map(...){W}" % self.workers)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                # 'map()' yields the results in the order of the submitted repositories
+                if self.token:
+                    size = Configuration.GRAPHQL_BATCH_SIZE
+                    batches = [repos[i : i + size] for i in range(0, len(repos), size)]
+                    results = [result for results in executor.map(self.check_batch, batches) for result in results]
+                else:
+                    results = [None] * len(repos)
+
+                # The REST API for the repositories not checked with GraphQL
+                remaining = [index for index, result in enumerate(results) if result is None]
+                for index, result in zip(remaining, executor.map(lambda i: self.check(*repos[i]), remaining)):
+                    results[index] = result
+
+                return results
+
+        finally:
+            self.cache.save()
@@ -38,8 +38,6 @@ import configparser
 # Imports section
 import os
 
-import requests
-
 ## Third party imports
 from src.config import Configuration
 from src.core.send_email import send_email
@@ -132,6 +130,7 @@ class Email_Utils:
         smtp_username,
         smtp_password,
         current_commit_sha,
+        clone_options=None,
     ):
         GITPY_PATH = os.environ[Configuration.gitpy_install_path_env_var_name]
         INSTALL_PATH = GITPY_PATH
@@ -155,6 +154,11 @@ class Email_Utils:
         config.set(github_repo_name, "github_repo_api_url", github_repo_api_url)
         config.set(github_repo_name, "current_commit_sha", current_commit_sha)
 
+        # The clone options used to download the repository, for its next downloads
+        if clone_options is not None:
+            for key, value in clone_options.to_section().items():
+                config.set(github_repo_name, key, value)
+
         config.set(github_repo_name, "receiver_email_address", receiver_email_address)
 
         config.set(github_repo_name, "smtp_server", smtp_server)
@@ -40,7 +40,9 @@ from src.util.colors import Color
 # Function section
 def exit_tool(code, pwd):
     """
-    Exit and removing the python cache with a message if verbose was applied
+    Exit with a message if verbose was applied.
+    The python cache is kept, so the next run doesn't compile GitPy again
+    (see 'gitpy --remove-cache' to delete it).
 
     Args:
         code (int): The exit code
@@ -48,11 +50,7 @@ def exit_tool(code, pwd):
 
     """
     from src.config import Configuration
-    from src.util.remove_python_cache import remove_python_cache
 
-    if not pwd:
-        pwd = Configuration.pwd
-    remove_python_cache(pwd=pwd)
     if Configuration.verbose == 3:
         if code == 0:
             Color.pl("  {§} Exiting with the exit code: {G}0{W}")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ github_api.py              [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  The requests sent to the GitHub's REST API by GitPy.                      #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import codecs
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, quote, urlparse
+
+## Third party libraries
+from src.config import Configuration
+from src.util.http_client import HTTP_Client
+
+
+# Main
+class GitHub_API:
+    """
+    The requests sent to the GitHub's REST API.
+    Each one asks only for the data GitPy needs.
+    """
+
+    @staticmethod
+    def latest_commit_sha(owner, repo, branch=None, session=None, cache=None):
+        """
+        Get the SHA hash of the latest commit of a branch.
+
+        The commit is asked with the 'application/vnd.github.sha' media type, so GitHub
+        answers with the 40 characters of the SHA hash instead of the JSON of the commits.
+
+        Arguments:
+            owner (str): The username or organization that owns the repository.
+            repo (str): The name of the repository.
+            branch (str): The branch (default: the default branch of the repository).
+            session (requests.Session): The session to send the request with (default: the shared session).
+            cache (HTTP_Cache): The cache used to send a conditional request (default: no cache).
+
+        Returns:
+            str: The SHA hash of the latest commit.
+
+        Raises:
+            Exception: If the request failed.
+        """
+
+        # 'HEAD' is the default branch of the repository
+        ref = quote(branch, safe="/") if branch else "HEAD"
+        url = "%s/repos/%s/%s/commits/%s" % (Configuration.GITHUB_API_URL, owner, repo, ref)
+        headers = {"Accept": "application/vnd.github.sha"}
+
+        if session is None:
+            session = HTTP_Client.session()
+
+        if cache is None:
+            response = session.get(url, headers=headers)
+            status_code, text = response.status_code, response.text
+        else:
+            # A '304 Not Modified' answer gives back the body of the previous response
+            status_code, text, from_cache = cache.get(session, url, headers=headers)
+
+        # Check the response status code
+        if status_code != 200:
+            raise Exception(f"Request failed with status code {status_code}")
+
+        return text.strip()
+
+    @staticmethod
+    def list_branches(repo_url, per_page=None, workers=None, session=None):
+        """
+        Get the names of all the branches of a repository.
+
+        The first page gives the number of pages in its 'Link: rel="last"' header, then
+        the other pages are fetched at the same time, so a repository with thousands of
+        branches needs about two round-trips instead of one per page.
+
+        Arguments:
+            repo_url (str): The API's URL of the repository.
+            per_page (int): The number of branches per page, 100 at most (default: Configuration.BRANCHES_PER_PAGE).
+            workers (int): The number of pages fetched at the same time (default: Configuration.BRANCHES_WORKERS).
+            session (requests.Session): The session to send the requests with (default: the shared session).
+
+        Returns:
+            list: The names of the branches, in the order of the API.
+
+        Raises:
+            Exception: If a request failed.
+        """
+
+        per_page = per_page or Configuration.BRANCHES_PER_PAGE
+        workers = workers or Configuration.BRANCHES_WORKERS
+
+        if session is None:
+            session = HTTP_Client.session(pool_maxsize=workers)
+
+        def get_page(number):
+            response = session.get("%s/branches" % repo_url, params={"per_page": per_page, "page": number})
+
+            # Check the response status code
+            if response.status_code != 200:
+                raise Exception(f"Request failed with status code {response.status_code}")
+
+            return response
+
+        response = get_page(1)
+        branches = [branch["name"] for branch in response.json()]
+
+        last_link = response.links.get("last")
+        last_page = int(parse_qs(urlparse(last_link["url"]).query).get("page", ["1"])[0]) if last_link else 1
+
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, last_page - 1)) as executor:
+                # 'map()' gives back the pages in order
+                for response in executor.map(get_page, range(2, last_page + 1)):
+                    branches.extend(branch["name"] for branch in response.json())
+
+        return branches
+
+    @staticmethod
+    def iter_search_items(response, chunk_size=8192):
+        """
+        Yield the items of a search response while the body is downloaded.
+
+        The body is read by chunks with 'response.iter_content()' and each element of the
+        "items" array is decoded as soon as it is complete, so the caller can use the first
+        results before the end of the response, and the whole body is never held in memory.
+
+        Arguments:
+            response (requests.Response): The response of a '/search/...' request sent with 'stream=True'.
+            chunk_size (int): The number of bytes read at a time.
+
+        Yields:
+            dict: The items, in the order of the response.
+
+        Raises:
+            Exception: If the request failed or if the body is not a search result.
+        """
+
+        # Check the response status code
+        if response.status_code != 200:
+            message = response.json().get("message", "") if response.content else ""
+            raise Exception(f"Request failed with status code {response.status_code} {message}".strip())
+
+        decoder = json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder("utf-8")()
+        items_start = re.compile(r'"items"\s*:\s*\[')
+
+        buffer = ""
+        in_items = False
+
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                buffer += text_decoder.decode(chunk)
+
+                if not in_items:
+                    match = items_start.search(buffer)
+                    if match is None:
+                        continue
+                    buffer = buffer[match.end() :]
+                    in_items = True
+
+                while True:
+                    # Skip the separators between two items
+                    position = 0
+                    while position < len(buffer) and buffer[position] in " \t\r\n,":
+                        position += 1
+                    buffer = buffer[position:]
+
+                    if not buffer:
+                        break
+
+                    if buffer[0] == "]":
+                        return
+
+                    try:
+                        item, end = decoder.raw_decode(buffer)
+
+                    except ValueError:
+                        # The item is not complete yet, wait for the next chunk
+                        break
+
+                    buffer = buffer[end:]
+                    yield item
+
+        finally:
+            response.close()
+
+        # The end of the "items" array has not been reached
+        if not in_items:
+            raise Exception('No "items" found in the search response')
+        raise Exception("The search response is truncated")
@@ -37,13 +37,11 @@ import os
 import sys
 from json import loads
 
-import src.tools.requests as requests
-
 ## Third party libraries
 from src.tools.packaging import version
-from src.tools.requests import get
 from src.util.colors import Color
 from src.util.exit_tool import exit_tool
+from src.util.http_client import HTTP_Client
 from src.util.internet_check import internet_check
 
 
@@ -72,7 +70,7 @@ class GitHub_Repo:
 
         # if os.path.isdir(Configuration.DEFAULT_INSTALL_PATH):
         if internet_check() == True:
-            rqst = get(Configuration.REPO_METADATA_URL, timeout=3)
+            rqst = HTTP_Client.get(Configuration.REPO_METADATA_URL, timeout=3)
             fetch_sc = rqst.status_code
 
             if fetch_sc == 404:
@@ -124,7 +122,7 @@ class GitHub_Repo:
 
         try:
             repository_url = Configuration.REPO_URL
-            rqst = requests.get(repository_url, timeout=7)
+            rqst = HTTP_Client.get(repository_url, timeout=7)
 
             # If the repository is in private mode, the page returns a 404 status (Not Found)
             if rqst.status_code == 404:
@@ -58,6 +58,17 @@ class Help_Messages:
         \r  -------                                  -----------
         \r              --console                    Start the main console of GitPy.
         \r              --cli                        Start the CLI environment of GitPy.
+        \r              --per-page NUMBER            The number of search results per page in the console, 1-100
+        \r                                           (default: {G}%s{W}).
+        \r              --snapshot                   Download a snapshot of the branch (only the files, without the
+        \r                                           history of git) by default.
+        \r              --no-mirror-cache            Do not keep a local mirror of the downloaded repositories to speed
+        \r                                           up their next downloads.
+        \r              --depth NUMBER               Download only the last NUMBER commits of the history (shallow clone).
+        \r              --single-branch              Download only the history of the selected branch.
+        \r              --filter SPEC                Download a partial clone, the files are downloaded when they are
+        \r                                           needed (e.g. {G}blob:none{W}).
+        \r              --sparse PATH [PATH ...]     Check out only these paths of the repository (sparse checkout).
 
         \r{SB2}{bold}Installation options{W}:
         \r=====================
@@ -80,6 +91,12 @@ class Help_Messages:
         \r  -------                                  -----------
         \r  -cr,        --check-repo                 Check if the repository in the notification config file have a new 
         \r                                           commit available and send a notification via mail if it\'s the case.
+        \r                                           Set {C}{bold}GITPY_GITHUB_TOKEN{W} to check them by batches with GraphQL.
+        \r  -bd FILE,   --bulk-download FILE         Download all the repositories of a manifest ({C}-{W} for the standard
+        \r                                           input), one {C}owner/repo[@branch] [-> path]{W} per line.
+        \r  -w NUMBER,  --workers NUMBER             The maximum number of repositories checked or downloaded at the same
+        \r                                           time by the --check-repo and --bulk-download options
+        \r                                           (default: {G}%s{W} and {G}%s{W}).
         \r              --unsub                      Allows you to unsubscribe from a repository registered with GitPy.
 
         
@@ -119,6 +136,8 @@ class Help_Messages:
         \r              --show-env-var         [+]   Prompt the value of the a environment variable.
         \r                                           (const: {G}install_path{W}).
         \r              --remove-cache         [+]   Delete python cache from the GitPy directory.
+        \r              --log-file FILE              Also write the messages in FILE (or a named pipe), one JSON
+        \r                                           record by line without colors.
 
         \r{SB2}{bold}Others available information{W}:
         \r=============================
@@ -132,7 +151,12 @@ class Help_Messages:
         \r  Report all bugs to <thomas.pellissier.pro@proton.me> or open an issue at <https://github.com/dedroot/gitpy/issues>.
         \r  The options with the [+] mean that it may require additional option(s).
         \r  If you want more details about a command, run: {G}gitpy --help <OPTION>{W}"""
-            % Configuration.DEFAULT_INSTALL_PATH
+            % (
+                Configuration.SEARCH_PER_PAGE,
+                Configuration.DEFAULT_INSTALL_PATH,
+                Configuration.CHECK_REPO_WORKERS,
+                Configuration.BULK_DOWNLOAD_WORKERS,
+            )
         )
 
     # -------------------- [ Main options ] -------------------- #
@@ -619,6 +643,8 @@ class Help_Messages:
         \r  Option's Description
         \r  --------------------
         \r  Delete all __pycache__ directories and .pyc files of GitPy.
+        \r  The python cache is kept between the runs of GitPy (it's compiled at the
+        \r  installation and the update), this option is only needed for maintenance.
 
         \r  Options                         Description
         \r  -------                         -----------
@@ -647,6 +673,8 @@ class Help_Messages:
         \r  Options        Description
         \r  -------        -----------
         \r  88, back       Goes back one menu.
+        \r  next           Show the next page of search results.
+        \r  prev           Show the previous page of search results.
 
         \r{SB2}{bold}Global options{W}:
         \r===============
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ http_cache.py              [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  A persistent on-disk cache of the HTTP validators (ETag and               #
+#  Last-Modified) used to send conditional requests to the GitHub API.       #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import json
+import os
+import threading
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+
+
+# Main
+class HTTP_Cache:
+    """
+    Persistent cache of HTTP validators, keyed by URL.
+
+    For each cached URL the ETag and Last-Modified headers of the last response are
+    stored with its body. The next request for the same URL is sent with the
+    'If-None-Match' and 'If-Modified-Since' headers, and when GitHub answers with
+    a '304 Not Modified' the stored body is used instead of downloading it again.
+    A 304 answer is not counted against the GitHub API rate limit.
+
+    The cache can be used by several threads at the same time.
+    """
+
+    FILE_NAME = "http_cache.json"
+
+    def __init__(self, path=None):
+        """
+        Arguments:
+            path (str): The path of the cache file (default: 'http_cache.json' in the GitPy's cache folder).
+        """
+        if path is None:
+            path = Configuration.get_cache_path() + self.FILE_NAME
+
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+
+        self.load()
+
+    def load(self):
+        """
+        Load the cache file, an unreadable or corrupted file gives an empty cache.
+        """
+        try:
+            with open(self.path, "r") as cache_file:
+                self.entries = json.load(cache_file)
+
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """
+        Write the cache file if it has been modified.
+        The file is replaced atomically, so a interrupted run never leaves a truncated cache.
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                temp_path = "%s.%s.tmp" % (self.path, os.getpid())
+
+                with open(temp_path, "w") as cache_file:
+                    json.dump(self.entries, cache_file, separators=(",", ":"))
+
+                os.replace(temp_path, self.path)
+                self.dirty = False
+
+            except OSError as e:
+                if Configuration.verbose == 3:
+                    Color.pl("  {§} Cannot write the HTTP cache file ({C}%s{W}): %s" % (self.path, e))
+
+    @staticmethod
+    def key(url, headers=None):
+        """
+        The key of a cached response: the URL and the media type asked for.
+        """
+        accept = (headers or {}).get("Accept", "")
+        return "%s %s" % (accept, url)
+
+    def get(self, session, url, headers=None, **kwargs):
+        """
+        Send a conditional GET request.
+
+        Arguments:
+            session (requests.Session): The session used to send the request.
+            url (str): The URL to fetch.
+            headers (dict): The headers of the request.
+            kwargs: Passed to 'session.get()'.
+
+        Returns:
+            tuple: (status_code, text, from_cache). On a '304 Not Modified' answer, the status
+                   code is 200, the text is the stored body and 'from_cache' is True.
+        """
+        key = self.key(url, headers)
+        request_headers = dict(headers or {})
+
+        with self.lock:
+            entry = self.entries.get(key)
+
+        if entry is not None:
+            if entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = session.get(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            if Configuration.verbose == 3:
+                Color.pl("  {§} Not modified since the last request, using the cached response.")
+                Color.pl("   {SY1}╰──╼{W} URL: {C}%s{W}" % url)
+            return (200, entry["body"], True)
+
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+            if etag or last_modified:
+                with self.lock:
+                    self.entries[key] = {
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "body": response.text,
+                    }
+                    self.dirty = True
+
+        return (response.status_code, response.text, False)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ http_client.py             [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  The shared HTTP client of GitPy: one persistent session with a tuned      #
+#  connection pool, retry and timeout policies for all the requests.         #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import threading
+
+## Third party libraries
+from src.tools.requests.adapters import HTTPAdapter, Retry
+from src.tools.requests.sessions import Session
+from src.util.colors import Color
+
+
+# Class section
+class Timeout_Session(Session):
+    """
+    A requests' Session that applies a default timeout to every request
+    that doesn't set one.
+    """
+
+    def __init__(self, timeout):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().request(method, url, **kwargs)
+
+
+class HTTP_Client:
+    """
+    The HTTP client shared by the whole process.
+
+    All the requests of GitPy go through the same session, so the TCP/TLS
+    connections to GitHub are kept alive and reused between calls instead of
+    being opened again for each request. The pool sizes, the retry policy and the
+    default timeout are all set in this class.
+    """
+
+    # Number of hosts kept in the pool (api.github.com, github.com, raw.githubusercontent.com, ...)
+    POOL_CONNECTIONS = 4
+    # Number of connections kept alive per host
+    POOL_MAXSIZE = 10
+    # (connect, read) timeout in seconds
+    TIMEOUT = (5, 30)
+    # Retry the idempotent requests on connection errors and on the temporary errors of the server
+    RETRIES = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+        raise_on_status=False,
+    )
+
+    _session = None
+    _pool_maxsize = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def session(cls, pool_maxsize=None):
+        """
+        Returns the shared session, created on the first call.
+
+        Arguments:
+            pool_maxsize (int): The minimum number of connections kept alive per host.
+                                Used by the callers sending requests from many threads.
+        """
+        from src.config import Configuration
+
+        pool_maxsize = max(pool_maxsize or 0, cls.POOL_MAXSIZE)
+
+        with cls._lock:
+            if cls._session is None:
+                if Configuration.verbose == 3:
+                    Color.pl("  {§} Creating the shared HTTP session...")
+                    Color.pl(
+                        "   {SY1}╰──╼{W} Pool: {SY1}%s hosts x %s connections{W}, timeout: {SY1}%s{W}"
+                        % (cls.POOL_CONNECTIONS, pool_maxsize, cls.TIMEOUT)
+                    )
+
+                cls._session = Timeout_Session(timeout=cls.TIMEOUT)
+                cls._session.headers["User-Agent"] = "GitPy/%s" % Configuration.VERSION
+
+            if pool_maxsize > cls._pool_maxsize:
+                # (Re)mount the adapters with a pool large enough for the caller
+                cls._pool_maxsize = pool_maxsize
+                for prefix in ("https://", "http://"):
+                    old_adapter = cls._session.adapters.get(prefix)
+                    cls._session.mount(
+                        prefix,
+                        HTTPAdapter(
+                            pool_connections=cls.POOL_CONNECTIONS,
+                            pool_maxsize=pool_maxsize,
+                            max_retries=cls.RETRIES,
+                        ),
+                    )
+                    if old_adapter is not None:
+                        old_adapter.close()
+
+            return cls._session
+
+    @classmethod
+    def get(cls, url, **kwargs):
+        """
+        Sends a GET request with the shared session.
+        """
+        return cls.session().get(url, **kwargs)
+
+    @classmethod
+    def post(cls, url, **kwargs):
+        """
+        Sends a POST request with the shared session.
+        """
+        return cls.session().post(url, **kwargs)
+
+    @classmethod
+    def close(cls):
+        """
+        Closes all the connections of the shared session.
+        """
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+                cls._pool_maxsize = 0
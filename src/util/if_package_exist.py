@@ -31,10 +31,104 @@
 # ---------------------------------------------------------------------------#
 
 # Import section
-import subprocess
+import os
 
 ## Third party libraries
 from src.util.based_distro import Based_Distro
+from src.util.process import Process
+
+
+class Package_Inventory:
+    """
+    The packages installed on the machine, read once per run.
+
+    On a Debian based distro the dpkg's database ('/var/lib/dpkg/status') is parsed
+    directly, without starting a process ('dpkg-query -W' if it cannot be read).
+    On an Arch based distro, 'pacman -Qq' lists all the packages in one call.
+    """
+
+    DPKG_STATUS_PATH = "/var/lib/dpkg/status"
+
+    # The names of the installed packages, None until they are read
+    _packages = None
+
+    @classmethod
+    def packages(cls):
+        """
+        Returns the set of the names of the installed packages.
+        """
+        if cls._packages is None:
+            cls._packages = cls.load(Based_Distro())
+
+        return cls._packages
+
+    @classmethod
+    def reload(cls):
+        """
+        Forget the installed packages, they are read again at the next query (e.g. after an installation).
+        """
+        cls._packages = None
+
+    @classmethod
+    def load(cls, based_distro):
+        """
+        Read the names of the installed packages.
+
+        Arguments:
+            based_distro (str): 'Debian' or 'Arch', see 'Based_Distro()'.
+
+        Returns:
+            set: The names of the installed packages, empty on another distro.
+        """
+        if based_distro == "Debian":
+            if os.access(cls.DPKG_STATUS_PATH, os.R_OK):
+                with open(cls.DPKG_STATUS_PATH, "r", encoding="utf-8", errors="replace") as status_file:
+                    return cls.parse_dpkg_status(status_file)
+
+            stdout = Process(["dpkg-query", "-W", "-f=${db:Status-Status} ${Package}\n"]).stdout() or ""
+            return {line.split()[1] for line in stdout.splitlines() if line.startswith("installed ")}
+
+        if based_distro == "Arch":
+            stdout = Process(["pacman", "-Qq"]).stdout() or ""
+            return set(stdout.split())
+
+        return set()
+
+    @staticmethod
+    def parse_dpkg_status(lines):
+        """
+        Returns the names of the installed packages of a dpkg's status file.
+        Each package is a paragraph with a 'Package:' and a 'Status:' field.
+        """
+        packages = set()
+        package = None
+
+        for line in lines:
+            if line.startswith("Package:"):
+                package = line[len("Package:") :].strip()
+            elif line.startswith("Status:") and package is not None:
+                # 'install ok installed', the last word is the state of the package
+                if line.split()[-1] == "installed":
+                    packages.add(package)
+            elif not line.strip():
+                package = None
+
+        return packages
+
+    @classmethod
+    def is_installed(cls, package):
+        """
+        Returns True if a package is installed.
+        """
+        return package in cls.packages()
+
+    @classmethod
+    def missing(cls, packages):
+        """
+        Returns the packages that are not installed, in the same order.
+        """
+        installed = cls.packages()
+        return [package for package in packages if package not in installed]
 
 
 # Main
@@ -42,8 +136,11 @@ def package_exists(package):
     """
     Check if package are install on the machine
     """
-    if Based_Distro() == "Debian":
-        result = subprocess.run("dpkg -s %s" % package, shell=True, stdout=subprocess.PIPE)
-    elif Based_Distro() == "Arch":
-        result = subprocess.run("pacman -Q %s" % package, shell=True, stdout=subprocess.PIPE)
-    return result.stdout != b""
+    return Package_Inventory.is_installed(package)
+
+
+def missing_packages(packages):
+    """
+    Returns the packages that are not installed on the machine.
+    """
+    return Package_Inventory.missing(packages)
@@ -35,10 +35,16 @@ from urllib import request
 
 
 # Main
-def internet_check(host="https://google.com"):
+def internet_check(host=None):
     """
     Check if the user have an Internet connection by connecting to google.com over https
+    (or to 'Configuration.INTERNET_CHECK_URL')
     """
+    if host is None:
+        from src.config import Configuration
+
+        host = Configuration.INTERNET_CHECK_URL
+
     try:
         request.urlopen(host, timeout=4)
         return True
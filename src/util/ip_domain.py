@@ -37,10 +37,9 @@ import ipaddress
 import re
 import socket
 
-import src.tools.requests as requests
-
 ## Third party libraries
 from src.util.colors import Color
+from src.util.http_client import HTTP_Client
 
 
 # Functions section
@@ -114,7 +113,7 @@ def get_public_ip() -> str:
     """
     Get the public IP of the machine
     """
-    r = requests.get("http://ifconfig.io/ip")
+    r = HTTP_Client.get("http://ifconfig.io/ip")
     return r.text.strip()
 
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ lazy_import.py             [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Import a module, or an object of a module, only when it's used            #
+#  for the first time.                                                       #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import importlib
+
+
+# Main
+class Lazy_Import:
+    """
+    Stands for a module, or an object of a module, that is imported on its first use.
+    The heavy libraries (the vendored 'requests', 'rich', 'crontab', ...) are then only
+    loaded by the subcommands that need them, and not by 'gitpy --version' for example.
+
+    Usage:
+        CronTab = Lazy_Import("crontab", "CronTab")
+        CronTab(user="root")  # 'crontab' is imported here
+    """
+
+    def __init__(self, module_name, attribute=None):
+        """
+        Arguments:
+            module_name (str): The absolute name of the module.
+            attribute (str): The name of the object of the module (default: the module itself).
+        """
+        # Set without '__setattr__', the attributes of the imported object are forwarded
+        self.__dict__["_module_name"] = module_name
+        self.__dict__["_attribute"] = attribute
+        self.__dict__["_target"] = None
+
+    def load(self):
+        """
+        Import the module, once.
+
+        Returns:
+            object: The module or its object.
+        """
+        target = self.__dict__["_target"]
+
+        if target is None:
+            target = importlib.import_module(self.__dict__["_module_name"])
+            if self.__dict__["_attribute"] is not None:
+                target = getattr(target, self.__dict__["_attribute"])
+
+            self.__dict__["_target"] = target
+
+        return target
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.load(), name, value)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self):
+        name = self.__dict__["_module_name"]
+        if self.__dict__["_attribute"] is not None:
+            name += "." + self.__dict__["_attribute"]
+
+        return "<Lazy_Import %s%s>" % (name, "" if self.__dict__["_target"] is None else " (loaded)")
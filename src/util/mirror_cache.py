@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ mirror_cache.py            [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  A cache of bare mirrors of the downloaded repositories, used as the       #
+#  source of the objects of the next clones.                                 #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import fcntl
+import os
+import re
+import shlex
+import shutil
+import time
+from contextlib import nullcontext
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.process import Process
+
+
+# Main
+class Mirror_Cache:
+    """
+    A bare mirror of the branches and tags of each downloaded repository.
+
+    A mirror is updated with 'git fetch' before a clone, so only the new commits are
+    downloaded from GitHub, then the clone takes its objects from the mirror: a full
+    clone hardlinks them (seconds and almost no disk space), a limited clone uses
+    them with '--reference --dissociate'.
+
+    The mirrors not used since 'max_age' are removed, then the least recently used
+    ones while the cache is bigger than 'max_size'.
+    """
+
+    def __init__(self, path=None, max_size=None, max_age=None):
+        """
+        Arguments:
+            path (str): The folder of the mirrors (default: 'mirrors/' in the GitPy's cache folder).
+            max_size (int): The maximum size of the cache in bytes (default: Configuration.MIRROR_CACHE_MAX_SIZE).
+            max_age (int): The time in seconds a mirror is kept without being used (default: Configuration.MIRROR_CACHE_MAX_AGE).
+        """
+        self.path = path or Configuration.get_cache_path() + Configuration.MIRROR_CACHE_DIR_NAME
+        self.max_size = max_size or Configuration.MIRROR_CACHE_MAX_SIZE
+        self.max_age = max_age or Configuration.MIRROR_CACHE_MAX_AGE
+
+    def mirror_path(self, url):
+        """
+        Returns the path of the mirror of a repository, '{owner}/{repo}.git' in the cache.
+        """
+        match = re.search(r"([^/:]+)/([^/]+?)(?:\.git)?/?$", url)
+        return os.path.join(self.path, match.group(1), match.group(2) + ".git")
+
+    def has(self, url):
+        """
+        Returns True if the repository has a mirror.
+        """
+        return os.path.isdir(self.mirror_path(url))
+
+    @staticmethod
+    def lock(mirror_path, blocking=True):
+        """
+        Lock a mirror, two processes cannot update or remove the same mirror at the same time.
+
+        The lock is held on '{mirror}.lock' until the returned file is closed. The lock file
+        is removed with its mirror, so a lock taken on a removed file is taken again.
+
+        Arguments:
+            mirror_path (str): The path of the mirror.
+            blocking (bool): Wait until the mirror is not used (default), else return None if it is used.
+
+        Returns:
+            file: The open lock file, or None if the mirror is used and 'blocking' is False.
+        """
+        while True:
+            os.makedirs(os.path.dirname(mirror_path), exist_ok=True)
+            lock_file = open(mirror_path + ".lock", "a")
+
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                return None
+
+            try:
+                if os.fstat(lock_file.fileno()).st_ino == os.stat(mirror_path + ".lock").st_ino:
+                    return lock_file
+            except FileNotFoundError:
+                pass
+
+            # The mirror has been removed while waiting for the lock
+            lock_file.close()
+
+    def update(self, url, locked=False):
+        """
+        Create the mirror of a repository, or fetch its new commits.
+
+        Arguments:
+            url (str): The cloning URL of the repository.
+            locked (bool): The mirror is already locked by the caller (see 'lock()').
+
+        Returns:
+            str: The path of the mirror, or None if git failed.
+        """
+        mirror_path = self.mirror_path(url)
+
+        # Two downloads of the same repository cannot update its mirror at the same time
+        with nullcontext() if locked else self.lock(mirror_path):
+            if os.path.isdir(mirror_path):
+                if Configuration.verbose >= 3:
+                    Color.pl("  {§}  Updating the mirror of the repository...")
+                    Color.pl("   {SY1}╰──╼{W} Path: {C}%s{W}" % mirror_path)
+
+                command = "git -C %s fetch --prune --quiet origin" % shlex.quote(mirror_path)
+            else:
+                if Configuration.verbose >= 3:
+                    Color.pl("  {§}  Creating the mirror of the repository...")
+                    Color.pl("   {SY1}╰──╼{W} Path: {C}%s{W}" % mirror_path)
+
+                # Only the branches and the tags, 'git clone --mirror' would also fetch the pull requests of GitHub
+                command = "git clone --bare --quiet -- %s %s && git -C %s config remote.origin.fetch %s" % (
+                    shlex.quote(url),
+                    shlex.quote(mirror_path),
+                    shlex.quote(mirror_path),
+                    shlex.quote("+refs/heads/*:refs/heads/*"),
+                )
+
+            stdout, stderr = Process.call(command, shell=True)
+
+            if not os.path.isfile(os.path.join(mirror_path, "HEAD")):
+                # A failed first clone leaves nothing usable
+                shutil.rmtree(mirror_path, ignore_errors=True)
+                return None
+
+            # The modification time of the mirror is its last use
+            os.utime(mirror_path)
+
+        return mirror_path
+
+    @staticmethod
+    def folder_size(path):
+        """
+        Returns the size in bytes of the files of a folder.
+        """
+        size = 0
+        for root, dirs, files in os.walk(path):
+            for name in files:
+                try:
+                    size += os.lstat(os.path.join(root, name)).st_size
+                except OSError:
+                    pass
+
+        return size
+
+    def evict(self, keep=None):
+        """
+        Remove the mirrors not used since 'max_age', then the least recently used ones above 'max_size'.
+        A mirror used by another download at the same time is not removed, and the lock files left
+        without their mirror (by a failed first clone) are removed.
+
+        Arguments:
+            keep (str): The path of a mirror that is never removed, like the one of the current download.
+
+        Returns:
+            list: The paths of the removed mirrors.
+        """
+        if not os.path.isdir(self.path):
+            return []
+
+        mirrors = []
+        for owner in os.listdir(self.path):
+            owner_path = os.path.join(self.path, owner)
+            if not os.path.isdir(owner_path):
+                continue
+
+            for name in os.listdir(owner_path):
+                mirror_path = os.path.join(owner_path, name)
+                if mirror_path == keep:
+                    continue
+
+                if name.endswith(".git") and os.path.isdir(mirror_path):
+                    mirrors.append((os.path.getmtime(mirror_path), mirror_path, self.folder_size(mirror_path)))
+                elif name.endswith(".git.lock") and not os.path.isdir(mirror_path[: -len(".lock")]):
+                    self.remove(mirror_path[: -len(".lock")])
+
+        # The least recently used first
+        mirrors.sort()
+        now = time.time()
+        total_size = sum(size for used, mirror_path, size in mirrors)
+        removed = []
+
+        for used, mirror_path, size in mirrors:
+            if now - used <= self.max_age and total_size <= self.max_size:
+                break
+
+            if Configuration.verbose >= 3:
+                Color.pl("  {§}  Removing the mirror {C}%s{W} from the cache..." % mirror_path)
+
+            if self.remove(mirror_path):
+                total_size -= size
+                removed.append(mirror_path)
+
+        return removed
+
+    def remove(self, mirror_path):
+        """
+        Remove a mirror and its lock file, if the mirror is not used by another download.
+
+        Returns:
+            bool: True if the mirror has been removed.
+        """
+        lock_file = self.lock(mirror_path, blocking=False)
+        if lock_file is None:
+            return False
+
+        with lock_file:
+            shutil.rmtree(mirror_path, ignore_errors=True)
+            os.remove(mirror_path + ".lock")
+
+        # The folder of the owner is removed with its last mirror
+        try:
+            os.rmdir(os.path.dirname(mirror_path))
+        except OSError:
+            pass
+
+        return True
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ output.py                  [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  The buffered terminal output of the verbose modes and the                 #
+#  structured log file, without ANSI formatting.                             #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import atexit
+import json
+import sys
+import threading
+import time
+from datetime import datetime
+
+## Third party libraries
+from src.util.colors import Color
+
+
+# Class section
+class Buffered_Stream:
+    """
+    Stands for 'sys.stdout' or 'sys.stderr' once the output is buffered: the writes go to
+    the shared 'Output_Buffer', the other attributes are the ones of the real stream.
+    """
+
+    # 'Color.p()' doesn't flush after each fragment, the buffer flushes on its own
+    coalescing = True
+
+    def __init__(self, output_buffer, stream):
+        self.output_buffer = output_buffer
+        self.stream = stream
+
+    def write(self, text):
+        self.output_buffer.write(self.stream, text)
+        return len(text)
+
+    def flush(self):
+        # Also called by 'input()' before it waits for the user
+        self.output_buffer.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class Output_Buffer:
+    """
+    Coalesces the writes of stdout and stderr, in their order, into fewer writes and flushes
+    of the terminal.
+
+    A line is written at once if nothing was flushed for 'Configuration.OUTPUT_FLUSH_INTERVAL',
+    otherwise it waits in the buffer with the next ones until the interval ends (or until
+    the buffer holds 'Configuration.OUTPUT_BUFFER_SIZE' characters). So an isolated message is
+    shown without delay and the hundreds of lines of the verbose level 3 are written in a
+    few batches. The buffer is also flushed before an input and at the exit.
+    """
+
+    # The installed buffer
+    installed = None
+
+    def __init__(self, flush_interval, buffer_size):
+        """
+        Arguments:
+            flush_interval (float): Minimum seconds between two flushes of a burst of lines.
+            buffer_size (int): Number of characters that makes the buffer flush at once.
+        """
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        # The waiting (stream, text), in the order of the writes
+        self.chunks = []
+        self.size = 0
+        self.last_flush = 0.0
+        self.timer = None
+        self.lock = threading.RLock()
+
+    @classmethod
+    def install(cls):
+        """
+        Replace 'sys.stdout' and 'sys.stderr' by buffered streams, once.
+
+        Returns:
+            Output_Buffer: The installed buffer.
+        """
+        from src.config import Configuration
+
+        if cls.installed is None:
+            cls.installed = cls(Configuration.OUTPUT_FLUSH_INTERVAL, Configuration.OUTPUT_BUFFER_SIZE)
+            sys.stdout = Buffered_Stream(cls.installed, sys.stdout)
+            sys.stderr = Buffered_Stream(cls.installed, sys.stderr)
+
+        return cls.installed
+
+    def write(self, stream, text):
+        """
+        Add a text to the buffer, flush it if needed.
+
+        Arguments:
+            stream (file): The real stream of the text.
+            text (str): The text.
+        """
+        with self.lock:
+            self.chunks.append((stream, text))
+            self.size += len(text)
+
+            if self.size >= self.buffer_size:
+                self.flush()
+
+            elif "\n" in text and time.monotonic() - self.last_flush >= self.flush_interval:
+                self.flush()
+
+            elif self.timer is None:
+                # The rest of a burst, or a line in progress ('\r', prompt), is shown at the end of the interval
+                self.timer = threading.Timer(self.flush_interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """
+        Write the buffer to the real streams, the following texts of a same stream at once.
+        """
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+
+            chunks, self.chunks, self.size = self.chunks, [], 0
+            self.last_flush = time.monotonic()
+
+            streams = []
+            for stream, text in chunks:
+                if streams and streams[-1][0] is stream:
+                    streams[-1][1].append(text)
+                else:
+                    streams.append((stream, [text]))
+
+            for stream, texts in streams:
+                stream.write("".join(texts))
+                stream.flush()
+
+
+class Output_Log:
+    """
+    Writes the messages shown by 'Color' in a file (or a named pipe), one JSON record by
+    line, without ANSI formatting:
+        {"time": "2026-10-18T10:12:00.000", "level": "info", "message": "..."}
+    """
+
+    # The level of a record, from the tag at the beginning of its message
+    levels = {
+        "{+}": "success",
+        "{-}": "progress",
+        "{*}": "info",
+        "{>}": "input",
+        "{&}": "verbose1",
+        "{#}": "verbose2",
+        "{§}": "verbose3",
+        "{!}": "error",
+        "{$}": "warning",
+        "{?}": "question",
+    }
+
+    def __init__(self, path):
+        """
+        Arguments:
+            path (str): The log file, the records are added at its end.
+        """
+        self.path = path
+        self.log_file = open(path, "a", buffering=1, encoding="utf-8")
+        # The end of a message not ended by a new line yet
+        self.partial = ""
+        # A line without tag continues the previous message (e.g. the '╰──╼' lines of the verbose mode)
+        self.level = "info"
+        self.lock = threading.Lock()
+
+        atexit.register(self.close)
+
+    def write(self, text):
+        """
+        Add the complete lines of a text as records.
+        """
+        with self.lock:
+            self.partial += text
+
+            while "\n" in self.partial:
+                line, self.partial = self.partial.split("\n", 1)
+                self.record(line)
+
+    def record(self, line):
+        """
+        Write a line as a record.
+        """
+        # Only the last state of a line rewritten with '\r' (a progress) is kept
+        line = line.split("\r")[-1].strip()
+
+        for tag, level in self.levels.items():
+            if line.startswith(tag):
+                self.level = level
+                line = line[len(tag) :]
+                break
+
+        message = Color.strip(line).strip()
+        if not message:
+            return
+
+        record = {"time": datetime.now().isoformat(timespec="milliseconds"), "level": self.level, "message": message}
+        self.log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        with self.lock:
+            if self.log_file.closed:
+                return
+
+            if self.partial:
+                self.record(self.partial)
+                self.partial = ""
+
+            self.log_file.close()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ pipeline.py                [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Run the steps of the installer, the updater and the uninstaller,          #
+#  with their dependencies, readiness checks and timing.                     #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import time
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+
+
+class Step:
+    """
+    A step of a Pipeline.
+    """
+
+    def __init__(self, name, action, requires=(), ready=None, message=None, skip=False, undo=None):
+        """
+        Arguments:
+            name (str): The name of the step, used by the 'requires' of the next steps.
+            action (function): The work of the step, called without arguments.
+            requires (tuple): The names of the steps that must be done before this one.
+            ready (function): Returns True when the result of the step is usable (default: no check).
+            message (str): Shown before the step (default: nothing).
+            skip (bool): Don't run the step, the steps that require it can still run.
+            undo (function): Cancels the action of the step if a next step fails (default: nothing).
+        """
+        self.name = name
+        self.action = action
+        self.requires = tuple(requires)
+        self.ready = ready
+        self.message = message
+        self.skip = skip
+        self.undo = undo
+        self.duration = None
+
+
+# Main
+class Pipeline:
+    """
+    The steps of a flow (installation, update, uninstallation), run in the order they
+    are added once the steps they require are done.
+
+    A step is done when its action returned and its readiness check passed: the check
+    is retried until 'Configuration.STEP_READY_TIMEOUT' instead of waiting a fixed
+    delay, so a step takes only the time of its real work.
+    """
+
+    def __init__(self, name, quiet=False):
+        """
+        Arguments:
+            name (str): The name of the flow, shown with the timing.
+            quiet (bool): Don't show the messages of the steps.
+        """
+        self.name = name
+        self.quiet = quiet
+        self.steps = []
+
+    def add(self, name, action, requires=(), ready=None, message=None, skip=False, undo=None):
+        """
+        Add a step, see 'Step' for the arguments.
+        """
+        known = {step.name for step in self.steps}
+        for required in requires:
+            if required not in known:
+                raise ValueError("The step '%s' requires '%s', which is not added before it." % (name, required))
+
+        self.steps.append(
+            Step(name, action, requires=requires, ready=ready, message=message, skip=skip, undo=undo)
+        )
+        return self
+
+    @staticmethod
+    def wait_ready(step):
+        """
+        Wait until the readiness check of a step passes.
+
+        Raises:
+            Exception: If the check does not pass before 'Configuration.STEP_READY_TIMEOUT'.
+        """
+        deadline = time.monotonic() + Configuration.STEP_READY_TIMEOUT
+
+        while not step.ready():
+            if time.monotonic() > deadline:
+                raise Exception("The step '%s' is not ready after %ss." % (step.name, Configuration.STEP_READY_TIMEOUT))
+
+            time.sleep(Configuration.STEP_READY_INTERVAL)
+
+    def undo(self, failed_step):
+        """
+        Cancel the done steps, from the last one, after the failure of a step.
+        An error of an 'undo' is shown and the next ones are still called.
+
+        Arguments:
+            failed_step (Step): The step that failed, its 'undo' is called first.
+        """
+        position = self.steps.index(failed_step)
+
+        for step in reversed(self.steps[: position + 1]):
+            if step.undo is None or step.skip:
+                continue
+
+            if Configuration.verbose == 3:
+                Color.pl("  {§} Undo the step {C}%s{W}..." % step.name)
+
+            try:
+                step.undo()
+            except Exception as E:
+                Color.pl("  {!} Unable to undo the step '%s': %s" % (step.name, E))
+
+    def run(self):
+        """
+        Run all the steps. An exception of a step stops the pipeline, the done steps are
+        undone (see 'undo()') and the exception is raised again.
+
+        Returns:
+            float: The duration of the pipeline in seconds.
+        """
+        start_time = time.monotonic()
+        done = set()
+
+        for step in self.steps:
+            # The steps are added after the ones they require, so these ones are done or skipped
+            for required in step.requires:
+                if required not in done:
+                    raise Exception("The step '%s' requires '%s', which is not done." % (step.name, required))
+
+            if step.skip:
+                done.add(step.name)
+                continue
+
+            if step.message and not self.quiet:
+                Color.pl("  {-} %s" % step.message)
+
+            if Configuration.verbose == 3:
+                Color.pl("  {§} Step {C}%s{W}..." % step.name)
+
+            step_start = time.monotonic()
+            try:
+                step.action()
+
+                if step.ready is not None:
+                    self.wait_ready(step)
+
+            except BaseException:
+                self.undo(step)
+                raise
+
+            step.duration = time.monotonic() - step_start
+            done.add(step.name)
+
+            if Configuration.verbose >= 1:
+                Color.pl("  {&} Step {C}%s{W} done in {G}%.2fs{W}." % (step.name, step.duration))
+
+        duration = time.monotonic() - start_time
+
+        if Configuration.verbose >= 1:
+            Color.pl("  {&} %s done in {G}%.2fs{W}." % (self.name, duration))
+
+        return duration
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ precompile.py              [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Compile the python files of GitPy into bytecode, checked by               #
+#  hash, so the runs of GitPy don't compile them again.                      #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import compileall
+import py_compile
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+
+
+# Main
+def precompile(path, quiet=True):
+    """
+    Compile all the python files of a GitPy's directory into its '__pycache__' folders.
+    The bytecode is checked with the hash of its source file instead of its date, so it
+    stays valid when the files are moved or cloned, and is compiled again only when its
+    source changed.
+
+    Arguments:
+        path (str): The GitPy's directory.
+        quiet (bool): Don't show the compiled files.
+
+    Returns:
+        bool: True if all the files are compiled.
+    """
+    if Configuration.verbose == 3:
+        Color.pl("  {§} Compiling the python files of {C}%s{W}..." % path)
+        Color.pl("   {SY1}╰──╼{W} Python: {SY1}compileall.compile_dir('%s'){W}" % path)
+
+    return bool(
+        compileall.compile_dir(
+            path,
+            quiet=1 if quiet else 0,
+            workers=Configuration.PRECOMPILE_WORKERS,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+        )
+    )
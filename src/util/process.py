@@ -31,9 +31,13 @@
 # ---------------------------------------------------------------------------#
 
 # Import section
+import codecs
 import os
+import re
+import selectors
 import signal
 import time
+from collections import deque
 from subprocess import PIPE, Popen
 
 from src.config import Configuration
@@ -56,9 +60,14 @@ class Process(object):
         return open("/dev/null", "w")
 
     @staticmethod
-    def call(command, cwd=None, shell=False):
+    def call(command, cwd=None, shell=False, on_line=None):
         """
         Calls a command (either string or list of args).
+
+        With 'on_line', the outputs are read while the command runs: 'on_line(name, line)'
+        is called for each line of 'stdout' or 'stderr' (also the lines ended by '\r',
+        like the progress of git), and only the last lines of each output are kept.
+
         Returns tuple:
             (stdout, stderr)
         """
@@ -72,8 +81,12 @@ class Process(object):
                 Color.pe("  {&} Executing: {B}%s{W}" % command)
 
         pid = Popen(command, cwd=cwd, stdout=PIPE, stderr=PIPE, shell=shell)
-        pid.wait()
-        (stdout, stderr) = pid.communicate()
+
+        if on_line is None:
+            # 'communicate()' reads both outputs until the end, then waits for the process
+            (stdout, stderr) = pid.communicate()
+        else:
+            (stdout, stderr) = Process.stream(pid, on_line)
 
         # Python 3 compatibility
         if type(stdout) is bytes:
@@ -88,6 +101,65 @@ class Process(object):
 
         return (stdout, stderr)
 
+    @staticmethod
+    def stream(pid, on_line, tail=None):
+        """
+        Reads the outputs of a process while it runs, then waits for it.
+
+        Arguments:
+            pid (Popen): The process, started with 'stdout=PIPE' and 'stderr=PIPE'.
+            on_line (function): Called with the name of the output ('stdout' or 'stderr') and each line.
+            tail (int): The number of lines kept for each output (default: Configuration.PROCESS_TAIL_LINES).
+
+        Returns tuple:
+            (stdout, stderr) with the last lines of each output
+        """
+        tail = tail or Configuration.PROCESS_TAIL_LINES
+
+        selector = selectors.DefaultSelector()
+        outputs = {}
+        for name, pipe in (("stdout", pid.stdout), ("stderr", pid.stderr)):
+            selector.register(pipe, selectors.EVENT_READ, name)
+            outputs[name] = {
+                "decoder": codecs.getincrementaldecoder("utf-8")(errors="replace"),
+                "pending": "",
+                "lines": deque(maxlen=tail),
+            }
+
+        def handle(name, text, final=False):
+            output = outputs[name]
+            parts = re.split(r"(\r\n|\r|\n)", output["pending"] + text)
+            output["pending"] = parts.pop()
+
+            # 'parts' alternates the lines and their ends
+            for line, end in zip(parts[::2], parts[1::2]):
+                on_line(name, line)
+                # The lines ended by '\r' are overwritten on a terminal, they are not kept
+                if end != "\r":
+                    output["lines"].append(line)
+
+            if final and output["pending"]:
+                on_line(name, output["pending"])
+                output["lines"].append(output["pending"])
+                output["pending"] = ""
+
+        while selector.get_map():
+            for key, events in selector.select():
+                data = os.read(key.fileobj.fileno(), 65536)
+                output = outputs[key.data]
+
+                if data:
+                    handle(key.data, output["decoder"].decode(data))
+                else:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    handle(key.data, output["decoder"].decode(b"", final=True), final=True)
+
+        selector.close()
+        pid.wait()
+
+        return tuple("".join(line + "\n" for line in outputs[name]["lines"]) for name in ("stdout", "stderr"))
+
     @staticmethod
     def exists(program):
         """
@@ -173,8 +245,6 @@ class Process(object):
         """
         Waits for process to finish, sets stdout & stderr
         """
-        if self.pid.poll() is None:
-            self.pid.wait()
         if self.out is None:
             (self.out, self.err) = self.pid.communicate()
 
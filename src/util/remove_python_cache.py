@@ -42,128 +42,36 @@ from src.util.colors import Color
 
 # Main
 def remove_python_cache(pwd, line_enter=None):
+    """
+    Delete all the '__pycache__' folders of GitPy (the ones of the vendored libraries
+    of 'src/tools/' too). Only called by 'gitpy --remove-cache', the cache is kept
+    between the runs otherwise.
+
+    Arguments:
+        pwd (str): The GitPy's directory.
+        line_enter (bool): Print a new line before the verbose message.
+    """
     try:
-        if Configuration.verbose == 0:
-            if os.path.isdir("%s/src/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/__pycache__/" % pwd)
+        if Configuration.verbose == 3:
+            Color.pl("%s  {§} Removing python cache..." % ("\n" if line_enter is True else ""))
 
-            if os.path.isdir("%s/src/core/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/core/__pycache__/" % pwd)
-
-            if os.path.isdir("%s/src/modules/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/modules/__pycache__/" % pwd)
-
-            if os.path.isdir("%s/src/util/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/util/__pycache__/" % pwd)
-
-            if os.path.isdir("%s/src/tools/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/tools/__pycache__/" % pwd)
-
-            if os.path.isdir("%s/src/tools/colored/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/tools/colored/__pycache__/" % pwd)
-
-            if os.path.isdir("%s/src/tools/packaging/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/tools/packaging/__pycache__/" % pwd)
-
-        else:
-            if Configuration.verbose == 3:
-                if line_enter is True:
-                    Color.pl("\n  {§} Removing python cache...")
-                else:
-                    Color.pl("  {§} Removing python cache...")
-
-            if Configuration.verbose == 3:
-                Color.p("   {SY1}├──╼{W} Python: {SY1}shutil.rmtree('%s/src/__pycache__/' % pwd){W} ...")
-
-            if os.path.isdir("%s/src/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/__pycache__/" % pwd)
-
-                if Configuration.verbose == 3:
-                    Color.p(" {G}OK{W}\n")
-
-            else:
-                if Configuration.verbose == 3:
-                    Color.p(" {O}NOT FOUND{W}\n")
-
-            if Configuration.verbose == 3:
-                Color.p("   {SY1}├──╼{W} Python: {SY1}shutil.rmtree('%s/src/core/__pycache__/' % pwd){W} ...")
-
-            if os.path.isdir("%s/src/core/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/core/__pycache__/" % pwd)
-
-                if Configuration.verbose == 3:
-                    Color.p(" {G}OK{W}\n")
-
-            else:
-                if Configuration.verbose == 3:
-                    Color.p(" {O}NOT FOUND{W}\n")
-
-            if Configuration.verbose == 3:
-                Color.p("   {SY1}├──╼{W} Python: {SY1}shutil.rmtree('%s/src/modules/__pycache__/' % pwd){W} ...")
-
-            if os.path.isdir("%s/src/modules/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/modules/__pycache__/" % pwd)
-
-                if Configuration.verbose == 3:
-                    Color.p(" {G}OK{W}\n")
-
-            else:
-                if Configuration.verbose == 3:
-                    Color.p(" {O}NOT FOUND{W}\n")
-
-            if Configuration.verbose == 3:
-                Color.p("   {SY1}├──╼{W} Python: {SY1}shutil.rmtree('%s/src/util/__pycache__/' % pwd){W} ...")
-
-            if os.path.isdir("%s/src/util/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/util/__pycache__/" % pwd)
-
-                if Configuration.verbose == 3:
-                    Color.p(" {G}OK{W}\n")
-
-            else:
-                if Configuration.verbose == 3:
-                    Color.p(" {O}NOT FOUND{W}\n")
+        cache_folders = []
+        for root, dirs, files in os.walk("%s/src/" % pwd):
+            if "__pycache__" in dirs:
+                dirs.remove("__pycache__")
+                cache_folders.append(os.path.join(root, "__pycache__"))
 
+        for position, cache_folder in enumerate(cache_folders):
             if Configuration.verbose == 3:
-                Color.p("   {SY1}├──╼{W} Python: {SY1}shutil.rmtree('%s/src/tools/__pycache__/' % pwd){W} ...")
-
-            if os.path.isdir("%s/src/tools/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/tools/__pycache__/" % pwd)
-
-                if Configuration.verbose == 3:
-                    Color.p(" {G}OK{W}\n")
-
-            else:
-                if Configuration.verbose == 3:
-                    Color.p(" {O}NOT FOUND{W}\n")
-
-            if Configuration.verbose == 3:
-                Color.p(
-                    "   {SY1}├──╼{W} Python: {SY1}shutil.rmtree('%s/src/tools/packaging/__pycache__/' % pwd){W} ..."
+                Color.pl(
+                    "   {SY1}%s──╼{W} Python: {SY1}shutil.rmtree('%s'){W}"
+                    % ("╰" if position == len(cache_folders) - 1 else "├", cache_folder)
                 )
 
-            if os.path.isdir("%s/src/tools/packaging/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/tools/packaging/__pycache__/" % pwd)
-
-                if Configuration.verbose == 3:
-                    Color.p(" {G}OK{W}\n")
-
-            else:
-                if Configuration.verbose == 3:
-                    Color.p(" {O}NOT FOUND{W}\n")
-
-            if Configuration.verbose == 3:
-                Color.p("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree('%s/src/tools/colored/__pycache__/' % pwd){W} ...")
-
-            if os.path.isdir("%s/src/tools/colored/__pycache__/" % pwd):
-                shutil.rmtree("%s/src/tools/colored/__pycache__/" % pwd)
-
-                if Configuration.verbose == 3:
-                    Color.p(" {G}OK{W}\n")
+            shutil.rmtree(cache_folder)
 
-            else:
-                if Configuration.verbose == 3:
-                    Color.p(" {O}NOT FOUND{W}\n")
+        if Configuration.verbose >= 1:
+            Color.pl("  {&} %s python cache folder(s) removed." % len(cache_folders))
 
     except PermissionError as pe:
         Color.pexception(pe)
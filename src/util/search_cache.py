@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ search_cache.py            [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  A local cache of the search results of the console, with TTL and          #
+#  size-based eviction, stored compressed in the GitPy's cache folder.       #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import gzip
+import json
+import os
+import threading
+import time
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+
+
+# Main
+class Search_Cache:
+    """
+    A local cache of the pages of search results.
+
+    The pages are keyed by the normalized query and the 'user:' qualifier of the
+    search, so the same search typed twice is answered without calling the GitHub's
+    search API (limited to 30 requests per minute).
+
+    A page younger than 'ttl' is fresh and used as is. An older page is still used,
+    but the caller should revalidate it in the background. A page older than
+    'max_age' is dropped, and when the cache holds more than 'max_entries' pages the
+    least recently used ones are dropped.
+
+    The cache is stored as a gzip compressed JSON file and can be used by several
+    threads at the same time.
+    """
+
+    FILE_NAME = "search_cache.json.gz"
+
+    def __init__(self, path=None, ttl=None, max_age=None, max_entries=None):
+        """
+        Arguments:
+            path (str): The path of the cache file (default: 'search_cache.json.gz' in the GitPy's cache folder).
+            ttl (int): The time in seconds a page is fresh (default: Configuration.SEARCH_CACHE_TTL).
+            max_age (int): The time in seconds a page is kept (default: Configuration.SEARCH_CACHE_MAX_AGE).
+            max_entries (int): The maximum number of pages kept (default: Configuration.SEARCH_CACHE_MAX_ENTRIES).
+        """
+        if path is None:
+            path = Configuration.get_cache_path() + self.FILE_NAME
+
+        self.path = path
+        self.ttl = ttl or Configuration.SEARCH_CACHE_TTL
+        self.max_age = max_age or Configuration.SEARCH_CACHE_MAX_AGE
+        self.max_entries = max_entries or Configuration.SEARCH_CACHE_MAX_ENTRIES
+
+        self.entries = {}
+        self.dirty = False
+        self.lock = threading.RLock()
+
+        self.load()
+
+    @staticmethod
+    def make_key(query, username=None):
+        """
+        Returns the key of a search: the query in lower case with its words separated
+        by one space, and the 'user:' qualifier.
+        """
+        query = " ".join(query.lower().split())
+        username = (username or "").strip().lower()
+        return "%s user:%s" % (query, username) if username else query
+
+    def load(self):
+        """
+        Load the cache file, an unreadable or corrupted file gives an empty cache.
+        """
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as cache_file:
+                self.entries = json.load(cache_file)
+
+        except (OSError, EOFError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """
+        Write the cache file if it has been modified.
+        The file is replaced atomically, so a interrupted run never leaves a truncated cache.
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+
+            self.evict()
+
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                temp_path = "%s.%s.tmp" % (self.path, os.getpid())
+
+                with gzip.open(temp_path, "wt", encoding="utf-8") as cache_file:
+                    json.dump(self.entries, cache_file, separators=(",", ":"))
+
+                os.replace(temp_path, self.path)
+                self.dirty = False
+
+            except OSError as e:
+                if Configuration.verbose == 3:
+                    Color.pl("  {§} Cannot write the search cache file ({C}%s{W}): %s" % (self.path, e))
+
+    def evict(self):
+        """
+        Drop the expired pages, then the least recently used ones above 'max_entries'.
+        """
+        with self.lock:
+            now = time.time()
+
+            for key in [key for key, entry in self.entries.items() if now - entry["time"] > self.max_age]:
+                del self.entries[key]
+                self.dirty = True
+
+            if len(self.entries) > self.max_entries:
+                by_use = sorted(self.entries, key=lambda key: self.entries[key]["used"])
+                for key in by_use[: len(self.entries) - self.max_entries]:
+                    del self.entries[key]
+                self.dirty = True
+
+    def get(self, key):
+        """
+        Get a cached page.
+
+        Arguments:
+            key (str): The key of the page.
+
+        Returns:
+            tuple: (items, next_url, stale), or None if the page is not cached or expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            age = time.time() - entry["time"]
+            if age > self.max_age:
+                del self.entries[key]
+                self.dirty = True
+                return None
+
+            entry["used"] = time.time()
+            self.dirty = True
+
+            return (entry["items"], entry["next"], age > self.ttl)
+
+    def set(self, key, items, next_url):
+        """
+        Cache a page.
+
+        Arguments:
+            key (str): The key of the page.
+            items (list): The results of the page.
+            next_url (str): The URL of the next page, None for the last page.
+        """
+        with self.lock:
+            now = time.time()
+            self.entries[key] = {"time": now, "used": now, "items": items, "next": next_url}
+            self.dirty = True
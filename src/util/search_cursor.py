@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ search_cursor.py           [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  A lazy cursor on the pages of a GitHub's search, with a background        #
+#  prefetch of the next page and a bounded LRU of the fetched pages.         #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.github_api import GitHub_API
+from src.util.http_client import HTTP_Client
+
+
+# Main
+class Search_Cursor:
+    """
+    A lazy cursor on the pages of a search of the GitHub's API.
+
+    The pages are fetched only when they are asked, by following the 'Link: rel="next"'
+    header of the previous page. When a page has been shown, the next one can be
+    prefetched in the background while the user reads the current one. The fetched
+    pages are kept in a bounded LRU, so going back and forth between the pages
+    doesn't fetch them again.
+
+    With a Search_Cache, the pages are also read from (and written to) the local
+    cache of the searches. A stale page of the cache is shown at once and fetched
+    again in the background to update the cache.
+
+    Attributes:
+        per_page (int): The number of results per page.
+    """
+
+    def __init__(self, url, per_page=None, max_pages=None, fields=None, cache=None, cache_key=None):
+        """
+        Arguments:
+            url (str): The URL of the first page of the search.
+            per_page (int): The number of results per page (default: Configuration.SEARCH_PER_PAGE).
+            max_pages (int): The maximum number of pages kept in memory (default: Configuration.SEARCH_CACHED_PAGES).
+            fields (list): The fields kept for each result (default: all fields).
+            cache (Search_Cache): The local cache of the searches (default: no cache).
+            cache_key (str): The key of the search in the cache, see 'Search_Cache.make_key()'.
+        """
+        self.per_page = per_page or Configuration.SEARCH_PER_PAGE
+        self.max_pages = max_pages or Configuration.SEARCH_CACHED_PAGES
+        self.fields = fields
+        self.cache = cache
+        self.cache_key = cache_key
+
+        separator = "&" if "?" in url else "?"
+
+        # The URL of each known page, from the 'Link' header of the previous one
+        self.urls = {1: "%s%sper_page=%s" % (url, separator, self.per_page)}
+        # The last page of the search, known when a page without 'next' link has been fetched
+        self.last_page = None
+
+        self.pages = OrderedDict()
+        self.prefetching = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def page_key(self, number):
+        """
+        Returns the key of a page in the local cache of the searches.
+        The fields are part of the key, a page cached with less fields cannot be used.
+        """
+        fields = ",".join(self.fields) if self.fields is not None else "*"
+        return "%s|%s|%s|%s" % (self.cache_key, fields, self.per_page, number)
+
+    def has_page(self, number):
+        """
+        Returns True if the page exists, or may exist because its URL is known.
+        """
+        return number >= 1 and number in self.urls
+
+    def fetch(self, number, on_item=None):
+        """
+        Fetch a page from the GitHub's API.
+
+        Arguments:
+            number (int): The number of the page.
+            on_item (function): Called with each result, as soon as it is received.
+
+        Returns:
+            list: The results of the page.
+        """
+        url = self.urls[number]
+
+        if Configuration.verbose >= 3:
+            Color.pl("  {§}  Fetching the page %s of the search results..." % number)
+            Color.pl("   {SY1}╰──╼{W} URL: {C}%s{W}" % url)
+
+        response = HTTP_Client.get(url, stream=True)
+
+        # The 'Link' header is received before the body
+        next_link = response.links.get("next")
+
+        items = []
+        for item in GitHub_API.iter_search_items(response):
+            if self.fields is not None:
+                item = {field: item[field] for field in self.fields}
+
+            items.append(item)
+
+            if on_item is not None:
+                on_item(item)
+
+        with self.lock:
+            if next_link:
+                self.urls[number + 1] = next_link["url"]
+            else:
+                self.last_page = number
+
+            self.store(number, items)
+
+        if self.cache is not None:
+            self.cache.set(self.page_key(number), items, next_link["url"] if next_link else None)
+            self.cache.save()
+
+        return items
+
+    def load(self, number, on_item=None):
+        """
+        Returns the results of a page from the local cache of the searches, or from the GitHub's API.
+        A stale page of the cache is fetched again in the background.
+        """
+        cached = self.cache.get(self.page_key(number)) if self.cache is not None else None
+
+        if cached is None:
+            return self.fetch(number, on_item=on_item)
+
+        items, next_url, stale = cached
+
+        if Configuration.verbose >= 3:
+            Color.pl("  {§}  Page %s of the search results read from the cache%s." % (number, " (stale)" if stale else ""))
+
+        with self.lock:
+            if next_url:
+                self.urls[number + 1] = next_url
+            else:
+                self.last_page = number
+
+            self.store(number, items)
+
+            if stale and number not in self.prefetching:
+                self.prefetching[number] = self.executor.submit(self.fetch, number)
+
+        if on_item is not None:
+            for item in items:
+                on_item(item)
+
+        return items
+
+    def store(self, number, items):
+        """
+        Keep a page in the LRU, the least recently used page is dropped when it is full.
+        (Must be called with the lock held)
+        """
+        self.pages[number] = items
+        self.pages.move_to_end(number)
+
+        while len(self.pages) > self.max_pages:
+            self.pages.popitem(last=False)
+
+    def page(self, number, on_item=None):
+        """
+        Returns the results of a page, from the LRU if the page has already been fetched.
+
+        Arguments:
+            number (int): The number of the page.
+            on_item (function): Called with each result of the page.
+
+        Returns:
+            list: The results of the page.
+        """
+        with self.lock:
+            items = self.pages.get(number)
+            if items is not None:
+                self.pages.move_to_end(number)
+                future = None
+            else:
+                future = self.prefetching.pop(number, None)
+
+        if items is None and future is not None:
+            # The page is being prefetched, wait for it (an error is raised again by a new fetch)
+            try:
+                items = future.result()
+            except Exception:
+                items = None
+
+        if items is None:
+            return self.load(number, on_item=on_item)
+
+        if on_item is not None:
+            for item in items:
+                on_item(item)
+
+        return items
+
+    def prefetch(self, number):
+        """
+        Fetch a page in the background, if it is not already known.
+        """
+        with self.lock:
+            if number in self.pages or number in self.prefetching or number not in self.urls:
+                return
+
+            self.prefetching[number] = self.executor.submit(self.load, number)
+
+    def close(self):
+        """
+        Stop the background prefetch and write the local cache of the searches.
+        """
+        self.executor.shutdown(wait=False)
+
+        if self.cache is not None:
+            self.cache.save()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ staged_install.py          [Created: 2026-10-18 | 10:12 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
+# ---[Info]------------------------------------------------------------------#
+#  Install a new version of GitPy in a folder next to the install            #
+#  folder, then swap both folders by renaming them.                          #
+#  Language ~ Python3                                                        #
+# ---[Author]----------------------------------------------------------------#
+#  Thomas Pellissier (dedroot)                                               #
+# ---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                       #
+# ---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                           #
+#  -------------------------------                                           #
+#                                                                            #
+#  This program is free software; you can redistribute it and/or modify      #
+#  it under the terms of the GNU General Public License as published by      #
+#  the Free Software Foundation; either version 2 of the License, or         #
+#  (at your option) any later version.                                       #
+#                                                                            #
+#  This program is distributed in the hope that it will be useful,           #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of            #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              #
+#  GNU General Public License for more details.                              #
+#                                                                            #
+#  You should have received a copy of the GNU General Public License along   #
+#  with this program; if not, write to the Free Software Foundation, Inc.,   #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.               #
+# ---------------------------------------------------------------------------#
+
+# Imports section
+import os
+import shutil
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.process import Process
+
+
+# Main
+class Staged_Install:
+    """
+    A new version of GitPy is cloned in a staging folder next to the install folder (so on
+    the same filesystem), its rights are set, then the staging folder takes the place of
+    the install folder with two renames. No file is copied and the previous version is
+    kept until the end of the installation, to be put back if something fails.
+
+    The state of the user in the current install folder (see 'Configuration.STAGED_INSTALL_KEPT_PATHS')
+    is moved into the new version before the swap, and back if the previous version is put back.
+    """
+
+    def __init__(self, install_path):
+        """
+        Arguments:
+            install_path (str): The install folder of GitPy.
+        """
+        self.install_path = install_path.rstrip("/")
+        self.staging_path = self.install_path + Configuration.STAGED_INSTALL_STAGING_SUFFIX
+        self.previous_path = self.install_path + Configuration.STAGED_INSTALL_PREVIOUS_SUFFIX
+
+    @staticmethod
+    def remove(path):
+        """
+        Remove a folder, a file or a symbolic link if it exists.
+        """
+        if os.path.islink(path) or os.path.isfile(path):
+            os.remove(path)
+        elif os.path.isdir(path):
+            if Configuration.verbose == 3:
+                Color.pl("   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(%s){W}" % path)
+            shutil.rmtree(path)
+
+    def prepare(self):
+        """
+        Remove the staging folder left by an interrupted installation.
+
+        Returns:
+            str: The staging folder, with a trailing '/'.
+        """
+        self.remove(self.staging_path)
+        return self.staging_path + "/"
+
+    def clone(self, url, branch, verbose=False):
+        """
+        Clone a branch of a repository in the staging folder (see 'prepare()').
+
+        Arguments:
+            url (str): The cloning URL of the repository.
+            branch (str): The branch to clone.
+            verbose (bool): Run 'git clone' with '--verbose'.
+
+        Raises:
+            Exception: If 'git clone' fails, with the error of git.
+        """
+        staging_path = self.prepare()
+        os.makedirs(os.path.dirname(self.staging_path), exist_ok=True)
+
+        command = ["git", "clone"] + (["--verbose"] if verbose else []) + ["--branch", branch, url, staging_path]
+        clone = Process(command)
+        stderr = clone.stderr()
+
+        if clone.poll() != 0:
+            errors = [line for line in stderr.splitlines() if line.startswith("fatal:")]
+            raise Exception(
+                "git clone failed with the exit code %s%s"
+                % (clone.poll(), ": " + errors[0][len("fatal:") :].strip() if errors else "")
+            )
+
+    @staticmethod
+    def apply_rights(path, mode=None):
+        """
+        Set the rights of a folder and of all its content, without a 'chmod' process.
+
+        Arguments:
+            path (str): The folder.
+            mode (int): The rights (default: 'Configuration.INSTALL_FILES_MODE').
+        """
+        mode = Configuration.INSTALL_FILES_MODE if mode is None else mode
+
+        os.chmod(path, mode)
+        for root, dirs, files in os.walk(path):
+            for name in dirs + files:
+                file_path = os.path.join(root, name)
+                if not os.path.islink(file_path):
+                    os.chmod(file_path, mode)
+
+    @classmethod
+    def move_kept_paths(cls, source, destination):
+        """
+        Move the state of the user from an install folder to another one, the files of
+        the destination are replaced.
+
+        Arguments:
+            source (str): The install folder where the files are.
+            destination (str): The install folder where the files are moved.
+        """
+        for kept_path in Configuration.STAGED_INSTALL_KEPT_PATHS:
+            source_path = os.path.join(source, kept_path)
+            if not os.path.lexists(source_path):
+                continue
+
+            destination_path = os.path.join(destination, kept_path)
+            if Configuration.verbose == 3:
+                Color.pl("  {§} Keep {C}%s{W} in {C}%s{W}..." % (source_path, destination_path))
+
+            cls.remove(destination_path)
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+            os.rename(source_path, destination_path)
+
+    def swap(self):
+        """
+        Put the staging folder in place of the install folder.
+        The current install folder is kept as the previous version until 'commit()'.
+        """
+        if Configuration.verbose == 3:
+            Color.pl("  {§} Swap {C}%s{W} and {C}%s{W}..." % (self.staging_path, self.install_path))
+
+        self.remove(self.previous_path)
+
+        if os.path.lexists(self.install_path):
+            self.move_kept_paths(self.install_path, self.staging_path)
+            os.rename(self.install_path, self.previous_path)
+
+        try:
+            os.rename(self.staging_path, self.install_path)
+        except OSError:
+            # The previous version is put back before the error is raised
+            if os.path.lexists(self.previous_path):
+                os.rename(self.previous_path, self.install_path)
+                self.move_kept_paths(self.staging_path, self.install_path)
+            raise
+
+    def rollback(self):
+        """
+        Put back the previous version, if the swap was done.
+
+        Returns:
+            bool: True if the previous version is back in the install folder.
+        """
+        if not os.path.lexists(self.previous_path):
+            return False
+
+        if Configuration.verbose == 3:
+            Color.pl("  {§} Put back the previous version from {C}%s{W}..." % self.previous_path)
+
+        # The failed version is kept in the staging folder until the next installation
+        self.remove(self.staging_path)
+        if os.path.lexists(self.install_path):
+            os.rename(self.install_path, self.staging_path)
+
+        os.rename(self.previous_path, self.install_path)
+        self.move_kept_paths(self.staging_path, self.install_path)
+        return True
+
+    def commit(self):
+        """
+        Remove the previous version and the staging folder, once the installation succeeded.
+        """
+        self.remove(self.previous_path)
+        self.remove(self.staging_path)